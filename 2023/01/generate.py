@@ -0,0 +1,32 @@
+"""Trebuchet?! input generator"""
+import random
+import string
+
+
+SCALE = "line count"
+SIZES = (1_000, 2_000, 4_000, 8_000)
+
+
+WORDS = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+
+
+def generate_line(rng: random.Random) -> str:
+    chunks = [rng.choice(string.digits)]
+    for _ in range(rng.randint(1, 8)):
+        chunks.append(
+            rng.choice(
+                [
+                    rng.choice(string.digits),
+                    rng.choice(WORDS),
+                    "".join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 4))),
+                ]
+            )
+        )
+    rng.shuffle(chunks)
+    return "".join(chunks)
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """size calibration lines, each with at least one digit"""
+    rng = random.Random(seed)
+    return "\n".join(generate_line(rng) for _ in range(size))
@@ -1,42 +1,105 @@
 #!/usr/bin/env python3
 """Trebuchet?!"""
+import collections
+from typing import Iterable
 
+from aoc import mapped, stream
 
-def read_and_parse(filename: str) -> list[str]:
-    with open(filename, "r", encoding="utf-8") as file:
-        return file.read().splitlines()
 
+CHUNK_REDUCERS = {"part one": sum, "part two": sum}
 
-def recover_calibration_value(
-    text: str, words: list[str], values: dict[str, int]
-) -> int:
-    filtered_words = list(filter(text.__contains__, words))
-    first_word = min(filtered_words, key=text.index)
-    last_word = max(filtered_words, key=text.rindex)
-    return 10 * values[first_word] + values[last_word]
 
+def read_and_parse(filename: str) -> list[bytes]:
+    return mapped.read_lines(filename)
 
-def build_base_words_and_values() -> tuple[list[str], dict[str, int]]:
-    return list("0123456789"), dict(zip("0123456789", range(10)))
 
+def stream_and_parse(
+    filename: str, start: int = 0, end: int | None = None
+) -> Iterable[bytes]:
+    return stream.read_lines(filename, start, end)
 
-def recover_part_one(text: str) -> int:
-    digits, values = build_base_words_and_values()
-    return recover_calibration_value(text, digits, values)
 
+Automaton = collections.namedtuple("Automaton", ["table", "values"])
+Calibration = collections.namedtuple("Calibration", ["forward", "backward"])
 
-def recover_part_two(text: str) -> int:
-    digits, values = build_base_words_and_values()
-    words = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
-    values.update(dict(zip(words, range(1, 10))))
-    return recover_calibration_value(text, digits + words, values)
 
+def build_automaton(values: dict[bytes, int]) -> Automaton:
+    """Aho-Corasick automaton over bytes that stops at the first match
 
-def solve_part_one(lines: list[str]) -> int:
+    Transitions are one flat list indexed by state + byte with states
+    numbered in steps of 256, so a scan costs one lookup per byte. No word
+    contains another, so the first match to end is also the first to start.
+    """
+    trie, fail, found = [{}], [0], [-1]
+    for word, value in values.items():
+        node = 0
+        for byte in word:
+            if byte not in trie[node]:
+                trie[node][byte] = len(trie)
+                trie.append({})
+                fail.append(0)
+                found.append(-1)
+            node = trie[node][byte]
+        found[node] = value
+
+    automaton = Automaton([0] * (256 * len(trie)), [-1] * (256 * len(trie)))
+    table = automaton.table
+    queue = collections.deque([0])
+    while queue:
+        node = queue.popleft()
+        if found[node] < 0:
+            found[node] = found[fail[node]]
+        automaton.values[node << 8] = found[node]
+        for byte in range(256):
+            if (child := trie[node].get(byte)) is not None:
+                fail[child] = table[fail[node] << 8 | byte] >> 8 if node else 0
+                table[node << 8 | byte] = child << 8
+                queue.append(child)
+            else:
+                table[node << 8 | byte] = table[fail[node] << 8 | byte]
+    return automaton
+
+
+def find_first(automaton: Automaton, text: Iterable[int]) -> int:
+    table, values = automaton
+    state = 0
+    for byte in text:
+        state = table[state | byte]
+        if (value := values[state]) >= 0:
+            return value
+    raise ValueError("no calibration value")
+
+
+def build_calibration(values: dict[bytes, int]) -> Calibration:
+    """automata for the first match and, over reversed words and text, the last"""
+    backward = {word[::-1]: value for word, value in values.items()}
+    return Calibration(build_automaton(values), build_automaton(backward))
+
+
+def recover(calibration: Calibration, text: bytes) -> int:
+    forward, backward = calibration
+    return 10 * find_first(forward, text) + find_first(backward, text[::-1])
+
+
+__DIGITS = {bytes([digit]): digit - ord("0") for digit in b"0123456789"}
+__WORDS = b"one two three four five six seven eight nine".split()
+__PART_ONE = build_calibration(__DIGITS)
+__PART_TWO = build_calibration(__DIGITS | dict(zip(__WORDS, range(1, 10))))
+
+
+def recover_part_one(text: bytes) -> int:
+    return recover(__PART_ONE, text)
+
+
+def recover_part_two(text: bytes) -> int:
+    return recover(__PART_TWO, text)
+
+
+def solve_part_one(lines: Iterable[bytes]) -> int:
     return sum(map(recover_part_one, lines))
 
 
-def solve_part_two(lines: list[str]) -> int:
+def solve_part_two(lines: Iterable[bytes]) -> int:
     return sum(map(recover_part_two, lines))
 
 
@@ -48,6 +111,7 @@ def test():
     lines = read_and_parse("example-2.txt")
     part_two_answer = solve_part_two(lines)
     assert part_two_answer == 281
+    assert solve_part_two(stream_and_parse("example-2.txt")) == 281
 
 
 def main():
@@ -0,0 +1,21 @@
+"""Cube Conundrum input generator"""
+import random
+
+
+SCALE = "line count"
+SIZES = (1_000, 2_000, 4_000, 8_000)
+
+
+def generate_round(rng: random.Random) -> str:
+    colors = rng.sample(["red", "green", "blue"], rng.randint(1, 3))
+    return ", ".join(f"{rng.randint(1, 20)} {color}" for color in colors)
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """size games of one to six rounds"""
+    rng = random.Random(seed)
+    return "\n".join(
+        f"Game {game_id}: "
+        + "; ".join(generate_round(rng) for _ in range(rng.randint(1, 6)))
+        for game_id in range(1, size + 1)
+    )
@@ -1,64 +1,108 @@
 #!/usr/bin/env python3
 """Cube Conundrum"""
+import array
 import collections
-import functools
-import math
+import itertools
 import operator
+from typing import Iterable, Iterator
 
+from aoc import mapped, stream
 
-Draw = tuple[str, int]
-Round = dict[str, int]
-Game = list[Round]
 
+Bag = collections.namedtuple("Bag", ["id", "red", "green", "blue"])
 
-def parse_draw(text: str) -> Draw:
-    raw_balls, color = text.split()
-    return color, int(raw_balls)
 
+CHUNK_REDUCERS = {"part one": sum, "part two": sum}
 
-def parse_round(text: str) -> Round:
-    return dict(map(parse_draw, text.split(", ")))
+__COLUMNS = {ord("r"): 0, ord("g"): 1, ord("b"): 2}
+__FIELDS = {"red": 0, "green": 1, "blue": 2}
 
 
-def parse_game(text: str) -> Game:
-    return list(map(parse_round, text.split(": ")[1].split("; ")))
+class Bags:
+    """game ids and the minimal bag of every game as red, green and blue
+    columns of one flat array"""
 
+    def __init__(self, ids: array.array, maxima: array.array):
+        self.ids, self.maxima = ids, maxima
 
-def read_and_parse(filename: str) -> list[Game]:
-    with open(filename, "r", encoding="utf-8") as file:
-        return list(map(parse_game, file.read().splitlines()))
+    def __len__(self) -> int:
+        return len(self.ids)
 
+    def __iter__(self) -> Iterator[Bag]:
+        maxima = self.maxima
+        return map(Bag, self.ids, maxima[0::3], maxima[1::3], maxima[2::3])
 
-def compute_minimal_bag(game: Game) -> collections.Counter[str]:
-    return functools.reduce(operator.or_, map(collections.Counter, game))
 
+def find_columns(bags: Bags | Iterable[Bag], *fields: str) -> list[Iterable[int]]:
+    """the named columns, sliced out of the flat maxima of parsed bags or
+    teed in lockstep off streamed ones"""
+    if isinstance(bags, Bags):
+        return [
+            bags.ids if field == "id" else bags.maxima[__FIELDS[field] :: 3]
+            for field in fields
+        ]
+    copies = itertools.tee(bags, len(fields))
+    return [map(operator.attrgetter(field), bag) for field, bag in zip(fields, copies)]
 
-def solve_part_one(games: list[Game]) -> int:
-    upper_bound = collections.Counter({"red": 12, "green": 13, "blue": 14})
-    return sum(
-        game_id
-        for game_id, game in enumerate(games, start=1)
-        if compute_minimal_bag(game) <= upper_bound
+
+def parse_bag(text: bytes) -> Bag:
+    """the most cubes of each colour shown in any round, in a single pass
+    over words like b"Game", b"1:", b"3", b"blue,", b"4", b"red;" """
+    words = text.split()
+    bag = [0, 0, 0]
+    for raw_balls, color in zip(words[2::2], words[3::2]):
+        column = __COLUMNS[color[0]]
+        if (balls := int(raw_balls)) > bag[column]:
+            bag[column] = balls
+    return Bag(int(words[1][:-1]), *bag)
+
+
+def read_and_parse(filename: str) -> Bags:
+    ids, maxima = array.array("q"), array.array("q")
+    for game_id, *bag in map(parse_bag, mapped.read_lines(filename)):
+        ids.append(game_id)
+        maxima.extend(bag)
+    return Bags(ids, maxima)
+
+
+def stream_and_parse(
+    filename: str, start: int = 0, end: int | None = None
+) -> Iterable[Bag]:
+    return map(parse_bag, stream.read_lines(filename, start, end))
+
+
+def solve_part_one(bags: Bags | Iterable[Bag]) -> int:
+    ids, *columns = find_columns(bags, "id", "red", "green", "blue")
+    reds, greens, blues = (
+        map(operator.le, column, itertools.repeat(limit))
+        for column, limit in zip(columns, (12, 13, 14))
     )
+    possible = map(operator.and_, map(operator.and_, reds, greens), blues)
+    return sum(itertools.compress(ids, possible))
 
 
-def solve_part_two(games: list[Game]) -> int:
-    return sum(math.prod(compute_minimal_bag(game).values()) for game in games)
+def solve_part_two(bags: Bags | Iterable[Bag]) -> int:
+    """a colour never shown leaves the power unchanged, it is not a factor"""
+    columns = find_columns(bags, "red", "green", "blue")
+    reds, greens, blues = (map(max, column, itertools.repeat(1)) for column in columns)
+    return sum(map(operator.mul, map(operator.mul, reds, greens), blues))
 
 
 def test():
-    games = read_and_parse("example.txt")
-    part_one_answer = solve_part_one(games)
+    bags = read_and_parse("example.txt")
+    part_one_answer = solve_part_one(bags)
     assert part_one_answer == 8
-    part_two_answer = solve_part_two(games)
+    part_two_answer = solve_part_two(bags)
     assert part_two_answer == 2_286
+    assert solve_part_one(stream_and_parse("example.txt")) == 8
+    assert solve_part_two(stream_and_parse("example.txt")) == 2_286
 
 
 def main():
-    games = read_and_parse("input.txt")
-    part_one_answer = solve_part_one(games)
+    bags = read_and_parse("input.txt")
+    part_one_answer = solve_part_one(bags)
     print(f"Part One: {part_one_answer}")
-    part_two_answer = solve_part_two(games)
+    part_two_answer = solve_part_two(bags)
     print(f"Part Two: {part_two_answer}")
 
 
@@ -0,0 +1,30 @@
+"""Gear Ratios input generator"""
+import random
+
+
+SCALE = "grid side"
+SIZES = (35, 70, 140, 280)
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """a size x size schematic of separated numbers and symbols"""
+    rng = random.Random(seed)
+    grid = [["."] * size for _ in range(size)]
+
+    for row in grid:
+        col = 0
+        while col < size:
+            length = rng.randint(1, 3)
+            if rng.random() < 0.15 and col + length <= size:
+                number = rng.randint(10 ** (length - 1), 10**length - 1)
+                row[col : col + length] = str(number)
+                col += length + 1
+            else:
+                col += 1
+
+    for row in grid:
+        for col in range(size):
+            if row[col] == "." and rng.random() < 0.05:
+                row[col] = rng.choice("#$%&*+-/=@**")
+
+    return "\n".join(map("".join, grid))
@@ -1,74 +1,142 @@
 #!/usr/bin/env python3
 """Gear Ratios"""
+import collections
 import math
 import re
 from typing import Iterable
 
+from aoc import mapped, stream
+from aoc.grid import Grid
 
-Cell = tuple[int, int]
-Segment = tuple[int, int, int]
 
+Segment = tuple[int, int]
 
-def read_and_parse(filename: str) -> list[str]:
-    with open(filename, "r", encoding="utf-8") as file:
-        return file.read().splitlines()
+Window = collections.namedtuple("Window", ["cells", "stride", "start", "end", "origin"])
 
+__NUMBER = re.compile(rb"\d+")
 
-def find_symbols_in_grid(
-    grid: list[str], symbols: str = "#$%&*+-/=@"
-) -> Iterable[Cell]:
-    return (
-        (i, j)
-        for i, row in enumerate(grid)
-        for j, char in enumerate(row)
-        if char in symbols
-    )
 
+def build_mask(chars: bytes) -> bytes:
+    """a translate table mapping chars to 1 and every other byte to 0"""
+    return bytes(char in chars for char in range(256))
 
-def find_numbers_in_grid(grid: list[str]) -> Iterable[Segment]:
-    return (
-        (i, n.start(), n.end())
-        for i, row in enumerate(grid)
-        for n in re.finditer(r"\d+", row)
-    )
+
+__SYMBOLS = build_mask(b"#$%&*+-/=@")
+__GEARS = build_mask(b"*")
 
 
-def find_adjacent_pairs(grid: list[str]) -> dict[Cell, list[int]]:
-    pairs = {symbol: [] for symbol in find_symbols_in_grid(grid)}
+def read_and_parse(filename: str) -> Grid:
+    with mapped.open_text(filename) as text:
+        return Grid(text, border=".")
 
-    for row, start, end in find_numbers_in_grid(grid):
-        edge = {
-            (row, col)
-            for row in (row - 1, row, row + 1)
-            for col in range(start - 1, end + 1)
-        }
 
-        for symbol in edge & pairs.keys():
-            pairs[symbol].append(int(grid[row][start:end]))
+def stream_and_parse(filename: str) -> Iterable[Window]:
+    """a window of three padded rows per row of the schematic, only the
+    rows of the current window are kept"""
+    rows, stride, origin = collections.deque(), None, 0
+    for line in filter(None, stream.read_lines(filename)):
+        if stride is None:
+            stride = len(line) + 2
+            rows.append(b"." * stride)
+        rows.append(b"." + line + b".")
+        if len(rows) == 3:
+            yield Window(b"".join(rows), stride, stride, 2 * stride, origin)
+            rows.popleft()
+            origin += stride
+    if stride is not None:
+        rows.append(b"." * stride)
+        yield Window(b"".join(rows), stride, stride, 2 * stride, origin)
 
-    return pairs
 
+def find_windows(engine_schematic: Grid | Iterable[Window]) -> Iterable[Window]:
+    """a whole grid is a single window with every row in the middle"""
+    if not isinstance(engine_schematic, Grid):
+        return engine_schematic
+    cells, stride = engine_schematic.cells, engine_schematic.stride
+    return [Window(cells, stride, stride, len(cells) - stride, 0)]
 
-def solve_part_one(engine_schematic: list[str]) -> int:
-    pairs = find_adjacent_pairs(engine_schematic)
-    return sum(map(sum, pairs.values()))
 
+def find_numbers_in_window(window: Window) -> Iterable[Segment]:
+    numbers = __NUMBER.finditer(window.cells, window.start, window.end)
+    return (number.span() for number in numbers)
 
-def solve_part_two(engine_schematic: list[str]) -> int:
-    pairs = find_adjacent_pairs(engine_schematic)
-    return sum(
-        math.prod(nums)
-        for (row, col), nums in pairs.items()
-        if engine_schematic[row][col] == "*" and len(nums) == 2
+
+def find_neighborhood(stride: int, start: int, end: int) -> tuple[Segment, ...]:
+    """the 3 x (width + 2) stencil around cells start to end - 1, row by row"""
+    return (
+        (start - stride - 1, end - stride + 1),
+        (start - 1, end + 1),
+        (start + stride - 1, end + stride + 1),
     )
 
 
+def solve_part_one(engine_schematic: Grid | Iterable[Window]) -> int:
+    """a number counts once per adjacent symbol, its stencil is counted on a
+    0/1 mask of the window, two row slices and the two ends"""
+    total = 0
+    for window in find_windows(engine_schematic):
+        symbols = window.cells.translate(__SYMBOLS)
+        above, below = -window.stride - 1, window.stride - 1
+        for start, end in find_numbers_in_window(window):
+            adjacent = (
+                symbols.count(1, start + above, end + above + 2)
+                + symbols[start - 1]
+                + symbols[end]
+                + symbols.count(1, start + below, end + below + 2)
+            )
+            if adjacent:
+                total += adjacent * int(window.cells[start:end])
+    return total
+
+
+def dilate(mask: bytes, stride: int) -> bytes:
+    """the 3 x 3 stencil of a 0/1 mask, one big integer with a byte per cell
+    is shifted a cell and a row each way, ORing never carries into a lane"""
+    lanes = int.from_bytes(mask, "little")
+    lanes |= lanes << 8 | lanes >> 8
+    lanes |= lanes << 8 * stride | lanes >> 8 * stride
+    return lanes.to_bytes(len(mask) + stride + 1, "little")[: len(mask)]
+
+
+def find_gear_numbers(windows: Iterable[Window]) -> Iterable[list[int]]:
+    """numbers next to every gear, yielded as soon as the window has moved
+    past the row below the gear, the dilated mask rules out the other
+    numbers before their neighborhood is searched"""
+    pending = collections.defaultdict(list)
+    for window in windows:
+        gears = window.cells.translate(__GEARS)
+        near_gears = dilate(gears, window.stride)
+        for start, end in find_numbers_in_window(window):
+            if near_gears.find(1, start, end) == -1:
+                continue
+            number = int(window.cells[start:end])
+            for low, high in find_neighborhood(window.stride, start, end):
+                gear = gears.find(1, low, high)
+                while gear != -1:
+                    pending[window.origin + gear].append(number)
+                    gear = gears.find(1, gear + 1, high)
+        done = [gear for gear in pending if gear < window.origin + window.start]
+        for gear in done:
+            yield pending.pop(gear)
+    yield from pending.values()
+
+
+def solve_part_two(engine_schematic: Grid | Iterable[Window]) -> int:
+    numbers = find_gear_numbers(find_windows(engine_schematic))
+    return sum(math.prod(nums) for nums in numbers if len(nums) == 2)
+
+
 def test():
     engine_schematic = read_and_parse("example.txt")
     part_one_answer = solve_part_one(engine_schematic)
     assert part_one_answer == 4_361
     part_two_answer = solve_part_two(engine_schematic)
     assert part_two_answer == 467_835
+    assert solve_part_one(stream_and_parse("example.txt")) == part_one_answer
+    assert solve_part_two(stream_and_parse("example.txt")) == part_two_answer
+
+    mask = bytes([0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0])
+    assert dilate(mask, 4) == bytes([1, 1, 1, 0, 1, 1, 1, 0, 1, 1, 1, 0, 0, 0, 0, 0])
 
 
 def main():
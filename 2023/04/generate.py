@@ -0,0 +1,29 @@
+"""Scratchcards input generator"""
+import random
+
+
+SCALE = "line count"
+SIZES = (1_000, 2_000, 4_000, 8_000)
+
+
+def format_numbers(numbers: list[int]) -> str:
+    return " ".join(f"{number:2d}" for number in numbers)
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """size cards whose copies never run past the end of the table"""
+    rng = random.Random(seed)
+    lines = []
+
+    for card_id in range(1, size + 1):
+        matches = min(rng.choice([0, 0, 1, 2, 3, 5, 10]), size - card_id)
+        winning = rng.sample(range(1, 100), 10)
+        others = rng.sample(sorted(set(range(1, 100)) - set(winning)), 25 - matches)
+        numbers = rng.sample(winning, matches) + others
+        rng.shuffle(numbers)
+        lines.append(
+            f"Card {card_id:{len(str(size))}d}: "
+            f"{format_numbers(winning)} | {format_numbers(numbers)}"
+        )
+
+    return "\n".join(lines)
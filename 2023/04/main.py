@@ -1,6 +1,10 @@
 #!/usr/bin/env python3
 """Scratchcards"""
 import collections
+import itertools
+from typing import Iterable
+
+from aoc import mapped, stream
 
 
 Scratchcard = collections.namedtuple(
@@ -8,24 +12,41 @@ Scratchcard = collections.namedtuple(
 )
 
 
-def parse_numbers(text: str) -> set[int]:
+CHUNK_REDUCERS = {"part one": sum}
+
+
+def parse_numbers(text: bytes) -> set[int]:
     return set(map(int, text.split()))
 
 
-def parse_scratchcard(text: str) -> Scratchcard:
-    return Scratchcard(*map(parse_numbers, text.split(": ")[1].split(" | ")))
+def parse_scratchcard(text: bytes) -> Scratchcard:
+    return Scratchcard(*map(parse_numbers, text.split(b": ")[1].split(b" | ")))
 
 
 def read_and_parse(filename: str) -> list[Scratchcard]:
-    with open(filename, "r", encoding="utf-8") as file:
-        return list(map(parse_scratchcard, file.read().splitlines()))
+    """every card has as many winning numbers as the first one"""
+    values, offsets = mapped.read_ints(filename)
+    with mapped.open_text(filename) as text:
+        split = len(mapped.extract_ints(text[: text.find(b"|")])[0])
+    return [
+        Scratchcard(
+            set(values[start + 1 : start + split]), set(values[start + split : end])
+        )
+        for start, end in itertools.pairwise(offsets)
+    ]
+
+
+def stream_and_parse(
+    filename: str, start: int = 0, end: int | None = None
+) -> Iterable[Scratchcard]:
+    return map(parse_scratchcard, stream.read_lines(filename, start, end))
 
 
 def count_matches(scratchcard: Scratchcard) -> int:
     return len(scratchcard.winning_numbers & scratchcard.numbers_you_have)
 
 
-def solve_part_one(scratchcards: list[Scratchcard]) -> int:
+def solve_part_one(scratchcards: Iterable[Scratchcard]) -> int:
     return sum(
         1 << (matches - 1)
         for scratchcard in scratchcards
@@ -33,12 +54,27 @@ def solve_part_one(scratchcards: list[Scratchcard]) -> int:
     )
 
 
-def solve_part_two(scratchcards: list[Scratchcard]) -> int:
-    copies = [1] * len(scratchcards)
-    for i, scratchcard in enumerate(scratchcards):
-        for j in range(count_matches(scratchcard)):
-            copies[i + 1 + j] += copies[i]
-    return sum(copies)
+def solve_part_two(scratchcards: Iterable[Scratchcard]) -> int:
+    """the copies won for the next few cards are a range addition, kept as
+    two entries in a ring of running differences one longer than the most
+    matches so far, so a card costs the same however many it wins"""
+    total = extra = slot = 0
+    differences = [0]
+    for scratchcard in scratchcards:
+        extra += differences[slot]
+        differences[slot] = 0
+        copies = 1 + extra
+        total += copies
+        matches = count_matches(scratchcard)
+        if matches >= len(differences):
+            grown = [0] * (matches + 1 - len(differences))
+            differences = differences[slot:] + differences[:slot] + grown
+            slot = 0
+        size = len(differences)
+        differences[(slot + 1) % size] += copies
+        differences[(slot + matches + 1) % size] -= copies
+        slot = (slot + 1) % size
+    return total
 
 
 def test():
@@ -47,6 +83,10 @@ def test():
     assert part_one_answer == 13
     part_two_answer = solve_part_two(scratchcards)
     assert part_two_answer == 30
+    assert solve_part_two(stream_and_parse("example.txt")) == 30
+
+    cards = [Scratchcard({1, 2, 3}, set(range(1, 1 + m))) for m in (1, 3, 0, 0, 0)]
+    assert solve_part_two(iter(cards)) == 1 + 2 + 3 + 3 + 3
 
 
 def main():
@@ -0,0 +1,45 @@
+"""If You Give A Seed A Fertilizer input generator"""
+import random
+
+
+SCALE = "ranges per map"
+SIZES = (25, 50, 100, 200)
+
+
+CATEGORIES = [
+    "seed",
+    "soil",
+    "fertilizer",
+    "water",
+    "light",
+    "temperature",
+    "humidity",
+    "location",
+]
+
+
+def generate_mapping(rng: random.Random, size: int, limit: int) -> list[str]:
+    """size disjoint source ranges covering parts of [0, limit)"""
+    cuts = sorted(rng.sample(range(1, limit), 2 * size))
+    return [
+        f"{rng.randrange(limit - (end - start))} {start} {end - start}"
+        for start, end in zip(cuts[::2], cuts[1::2])
+    ]
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """size ranges per mapping and ten seed ranges"""
+    rng = random.Random(seed)
+    limit = 2**32
+
+    seeds = []
+    for _ in range(10):
+        start = rng.randrange(limit // 2)
+        seeds.extend([start, rng.randrange(1, limit // 20)])
+
+    chunks = ["seeds: " + " ".join(map(str, seeds))]
+    for source, destination in zip(CATEGORIES, CATEGORIES[1:]):
+        lines = generate_mapping(rng, size, limit)
+        chunks.append("\n".join([f"{source}-to-{destination} map:", *lines]))
+
+    return "\n\n".join(chunks)
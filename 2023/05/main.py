@@ -1,9 +1,11 @@
 #!/usr/bin/env python3
 """If You Give A Seed A Fertilizer"""
-import collections
 import itertools
 from typing import Iterable, Optional
 
+from aoc import intervals, mapped
+from aoc.intervals import Interval
+
 
 def batched(iterable, n):
     # batched('ABCDEFG', 3) --> ABC DEF G
@@ -14,35 +16,22 @@ def batched(iterable, n):
         yield batch
 
 
-ValueRange = collections.namedtuple("ValueRange", ["start", "length"])
-
-
 class MappingRange:
     """a linear mapping on a range"""
 
     def __init__(self, destination: int, source: int, length: int):
-        self.destination, self.length = destination, length
-        self.source_start = source
-        self.source_end = source + length
+        self.source = source, source + length
+        self.offset = destination - source
 
     def apply_to_point(self, value: int) -> Optional[int]:
-        if self.source_start <= value < self.source_end:
-            return self.destination + value - self.source_start
+        if self.source[0] <= value < self.source[1]:
+            return value + self.offset
         return None
 
-    def apply_to_range(
-        self, value_range: ValueRange
-    ) -> Optional[tuple[ValueRange, ValueRange]]:
+    def apply_to_range(self, values: Interval) -> Optional[tuple[Interval, Interval]]:
         """returns consumed range and its image if any"""
-        start = max(self.source_start, value_range.start)
-        end = min(self.source_end, value_range.start + value_range.length)
-
-        if (length := end - start) > 0:
-            consumed_range = ValueRange(start, length)
-            offset = start - self.source_start
-            image = ValueRange(self.destination + offset, length)
-            return consumed_range, image
-
+        if (consumed := intervals.intersect(self.source, values)) is not None:
+            return consumed, intervals.shift(consumed, self.offset)
         return None
 
 
@@ -58,37 +47,29 @@ class PiecewiseLinearMapping:
                 return maybe
         return value
 
-    def apply_to_range(self, values: ValueRange) -> Iterable[ValueRange]:
-        consumed_ranges = []
+    def apply_to_range(self, values: Interval) -> Iterable[Interval]:
+        unmapped = [values]
         for mapping_range in self.ranges:
             if (maybe := mapping_range.apply_to_range(values)) is not None:
-                consumed_range, image = maybe
-                consumed_ranges.append(consumed_range)
+                consumed, image = maybe
+                unmapped = [
+                    piece
+                    for rest in unmapped
+                    for piece in intervals.subtract(rest, consumed)
+                ]
                 yield image
-
-        start = values.start
-        for consumed_start, consumed_length in sorted(consumed_ranges):
-            if start < consumed_start:
-                yield ValueRange(start, consumed_start - start)
-            start = consumed_start + consumed_length
-
-        if start < (values_end := values.start + values.length):
-            yield ValueRange(start, values_end - start)
-
-
-def parse_mapping(map_raw: str) -> PiecewiseLinearMapping:
-    return PiecewiseLinearMapping(
-        MappingRange(*map(int, range_raw.split()))
-        for range_raw in map_raw.split("\n")[1:]
-    )
+        yield from unmapped
 
 
 def read_and_parse(filename: str) -> tuple[list[int], list[PiecewiseLinearMapping]]:
-    with open(filename, "r", encoding="utf-8") as file:
-        raw_seeds, *raw_mappings = file.read().split("\n\n")
-        seeds = list(map(int, raw_seeds.split(":")[1].split()))
-        mappings = list(map(parse_mapping, raw_mappings))
-        return seeds, mappings
+    """headers and blank lines hold no numbers and separate the mappings"""
+    seeds, *rows = mapped.split_rows(*mapped.read_ints(filename))
+    mappings = [
+        PiecewiseLinearMapping(MappingRange(*row) for row in group)
+        for nonempty, group in itertools.groupby(rows, key=bool)
+        if nonempty
+    ]
+    return seeds.tolist(), mappings
 
 
 def solve_part_one(values: list[int], mappings: list[PiecewiseLinearMapping]) -> int:
@@ -98,12 +79,14 @@ def solve_part_one(values: list[int], mappings: list[PiecewiseLinearMapping]) ->
 
 
 def solve_part_two(seeds: list[int], mappings: list[PiecewiseLinearMapping]) -> int:
-    ranges = list(itertools.starmap(ValueRange, batched(seeds, 2)))
+    """images of neighboring pieces often touch, merging them keeps the
+    number of ranges from multiplying with every mapping"""
+    ranges = [(start, start + length) for start, length in batched(seeds, 2)]
     for mapping in mappings:
-        ranges = list(
+        ranges = intervals.coalesce(
             itertools.chain.from_iterable(map(mapping.apply_to_range, ranges))
         )
-    return min(range_.start for range_ in ranges)
+    return ranges[0][0]
 
 
 def test():
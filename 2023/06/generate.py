@@ -0,0 +1,27 @@
+"""Wait For It input generator"""
+import random
+
+
+SCALE = "race time"
+SIZES = (2_000, 4_000, 8_000, 16_000)
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """races lasting up to size milliseconds, all of them winnable"""
+    rng = random.Random(seed)
+    races = max(1, min(4, 18 // len(str(size))))
+
+    times, dists = [], []
+    for _ in range(races):
+        time = rng.randint(max(2, size // 2), max(2, size))
+        hold = rng.randrange(1, time)
+        times.append(time)
+        dists.append(hold * (time - hold) - 1)
+
+    width = max(len(str(value)) for value in times + dists) + 2
+    return "\n".join(
+        [
+            "Time:    " + "".join(f"{time:{width}d}" for time in times),
+            "Distance:" + "".join(f"{dist:{width}d}" for dist in dists),
+        ]
+    )
@@ -2,30 +2,27 @@
 """Wait For It"""
 import bisect
 import math
+from typing import Sequence
 
+from aoc import mapped
 
-def parse_nums(text: str) -> list[int]:
-    return list(map(int, text.split()))
 
+def read_and_parse(filename: str) -> tuple[Sequence[int], ...]:
+    return tuple(mapped.split_rows(*mapped.read_ints(filename)))
 
-def read_and_parse(filename: str) -> tuple[list[int], ...]:
-    with open(filename, "r", encoding="utf-8") as file:
-        lines = (line.split(":")[1] for line in file.read().splitlines())
-        return tuple(map(parse_nums, lines))
 
-
-def solve_part_one(times: list[int], dists: list[int]) -> int:
+def solve_part_one(times: Sequence[int], dists: Sequence[int]) -> int:
     return math.prod(
         sum((time - hold) * hold > dist for hold in range(1, time))
         for time, dist in zip(times, dists)
     )
 
 
-def fix_kerning(nums: list[int]) -> int:
+def fix_kerning(nums: Sequence[int]) -> int:
     return int("".join(map(str, nums)))
 
 
-def solve_part_two(times: list[int], dists: list[int]) -> int:
+def solve_part_two(times: Sequence[int], dists: Sequence[int]) -> int:
     time, dist = map(fix_kerning, (times, dists))
     upper_bound = bisect.bisect_right(
         range(time // 2 + 1),
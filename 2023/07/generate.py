@@ -0,0 +1,15 @@
+"""Camel cards input generator"""
+import random
+
+
+SCALE = "line count"
+SIZES = (1_000, 2_000, 4_000, 8_000)
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """size hands with their bids"""
+    rng = random.Random(seed)
+    return "\n".join(
+        f"{''.join(rng.choices('AKQJT98765432', k=5))} {rng.randint(1, 1_000)}"
+        for _ in range(size)
+    )
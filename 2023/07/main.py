@@ -1,49 +1,117 @@
 #!/usr/bin/env python3
 """Camel cards"""
+import array
 import collections
+import os
+import tempfile
+from typing import Callable, Iterable, Iterator
+
+from aoc import mapped, stream
 
 
 Game = collections.namedtuple("Game", ["hand", "bid"])
+Tally = tuple[int, int, int]
+
+
+class Games:
+    """hands back to back in one bytes object and bids in a typed array
+
+    Iterating yields Game records one at a time, so the solvers consume
+    the columns and the stream of the streaming mode alike.
+    """
+
+    def __init__(self, hands: bytes, bids: array.array):
+        self.hands, self.bids = hands, bids
+        self.size = len(hands) // len(bids) if bids else 0
+
+    def __len__(self) -> int:
+        return len(self.bids)
+
+    def __iter__(self) -> Iterator[Game]:
+        size = self.size
+        starts = range(0, len(self.hands), size or 1)
+        hands = (self.hands[start : start + size] for start in starts)
+        return map(Game, hands, self.bids)
 
 
-def parse_game(text: str) -> Game:
+def parse_game(text: bytes) -> Game:
     hand, bid = text.split()
     return Game(hand, int(bid))
 
 
-def read_and_parse(filename: str) -> list[Game]:
-    with open(filename, "r", encoding="utf-8") as file:
-        return list(map(parse_game, file.read().splitlines()))
+def read_and_parse(filename: str) -> Games:
+    """raises ValueError unless every line is a hand of the same length and
+    a bid"""
+    hands, bids, lengths = bytearray(), array.array("q"), set()
+    with mapped.open_text(filename) as text:
+        for chunk in mapped.split_windows(text):
+            words = chunk.split()
+            lengths.update(map(len, words[::2]))
+            hands += b"".join(words[::2])
+            bids.extend(map(int, words[1::2]))
+    if len(lengths) > 1:
+        raise ValueError(f"{filename}: hands of lengths {sorted(lengths)}")
+    if len(hands) != sum(lengths) * len(bids):
+        raise ValueError(f"{filename}: not every hand has a bid")
+    return Games(bytes(hands), bids)
 
 
-def default_key(hand: str) -> list[int]:
+def stream_and_parse(
+    filename: str, start: int = 0, end: int | None = None
+) -> Iterable[Game]:
+    return map(parse_game, stream.read_lines(filename, start, end))
+
+
+__DEFAULT_VALUES = {card: -value for value, card in enumerate(b"AKQJT98765432")}
+__JOKERS_VALUES = {card: -value for value, card in enumerate(b"AKQT98765432J")}
+
+
+def default_key(hand: bytes) -> list[int]:
     hand_type = sorted(collections.Counter(hand).values(), reverse=True)
-    hand_value = [-"AKQJT98765432".index(card) for card in hand]
+    hand_value = list(map(__DEFAULT_VALUES.__getitem__, hand))
     return hand_type + hand_value
 
 
-def jokers_key(hand: str) -> list[int]:
+def jokers_key(hand: bytes) -> list[int]:
     counter = collections.Counter(hand)
-    jokers = counter["J"]
-    del counter["J"]
+    jokers = counter.pop(ord("J"), 0)
 
-    hand_value = [-"AKQT98765432J".index(card) for card in hand]
+    hand_value = list(map(__JOKERS_VALUES.__getitem__, hand))
     hand_type = sorted(counter.values(), reverse=True) or [0]
     hand_type[0] += jokers
 
     return hand_type + hand_value
 
 
-def score(games: list[Game]) -> int:
-    return sum(rank * bid for rank, (_, bid) in enumerate(games, start=1))
+def tally(games: Iterable[Game]) -> dict[bytes, Tally]:
+    """count, total bid and tie weight per distinct hand
+
+    Equal hands keep their input order, so the i-th copy of a hand adds
+    i * bid on top of the rank of the first copy times the total bid.
+    """
+    tallies = {}
+    for hand, bid in games:
+        count, total, weight = tallies.get(hand, (0, 0, 0))
+        tallies[hand] = count + 1, total + bid, weight + count * bid
+    return tallies
+
+
+def score(games: Iterable[Game], key: Callable[[bytes], list[int]]) -> int:
+    tallies = tally(games)
+    winnings, rank = 0, 1
+    for hand in sorted(tallies, key=key):
+        count, total, weight = tallies[hand]
+        winnings += rank * total + weight
+        rank += count
+    return winnings
 
 
-def solve_part_one(games: list[Game]) -> int:
-    return score(sorted(games, key=lambda game: default_key(game.hand)))
+def solve_part_one(games: Iterable[Game]) -> int:
+    return score(games, default_key)
 
 
-def solve_part_two(games: list[Game]) -> int:
-    return score(sorted(games, key=lambda game: jokers_key(game.hand)))
+def solve_part_two(games: Iterable[Game]) -> int:
+    return score(games, jokers_key)
 
 
 def test():
@@ -52,6 +120,19 @@ def test():
     assert part_one_answer == 6_440
     part_two_answer = solve_part_two(camel_cards)
     assert part_two_answer == 5_905
+    assert solve_part_two(stream_and_parse("example.txt")) == 5_905
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "input.txt")
+        for text in ("AAAA 1\nKKKKKK 2\n", "AAAAA 1\nKKKKK\n"):
+            with open(path, "w", encoding="utf-8") as file:
+                file.write(text)
+            try:
+                read_and_parse(path)
+            except ValueError as error:
+                assert path in str(error)
+            else:
+                raise AssertionError(f"{text!r} parsed")
 
 
 def main():
@@ -0,0 +1,46 @@
+"""Haunted Wasteland input generator"""
+import itertools
+import random
+import string
+
+
+SCALE = "node count"
+SIZES = (1_000, 2_000, 4_000, 8_000)
+
+
+def link_loop(start: str, end: str, pool: list[str], length: int) -> list[tuple]:
+    """edges from start and end through length - 1 pairs of pool nodes to end"""
+    lefts = [pool.pop() for _ in range(length - 1)]
+    rights = [pool.pop() for _ in range(length - 1)]
+    edges = [(start, (lefts[0], rights[0])), (end, (lefts[0], rights[0]))]
+    for i, (left, right) in enumerate(zip(lefts, rights)):
+        children = (lefts[i + 1], rights[i + 1]) if i + 2 < length else (end, end)
+        edges.append((left, children))
+        edges.append((right, children))
+    return edges
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """about size nodes forming six ghost loops, one from AAA to ZZZ"""
+    rng = random.Random(seed)
+    letters = string.ascii_uppercase
+    prefixes = ["".join(pair) for pair in itertools.product(letters, repeat=2)]
+    rng.shuffle(prefixes)
+    pool = [prefix + last for prefix in prefixes for last in letters[1:-1]]
+    rng.shuffle(pool)
+
+    ghosts = 6
+    starts = ["AAA", *(prefix + "A" for prefix in prefixes if prefix != "AA")]
+    ends = ["ZZZ", *(prefix + "Z" for prefix in prefixes if prefix != "ZZ")]
+
+    edges = []
+    for start, end in zip(starts[:ghosts], ends):
+        length = max(2, size // (2 * ghosts) + rng.randint(-2, 2))
+        edges.extend(link_loop(start, end, pool, length))
+
+    rng.shuffle(edges)
+    instructions = "".join(rng.choices("LR", k=rng.randint(5, 50)))
+    return "\n".join(
+        [instructions, ""]
+        + [f"{node} = ({left}, {right})" for node, (left, right) in edges]
+    )
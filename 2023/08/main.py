@@ -4,41 +4,42 @@ import itertools
 import math
 from typing import Callable
 
+from aoc import mapped
 
-Graph = dict[str, tuple[str, str]]
 
+Graph = dict[bytes, tuple[bytes, bytes]]
 
-def parse_edge(text: str) -> tuple[str, tuple[str, str]]:
+
+def parse_edge(text: bytes) -> tuple[bytes, tuple[bytes, bytes]]:
     return text[:3], (text[7:10], text[12:15])
 
 
-def read_and_parse(filename: str) -> tuple[str, Graph]:
-    with open(filename, "r", encoding="utf-8") as file:
-        instructions, raw_graph = file.read().split("\n\n")
-        return instructions, dict(map(parse_edge, raw_graph.split("\n")))
+def read_and_parse(filename: str) -> tuple[bytes, Graph]:
+    [instructions], raw_graph = mapped.read_blocks(filename)
+    return instructions, dict(map(parse_edge, raw_graph))
 
 
 def calculate_period(
     graph: Graph,
-    instructions: str,
-    node: str,
-    is_end: Callable[[str], bool],
+    instructions: bytes,
+    node: bytes,
+    is_end: Callable[[bytes], bool],
 ) -> int:
     for step, instruction in enumerate(itertools.cycle(instructions), start=1):
-        if is_end(node := graph[node][instruction == "R"]):
+        if is_end(node := graph[node][instruction == ord("R")]):
             return step
     assert False
 
 
-def solve_part_one(instructions: str, graph: Graph) -> int:
-    return calculate_period(graph, instructions, "AAA", lambda node: node == "ZZZ")
+def solve_part_one(instructions: bytes, graph: Graph) -> int:
+    return calculate_period(graph, instructions, b"AAA", lambda node: node == b"ZZZ")
 
 
-def solve_part_two(instructions: str, graph: Graph) -> int:
+def solve_part_two(instructions: bytes, graph: Graph) -> int:
     gen = (
-        calculate_period(graph, instructions, node, lambda node: node.endswith("Z"))
+        calculate_period(graph, instructions, node, lambda node: node.endswith(b"Z"))
         for node in graph
-        if node.endswith("A")
+        if node.endswith(b"A")
     )
     return math.lcm(*gen)
 
@@ -0,0 +1,20 @@
+"""Mirage Maintenance input generator"""
+import random
+
+
+SCALE = "line count"
+SIZES = (250, 500, 1_000, 2_000)
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """size histories sampled from integer polynomials of degree at most five"""
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(size):
+        coefficients = [rng.randint(-9, 9) for _ in range(rng.randint(1, 6))]
+        values = [
+            sum(coefficient * x**power for power, coefficient in enumerate(coefficients))
+            for x in range(21)
+        ]
+        lines.append(" ".join(map(str, values)))
+    return "\n".join(lines)
@@ -1,27 +1,38 @@
 #!/usr/bin/env python3
 """Mirage Maintenance"""
 import itertools
+from typing import Iterable, Sequence
 
+from aoc import mapped, stream
 
-def parse_nums(text: str) -> list[int]:
+
+CHUNK_REDUCERS = {"part one": sum, "part two": sum}
+
+
+def parse_nums(text: bytes) -> list[int]:
     return list(map(int, text.split()))
 
 
-def read_and_parse(filename: str) -> list[list[int]]:
-    with open(filename, "r", encoding="utf-8") as file:
-        return list(map(parse_nums, file.read().splitlines()))
+def read_and_parse(filename: str) -> list[Sequence[int]]:
+    return mapped.split_rows(*mapped.read_ints(filename))
+
+
+def stream_and_parse(
+    filename: str, start: int = 0, end: int | None = None
+) -> Iterable[list[int]]:
+    return map(parse_nums, stream.read_lines(filename, start, end))
 
 
-def predict(nums: list[int]) -> int:
+def predict(nums: Sequence[int]) -> int:
     diff = [curr - prev for prev, curr in itertools.pairwise(nums)]
     return nums[-1] + (predict(diff) if any(diff) else 0)
 
 
-def solve_part_one(records: list[list[int]]) -> int:
+def solve_part_one(records: Iterable[Sequence[int]]) -> int:
     return sum(map(predict, records))
 
 
-def solve_part_two(records: list[list[int]]) -> int:
+def solve_part_two(records: Iterable[Sequence[int]]) -> int:
     return sum(predict(record[::-1]) for record in records)
 
 
@@ -31,6 +42,7 @@ def test():
     assert part_one_answer == 114
     part_two_answer = solve_part_two(records)
     assert part_two_answer == 2
+    assert solve_part_two(stream_and_parse("example.txt")) == 2
 
 
 def main():
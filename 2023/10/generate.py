@@ -0,0 +1,49 @@
+"""Pipe Maze input generator"""
+import random
+
+from aoc import generate as common
+
+
+SCALE = "grid side"
+SIZES = (35, 70, 140, 280)
+
+
+PIPES = {
+    frozenset([(-1, 0), (1, 0)]): "|",
+    frozenset([(0, -1), (0, 1)]): "-",
+    frozenset([(-1, 0), (0, 1)]): "L",
+    frozenset([(-1, 0), (0, -1)]): "J",
+    frozenset([(1, 0), (0, -1)]): "7",
+    frozenset([(1, 0), (0, 1)]): "F",
+}
+
+
+def draw_loop(grid: list[list[str]], outline: list[tuple[int, int]]):
+    """lay the pipe joining each outline cell to its two neighbours"""
+    for prev, (row, col), after in zip(
+        outline[-1:] + outline[:-1], outline, outline[1:] + outline[:1]
+    ):
+        directions = frozenset(
+            [(prev[0] - row, prev[1] - col), (after[0] - row, after[1] - col)]
+        )
+        grid[row][col] = PIPES[directions]
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """a size x size field of junk pipes around one closed loop through S"""
+    rng = random.Random(seed)
+    side = max(3, size)
+    grid = [rng.choices("|-LJ7F.", k=side) for _ in range(side)]
+
+    outline = common.trace_boundary(common.grow_polyomino(rng, side - 1, 0.4))
+    draw_loop(grid, outline)
+
+    start_row, start_col = rng.choice(outline)
+    loop = set(outline)
+    for drow, dcol in common.NEIGHBORS:
+        row, col = start_row + drow, start_col + dcol
+        if 0 <= row < side and 0 <= col < side and (row, col) not in loop:
+            grid[row][col] = "."
+    grid[start_row][start_col] = "S"
+
+    return "\n".join(map("".join, grid))
@@ -1,55 +1,44 @@
 #!/usr/bin/env python3
 """Pipe Maze"""
-import itertools
 from typing import Iterable
 
+from aoc import mapped
+from aoc.grid import Grid, Text
 
-class Grid:
-    """2d pipe grid with complex indexing"""
+
+class PipeGrid(Grid):
+    """2d pipe grid with connections as cell id offsets"""
 
     __START = "S"
 
     __DIRECTIONS = {
-        ".": [],
-        "|": [1, -1],
-        "-": [1j, -1j],
-        "L": [1j, -1],
-        "J": [-1, -1j],
-        "7": [-1j, 1],
-        "F": [1j, 1],
-        __START: [1, 1j, -1, -1j],
+        ".": "",
+        "|": "SN",
+        "-": "EW",
+        "L": "EN",
+        "J": "NW",
+        "7": "WS",
+        "F": "ES",
+        __START: "SENW",
     }
 
-    def __init__(self, raw: list[str]):
-        self.raw = raw[:]
-
-    def __contains__(self, cell: complex) -> bool:
-        row, col = int(cell.real), int(cell.imag)
-        return 0 <= row < len(self.raw) and 0 <= col < len(self.raw[row])
-
-    def __getitem__(self, cell: complex) -> str:
-        return self.raw[int(cell.real)][int(cell.imag)]
-
-    def index(self, target: str) -> complex:
-        for i, row in enumerate(self.raw):
-            for j, char in enumerate(row):
-                if char == target:
-                    return i + j * 1j
-        assert False
-
-    def find_neighbors(self, cell: complex) -> Iterable[complex]:
-        for direction in Grid.__DIRECTIONS[self[cell]]:
-            if (
-                (candidate := cell + direction) in self
-                and self[candidate] != "#"
-                and (
-                    self[cell] != Grid.__START or cell in self.find_neighbors(candidate)
-                )
-            ):
+    def __init__(self, raw: Text | list[str]):
+        super().__init__(raw, border=".")
+        offsets = dict(zip("NESW", self.offsets))
+        self.directions = {
+            ord(pipe): [offsets[direction] for direction in directions]
+            for pipe, directions in PipeGrid.__DIRECTIONS.items()
+        }
+
+    def find_neighbors(self, cell: int) -> Iterable[int]:
+        is_start = self.cells[cell] == ord(PipeGrid.__START)
+        for direction in self.directions[self.cells[cell]]:
+            candidate = cell + direction
+            if not is_start or cell in self.find_neighbors(candidate):
                 yield candidate
 
-    def find_closed_path(self, start: str = __START) -> list[complex]:
-        path = [self.index(start)]
+    def find_closed_path(self, start: str = __START) -> list[int]:
+        path = [self.find(start)]
 
         while len(path) < 2 or path[-1] != path[0]:
             path.append(
@@ -63,26 +52,26 @@ class Grid:
         return path
 
 
-def read_and_parse(filename: str) -> Grid:
-    with open(filename, "r", encoding="utf-8") as file:
-        return Grid(file.read().splitlines())
+def read_and_parse(filename: str) -> PipeGrid:
+    with mapped.open_text(filename) as text:
+        return PipeGrid(text)
 
 
-def solve_part_one(grid: Grid) -> int:
+def solve_part_one(grid: PipeGrid) -> int:
     return len(grid.find_closed_path()) // 2
 
 
-def calculate_polygon_area(polygon: list[complex]) -> float:
+def calculate_polygon_area(polygon: list[tuple[int, int]]) -> float:
     return abs(
         sum(
-            (curr.real - prev.real) * (prev.imag + curr.imag) / 2
-            for prev, curr in itertools.pairwise(polygon)
+            (curr_row - prev_row) * (prev_col + curr_col) / 2
+            for (prev_row, prev_col), (curr_row, curr_col) in zip(polygon, polygon[1:])
         )
     )
 
 
-def solve_part_two(grid: Grid) -> int:
-    polygon = grid.find_closed_path()
+def solve_part_two(grid: PipeGrid) -> int:
+    polygon = list(map(grid.coordinates, grid.find_closed_path()))
     area = calculate_polygon_area(polygon)
     return int(area + 1 - (len(polygon) - 1) / 2)
 
@@ -0,0 +1,22 @@
+"""Cosmic Expansion input generator"""
+import random
+
+
+SCALE = "grid side"
+SIZES = (35, 70, 140, 280)
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """a size x size image with sparse galaxies and some empty lines"""
+    rng = random.Random(seed)
+    empty_rows = set(rng.sample(range(size), size // 10))
+    empty_cols = set(rng.sample(range(size), size // 10))
+    return "\n".join(
+        "".join(
+            "#"
+            if row not in empty_rows and col not in empty_cols and rng.random() < 0.02
+            else "."
+            for col in range(size)
+        )
+        for row in range(size)
+    )
@@ -1,20 +1,20 @@
 #!/usr/bin/env python3
 """Cosmic Expansion"""
+from aoc import mapped
+from aoc.grid import Grid
 
 
-def read_and_parse(filename: str) -> list[str]:
-    with open(filename, "r", encoding="utf-8") as file:
-        return file.read().splitlines()
+def read_and_parse(filename: str) -> Grid:
+    with mapped.open_text(filename) as text:
+        return Grid(text, border=".")
 
 
-def find_row_frequencies(
-    grid: list[str], expansion_factor: int
-) -> list[tuple[int, int]]:
+def find_row_frequencies(grid: Grid, expansion_factor: int) -> list[tuple[int, int]]:
     row_frequencies = []
     expanded_row = 0
 
-    for row in grid:
-        if frequency := row.count("#"):
+    for row in grid.lines():
+        if frequency := row.count(b"#"):
             expanded_row += 1
             row_frequencies.append((expanded_row, frequency))
         else:
@@ -32,13 +32,13 @@ def row_distance_sum(row_frequencies: list[tuple[int, int]]) -> int:
     return distance_sum
 
 
-def solve_part_one(universe: list[str]) -> int:
+def solve_part_one(universe: Grid) -> int:
     return solve_part_two(universe, 2)
 
 
-def solve_part_two(universe: list[str], expansion_factor: int) -> int:
+def solve_part_two(universe: Grid, expansion_factor: int = 1_000_000) -> int:
     row_sum = row_distance_sum(find_row_frequencies(universe, expansion_factor))
-    transpose = ["".join(column) for column in zip(*universe)]
+    transpose = universe.transpose()
     column_sum = row_distance_sum(find_row_frequencies(transpose, expansion_factor))
     return row_sum + column_sum
 
@@ -57,7 +57,7 @@ def main():
     universe = read_and_parse("input.txt")
     part_one_answer = solve_part_one(universe)
     print(f"Part One: {part_one_answer}")
-    part_two_answer = solve_part_two(universe, 1_000_000)
+    part_two_answer = solve_part_two(universe)
     print(f"Part Two: {part_two_answer}")
 
 
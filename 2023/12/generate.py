@@ -0,0 +1,29 @@
+"""Hot Springs input generator"""
+import itertools
+import random
+
+
+SCALE = "line count"
+SIZES = (25, 50, 100, 200)
+
+
+def generate_record(rng: random.Random) -> str:
+    """hide up to ten springs of a random arrangement with at least one group"""
+    groups = []
+    while not groups:
+        springs = rng.choices(".#", k=rng.randint(4, 20))
+        groups = [
+            sum(1 for _ in grouper)
+            for key, grouper in itertools.groupby(springs)
+            if key == "#"
+        ]
+
+    for index in rng.sample(range(len(springs)), min(len(springs), rng.randint(1, 10))):
+        springs[index] = "?"
+    return "".join(springs) + " " + ",".join(map(str, groups))
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """size records consistent with at least one arrangement"""
+    rng = random.Random(seed)
+    return "\n".join(generate_record(rng) for _ in range(size))
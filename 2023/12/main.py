@@ -4,20 +4,22 @@ import collections
 import functools
 import itertools
 
+from aoc import counters, mapped
+
 
 Record = collections.namedtuple("Record", ["damaged", "groups"])
 
 
-def parse_record(text: str) -> Record:
+def parse_record(text: bytes) -> Record:
+    """the springs stay a str since the solvers match them against str states"""
     records, raw_nums = text.split()
-    nums = list(map(int, raw_nums.split(",")))
-    return Record(records, nums)
+    nums = list(map(int, raw_nums.split(b",")))
+    return Record(records.decode(), nums)
 
 
 def read_and_parse(filename: str) -> list[Record]:
     """condition records of which hot springs are damaged"""
-    with open(filename, "r", encoding="utf-8") as file:
-        return list(map(parse_record, file.read().splitlines()))
+    return list(map(parse_record, mapped.read_lines(filename)))
 
 
 def match(restored: tuple[str, ...], groups: list[int]) -> bool:
@@ -62,7 +64,18 @@ def dynamic_programming(record: Record) -> int:
 
         return total
 
-    return num_ways(0, 0, 0, ".")
+    ways = num_ways(0, 0, 0, ".")
+    if counters.ENABLED:
+        counters.add("num_ways cache hits", num_ways.cache_info().hits)
+    return ways
+
+
+DIFFERENTIAL = {
+    "arrangements": (
+        lambda records: sum(map(brute_force, records)),
+        lambda records: sum(map(dynamic_programming, records)),
+    ),
+}
 
 
 def solve_part_one(records: list[Record]) -> int:
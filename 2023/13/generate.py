@@ -0,0 +1,48 @@
+"""Point of Incidence input generator"""
+import random
+
+
+SCALE = "grid side"
+SIZES = (5, 10, 20, 40)
+
+
+def fold(index: int, axis: int, length: int) -> int:
+    """the smaller of an index and its mirror image if the latter exists"""
+    image = 2 * axis - 1 - index
+    return min(index, image) if 0 <= image < length else index
+
+
+def generate_pattern(rng: random.Random, size: int) -> str:
+    """a perfect horizontal mirror and a vertical one with a single smudge"""
+    rows = rng.randint(max(3, size // 2), max(3, size))
+    cols = rng.randint(3, max(3, size))
+    row_axis = rng.choice([axis for axis in range(1, rows) if 2 * axis != rows])
+    col_axis = rng.randrange(1, cols)
+
+    cells = {}
+    grid = [
+        [
+            cells.setdefault(
+                (fold(row, row_axis, rows), fold(col, col_axis, cols)),
+                rng.choice("#."),
+            )
+            for col in range(cols)
+        ]
+        for row in range(rows)
+    ]
+
+    row = rng.choice(
+        [row for row in range(rows) if not 0 <= 2 * row_axis - 1 - row < rows]
+    )
+    col = rng.randrange(max(0, 2 * col_axis - cols), min(cols, 2 * col_axis))
+    grid[row][col] = "#" if grid[row][col] == "." else "."
+
+    if rng.random() < 0.5:
+        grid = list(map(list, zip(*grid)))
+    return "\n".join(map("".join, grid))
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """a hundred patterns up to size x size"""
+    rng = random.Random(seed)
+    return "\n\n".join(generate_pattern(rng, size) for _ in range(100))
@@ -3,18 +3,22 @@
 import functools
 from typing import Iterable
 
+from aoc import mapped
 
-def read_and_parse(filename: str) -> list[list[str]]:
+
+__ROCK = ord("#")
+
+
+def read_and_parse(filename: str) -> list[list[bytes]]:
     """gridlike mirrors separated by empty lines"""
-    with open(filename, "r", encoding="utf-8") as file:
-        return [grid.split("\n") for grid in file.read().split("\n\n")]
+    return mapped.read_blocks(filename)
 
 
-def custom_hash(text: Iterable[str]) -> int:
-    return functools.reduce(lambda acc, char: (acc << 1) | (char == "#"), text, 0)
+def custom_hash(text: Iterable[int]) -> int:
+    return functools.reduce(lambda acc, char: (acc << 1) | (char == __ROCK), text, 0)
 
 
-def find_row(grid: Iterable[Iterable[str]], smudge: int) -> int:
+def find_row(grid: Iterable[Iterable[int]], smudge: int) -> int:
     hashes = list(map(custom_hash, grid))
 
     def is_mirror(middle: int) -> bool:
@@ -26,17 +30,17 @@ def find_row(grid: Iterable[Iterable[str]], smudge: int) -> int:
     return next(filter(is_mirror, range(1, len(hashes))), 0)
 
 
-def find_reflection(grid: list[str], smudge: int) -> int:
+def find_reflection(grid: list[bytes], smudge: int) -> int:
     """locate the mirror with a potential smudge"""
     return 100 * find_row(grid, smudge) or find_row(zip(*grid), smudge)
 
 
-def solve_part_one(grids: list[list[str]]) -> int:
+def solve_part_one(grids: list[list[bytes]]) -> int:
     """summary of notes without smudges"""
     return sum(find_reflection(grid, 0) for grid in grids)
 
 
-def solve_part_two(grids: list[list[str]]) -> int:
+def solve_part_two(grids: list[list[bytes]]) -> int:
     """summary of notes with smudges"""
     return sum(find_reflection(grid, 1) for grid in grids)
 
@@ -0,0 +1,14 @@
+"""Parabolic Reflector Dish input generator"""
+import random
+
+
+SCALE = "grid side"
+SIZES = (10, 20, 40, 80)
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """a size x size platform of rounded and cube-shaped rocks"""
+    rng = random.Random(seed)
+    return "\n".join(
+        "".join(rng.choices("O#.", weights=[2, 2, 6], k=size)) for _ in range(size)
+    )
@@ -1,64 +1,47 @@
 #!/usr/bin/env python3
 """Parabolic Reflector Dish"""
-import copy
+from aoc import cycles, mapped
+from aoc.grid import Grid
 
 
-class Grid:
-    """2d grid supporing reflections and rotations"""
+def read_and_parse(filename: str) -> Grid:
+    with mapped.open_text(filename) as text:
+        return Grid(text)
 
-    def __init__(self, raw: list[str]):
-        self.raw = raw[:]
 
-    def __eq__(self, other) -> bool:
-        return self.raw == other.raw
+def roll_left(group: bytes) -> bytes:
+    rounded = group.count(b"O")
+    return b"O" * rounded + b"." * (len(group) - rounded)
 
-    def tilt_left(self):
-        self.raw = [
-            "#".join("".join(sorted(group, reverse=True)) for group in row.split("#"))
-            for row in self.raw
-        ]
 
-    def transpose(self):
-        self.raw = list(map("".join, zip(*self.raw)))
+def tilt_left(grid: Grid) -> Grid:
+    """the border acts as cube-shaped rocks, so every row rolls at once"""
+    cells = b"#".join(map(roll_left, grid.cells.split(b"#")))
+    return Grid.from_buffer(cells, grid.rows, grid.cols, grid.border)
 
-    def reverse_rows(self):
-        self.raw = [row[::-1] for row in self.raw]
 
-    def calculate_load(self) -> int:
-        return sum(
-            distance * row.count("O")
-            for distance, row in enumerate(reversed(self.raw), start=1)
-        )
+def calculate_load(grid: Grid) -> int:
+    return sum(
+        distance * row.count(b"O")
+        for distance, row in enumerate(reversed(grid.lines()), start=1)
+    )
 
 
-def read_and_parse(filename: str) -> Grid:
-    with open(filename, "r", encoding="utf-8") as file:
-        return Grid(file.read().splitlines())
+def spin_cycle(grid: Grid) -> Grid:
+    for _ in range(4):
+        grid = tilt_left(grid.transpose()).reverse_rows()
+    return grid
 
 
 def solve_part_one(grid: Grid) -> int:
-    grid = copy.deepcopy(grid)
-    grid.transpose()
-    grid.tilt_left()
-    grid.transpose()
-    return grid.calculate_load()
-
-
-def solve_part_two(grid: Grid) -> int:
-    grid = copy.deepcopy(grid)
-
-    seen = []
-    while grid not in seen:
-        seen.append(copy.deepcopy(grid))
+    return calculate_load(tilt_left(grid.transpose()).transpose())
 
-        for _ in range(4):
-            grid.transpose()
-            grid.tilt_left()
-            grid.reverse_rows()
 
-    offset = seen.index(grid)
-    final = seen[offset + ((10**9 - offset) % (len(seen) - offset))]
-    return final.calculate_load()
+def solve_part_two(grid: Grid, spins: int = 10**9) -> int:
+    cycle = cycles.find_cycle(
+        grid, spin_cycle, lambda grid: cycles.digest(grid.cells), calculate_load
+    )
+    return cycle.value_at(spins)
 
 
 def test():
@@ -0,0 +1,22 @@
+"""Lens Library input generator"""
+import random
+import string
+
+
+SCALE = "step count"
+SIZES = (1_000, 2_000, 4_000, 8_000)
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """size steps over a pool of labels"""
+    rng = random.Random(seed)
+    labels = [
+        "".join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 6)))
+        for _ in range(max(1, size // 4))
+    ]
+    return ",".join(
+        f"{rng.choice(labels)}=" + rng.choice("123456789")
+        if rng.random() < 0.6
+        else f"{rng.choice(labels)}-"
+        for _ in range(size)
+    )
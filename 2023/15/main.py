@@ -4,21 +4,22 @@ import collections
 import functools
 import re
 
+from aoc import mapped
 
-def custom_hash(seq: str) -> int:
-    return functools.reduce(lambda acc, val: 17 * (acc + ord(val)) % 256, seq, 0)
 
+def custom_hash(seq: bytes) -> int:
+    return functools.reduce(lambda acc, val: 17 * (acc + val) % 256, seq, 0)
 
-def read_and_parse(filename: str) -> list[str]:
-    with open(filename, "r", encoding="utf-8") as file:
-        return file.read().splitlines()[0].split(",")
 
+def read_and_parse(filename: str) -> list[bytes]:
+    return mapped.read_lines(filename)[0].split(b",")
 
-def solve_part_one(instructions: list[str]) -> int:
+
+def solve_part_one(instructions: list[bytes]) -> int:
     return sum(map(custom_hash, instructions))
 
 
-def calculate_power(boxes: dict[int, dict[str, int]]) -> int:
+def calculate_power(boxes: dict[int, dict[bytes, int]]) -> int:
     return sum(
         (box_index + 1) * (lens_index + 1) * focal_length
         for box_index, box in boxes.items()
@@ -26,11 +27,11 @@ def calculate_power(boxes: dict[int, dict[str, int]]) -> int:
     )
 
 
-REMOVE_REGEX = re.compile("([a-z]+)-")
-ASSIGN_REGEX = re.compile("([a-z]+)=([0-9])")
+REMOVE_REGEX = re.compile(rb"([a-z]+)-")
+ASSIGN_REGEX = re.compile(rb"([a-z]+)=([0-9])")
 
 
-def solve_part_two(instructions: list[str]) -> int:
+def solve_part_two(instructions: list[bytes]) -> int:
     boxes = collections.defaultdict(dict)
 
     for instruction in instructions:
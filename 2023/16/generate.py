@@ -0,0 +1,15 @@
+"""The Floor Will Be Lava input generator"""
+import random
+
+
+SCALE = "grid side"
+SIZES = (8, 16, 32, 64)
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """a size x size contraption with sparse mirrors and splitters"""
+    rng = random.Random(seed)
+    return "\n".join(
+        "".join(rng.choices(".|-\\/", weights=[36, 1, 1, 1, 1], k=size))
+        for _ in range(size)
+    )
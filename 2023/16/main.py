@@ -1,75 +1,73 @@
 #!/usr/bin/env python3
 """The Floor Will Be Lava"""
-import collections
 from typing import Iterable
 
+from aoc import graph, mapped
+from aoc.grid import Grid, Text
 
-class Grid:
-    """2d grid with complex indexing"""
 
-    def __init__(self, raw: list[str]):
-        self.raw = raw[:]
+class Contraption(Grid):
+    """2d grid with beam directions as cell id offsets
 
-    def shape(self) -> tuple[int, int]:
-        return len(self.raw), len(self.raw[0])
+    A beam is the node 4 * cell + i of a graph where i indexes the direction
+    in offsets, so one search per starting beam runs on shared flat arrays.
+    """
 
-    def __contains__(self, cell: complex) -> bool:
-        row, col = int(cell.real), int(cell.imag)
-        return 0 <= row < len(self.raw) and 0 <= col < len(self.raw[0])
+    def __init__(self, raw: Text | list[str]):
+        super().__init__(raw)
+        up, right, down, left = self.offsets
+        self.turns = {}
 
-    def __getitem__(self, cell: complex) -> str:
-        return self.raw[int(cell.real)][int(cell.imag)]
+        for direction in self.offsets:
+            vertical = direction in (up, down)
+            self.turns[ord("."), direction] = (direction,)
+            self.turns[ord("|"), direction] = (direction,) if vertical else (down, up)
+            self.turns[ord("-"), direction] = (right, left) if vertical else (direction,)
+            self.turns[ord("\\"), direction] = (
+                {right: down, down: right, left: up, up: left}[direction],
+            )
+            self.turns[ord("/"), direction] = (
+                {right: up, up: right, left: down, down: left}[direction],
+            )
 
-    def find_neighbors(
-        self, location: complex, direction: complex
-    ) -> Iterable[tuple[complex, complex]]:
-        if self[location] == "|" and direction.imag:
-            yield location + 1, 1
-            yield location - 1, -1
-        elif self[location] == "-" and direction.real:
-            yield location + 1j, 1j
-            yield location - 1j, -1j
-        elif self[location] == "\\":
-            direction = direction.imag + direction.real * 1j
-            yield location + direction, direction
-        elif self[location] == "/":
-            direction = direction.imag + direction.real * 1j
-            yield location - direction, -direction
-        else:
-            yield location + direction, direction
+        self.beams = graph.Graph.from_function(4 * len(self.cells), self.find_neighbors)
 
+    def beam(self, location: int, direction: int) -> int:
+        return 4 * location + self.offsets.index(direction)
 
-def breadth_first_search(contraption: Grid, start: tuple[complex, complex]) -> int:
-    seen = {start}
-    queue = collections.deque([start])
+    def find_neighbors(self, beam: int) -> Iterable[int]:
+        location, direction = divmod(beam, 4)
+        if self.cells[location] == self.border:
+            return
+        for turn in self.turns[self.cells[location], self.offsets[direction]]:
+            if self.cells[location + turn] != self.border:
+                yield self.beam(location + turn, turn)
 
-    while queue:
-        for node in contraption.find_neighbors(*queue.popleft()):
-            if node[0] in contraption and node not in seen:
-                seen.add(node)
-                queue.append(node)
 
-    return len({location for location, _ in seen})
+def count_energized(contraption: Contraption, location: int, direction: int) -> int:
+    search = graph.bfs(contraption.beams, [contraption.beam(location, direction)])
+    return len({beam >> 2 for beam in search.order})
 
 
-def read_and_parse(filename: str) -> Grid:
-    with open(filename, "r", encoding="utf-8") as file:
-        return Grid(file.read().splitlines())
+def read_and_parse(filename: str) -> Contraption:
+    with mapped.open_text(filename) as text:
+        return Contraption(text)
 
 
-def solve_part_one(contraption: Grid) -> int:
-    return breadth_first_search(contraption, (0, 1j))
+def solve_part_one(contraption: Contraption) -> int:
+    return count_energized(contraption, contraption.index(0, 0), 1)
 
 
-def solve_part_two(contraption: Grid) -> int:
-    rows, cols = contraption.shape()
+def solve_part_two(contraption: Contraption) -> int:
+    rows, cols = contraption.rows, contraption.cols
+    up, right, down, left = contraption.offsets
     candidates = (
-        [(row, 1j) for row in range(rows)]
-        + [(row + (cols - 1) * 1j, -1j) for row in range(rows)]
-        + [(col * 1j, 1) for col in range(cols)]
-        + [(rows - 1 + col * 1j, -1) for col in range(cols)]
+        [(contraption.index(row, 0), right) for row in range(rows)]
+        + [(contraption.index(row, cols - 1), left) for row in range(rows)]
+        + [(contraption.index(0, col), down) for col in range(cols)]
+        + [(contraption.index(rows - 1, col), up) for col in range(cols)]
     )
-    return max(breadth_first_search(contraption, candidate) for candidate in candidates)
+    return max(count_energized(contraption, *candidate) for candidate in candidates)
 
 
 def test():
@@ -0,0 +1,13 @@
+"""Clumsy Crucible input generator"""
+import random
+
+
+SCALE = "grid side"
+SIZES = (10, 20, 40, 80)
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """a size x size map of heat losses"""
+    rng = random.Random(seed)
+    side = max(5, size)
+    return "\n".join("".join(rng.choices("123456789", k=side)) for _ in range(side))
@@ -1,113 +1,70 @@
 #!/usr/bin/env python3
 """Clumsy Crucible"""
-import collections
-import functools
-import heapq
 from typing import Iterable
 
-
-@functools.total_ordering
-class Node(collections.namedtuple("Node", ["location", "direction", "count"])):
-    """fancy named tuple"""
-
-    def key(self) -> tuple[int, int, int, int, int]:
-        return (
-            self.location.real,
-            self.location.imag,
-            self.direction.real,
-            self.direction.imag,
-            self.count,
+from aoc import graph, mapped
+from aoc.grid import Grid, Text
+
+
+class HeatLossGrid(Grid):
+    """2d grid of heat losses with crucible moves as cell id offsets
+
+    The crucible turns after every straight run, so node 2 * cell + axis is
+    having arrived at cell along an axis, 0 for vertical, and its edges are
+    whole runs along the other axis weighted by the heat lost on the way.
+    """
+
+    __ZERO = ord("0")
+
+    def __init__(self, raw: Text | list[str]):
+        super().__init__(raw)
+        up, right, down, left = self.offsets
+        self.turns = ((left, right), (up, down))
+
+    def find_runs(self, node: int, lower: int, upper: int) -> Iterable[tuple[int, int]]:
+        location, axis = divmod(node, 2)
+        if self.cells[location] == self.border:
+            return
+        for direction in self.turns[axis]:
+            new_location, heatloss = location, 0
+            for length in range(1, upper + 1):
+                new_location += direction
+                if self.cells[new_location] == self.border:
+                    break
+                heatloss += self.cells[new_location] - self.__ZERO
+                if lower <= length:
+                    yield 2 * new_location + 1 - axis, heatloss
+
+    def build_graph(self, lower: int, upper: int) -> graph.Graph:
+        return graph.Graph.from_function(
+            2 * len(self.cells),
+            lambda node: self.find_runs(node, lower, upper),
+            weighted=True,
         )
 
-    def __lt__(self, other) -> bool:
-        return self.key() < other.key()
-
-    def __eq__(self, other) -> bool:
-        return self.key() == other.key()
-
-    def __hash__(self) -> int:
-        return hash(self.key())
-
-
-class Grid:
-    """2d heatloss_grid with complex indexing"""
-
-    def __init__(self, raw: list[str]):
-        self.lower_bound = self.upper_bound = 0
-        self.raw = [list(map(int, line)) for line in raw]
-
-    def shape(self) -> tuple[int, int]:
-        return len(self.raw), len(self.raw[0])
-
-    def set_bounds(self, lower_bound: int, upper_bound: int):
-        self.lower_bound, self.upper_bound = lower_bound, upper_bound
-
-    def __contains__(self, cell: complex) -> bool:
-        row, col = int(cell.real), int(cell.imag)
-        return 0 <= row < len(self.raw) and 0 <= col < len(self.raw[0])
-
-    def __getitem__(self, cell: complex) -> int:
-        return self.raw[int(cell.real)][int(cell.imag)]
 
-    def get_neighbors(self, node: Node) -> Iterable[tuple[Node, int]]:
-        if self.lower_bound <= node.count:
-            for new_direction in 1j * node.direction, -1j * node.direction:
-                new_node = Node(node.location + new_direction, new_direction, 1)
-                if new_node.location in self:
-                    yield new_node, self[new_node.location]
+def read_and_parse(filename: str) -> HeatLossGrid:
+    with mapped.open_text(filename) as text:
+        return HeatLossGrid(text)
 
-        if node.count < self.upper_bound:
-            node = Node(node.location + node.direction, node.direction, node.count + 1)
-            if node.location in self:
-                yield node, self[node.location]
 
+def find_least_heatloss(heatloss_grid: HeatLossGrid, lower: int, upper: int) -> int:
+    """heat losses are single digits, so runs weigh little and buckets beat a heap"""
+    start = heatloss_grid.index(0, 0)
+    target = heatloss_grid.index(heatloss_grid.rows - 1, heatloss_grid.cols - 1)
+    targets = 2 * target, 2 * target + 1
+    distance = graph.bucket_search(
+        heatloss_grid.build_graph(lower, upper), (2 * start, 2 * start + 1), targets
+    )
+    return min(distance[node] for node in targets if distance[node] != graph.UNREACHED)
 
-def read_and_parse(filename: str) -> Grid:
-    with open(filename, "r", encoding="utf-8") as file:
-        return Grid(file.read().splitlines())
-
-
-def dijkstra(heatloss_grid: Grid, sources: list[Node]):
-    distance = collections.defaultdict(lambda: 10**9)
-    heap = []
-
-    for source in sources:
-        distance[source] = 0
-        heapq.heappush(heap, (0, source))
-
-    while heap:
-        node_distance, node = heapq.heappop(heap)
-        if node_distance != distance[node]:
-            continue
-
-        for next_node, edge_length in heatloss_grid.get_neighbors(node):
-            if distance[next_node] > distance[node] + edge_length:
-                distance[next_node] = distance[node] + edge_length
-                heapq.heappush(heap, (distance[next_node], next_node))
-
-    return distance
 
+def solve_part_one(heatloss_grid: HeatLossGrid) -> int:
+    return find_least_heatloss(heatloss_grid, 1, 3)
 
-def solve_part_one(heatloss_grid: Grid) -> int:
-    heatloss_grid.set_bounds(0, 3)
-    distance = dijkstra(heatloss_grid, [Node(0, 1j, 0), Node(0, 1, 0)])
-    rows, cols = heatloss_grid.shape()
-    return min(
-        node_distance
-        for node, node_distance in distance.items()
-        if node.location == rows - 1 + (cols - 1) * 1j
-    )
 
-
-def solve_part_two(heatloss_grid: Grid) -> int:
-    heatloss_grid.set_bounds(4, 10)
-    distance = dijkstra(heatloss_grid, [Node(0, 1j, 0), Node(0, 1, 0)])
-    rows, cols = heatloss_grid.shape()
-    return min(
-        node_distance
-        for node, node_distance in distance.items()
-        if node.location == rows - 1 + (cols - 1) * 1j and node.count >= 4
-    )
+def solve_part_two(heatloss_grid: HeatLossGrid) -> int:
+    return find_least_heatloss(heatloss_grid, 4, 10)
 
 
 def test():
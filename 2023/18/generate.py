@@ -0,0 +1,60 @@
+"""Lavaduct Lagoon input generator"""
+import itertools
+import random
+
+from aoc import generate as common
+
+
+SCALE = "lattice side"
+SIZES = (25, 50, 100, 200)
+
+
+DIRECTIONS = {(0, 1): ("R", 0), (1, 0): ("D", 1), (0, -1): ("L", 2), (-1, 0): ("U", 3)}
+
+
+def stretch(rng: random.Random, side: int, largest_gap: int) -> list[int]:
+    """random increasing coordinates for the lattice lines"""
+    return list(itertools.accumulate(rng.randint(1, largest_gap) for _ in range(side)))
+
+
+def find_moves(outline: list[tuple]) -> tuple[list[tuple], list[tuple]]:
+    """the outline and its unit moves, rotated to start right after a turn"""
+    moves = [
+        (next_row - row, next_col - col)
+        for (row, col), (next_row, next_col) in zip(
+            outline, outline[1:] + outline[:1]
+        )
+    ]
+    turn = next(i for i in range(len(moves)) if moves[i] != moves[i - 1])
+    return outline[turn:] + outline[:turn], moves[turn:] + moves[:turn]
+
+
+def encode_runs(
+    outline: list[tuple], moves: list[tuple], small: list[list], large: list[list]
+) -> list[str]:
+    """one dig instruction per run of equal moves, measured on both lattices"""
+    lines = []
+    start = 0
+    for end in range(1, len(moves) + 1):
+        if end < len(moves) and moves[end] == moves[start]:
+            continue
+        first, last = outline[start], outline[end % len(outline)]
+        axis = 0 if moves[start][0] else 1
+        distance = abs(small[axis][last[axis]] - small[axis][first[axis]])
+        encoded = abs(large[axis][last[axis]] - large[axis][first[axis]])
+        letter, digit = DIRECTIONS[moves[start]]
+        lines.append(f"{letter} {distance} (#{encoded:05x}{digit})")
+        start = end
+    return lines
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """one outline drawn on a size x size lattice stretched two different ways"""
+    rng = random.Random(seed)
+    side = max(2, size)
+    outline = common.trace_boundary(common.grow_polyomino(rng, side, 0.4))
+    outline, moves = find_moves(outline)
+
+    small = [stretch(rng, side + 1, 10) for _ in range(2)]
+    large = [stretch(rng, side + 1, 0xFFFFF // (side + 1)) for _ in range(2)]
+    return "\n".join(encode_runs(outline, moves, small, large))
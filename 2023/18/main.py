@@ -2,21 +2,22 @@
 """Lavaduct Lagoon"""
 import itertools
 
+from aoc import mapped
 
-Step = tuple[complex, int, str]
 
+Step = tuple[complex, int, bytes]
 
-__DIRECTION = {"R": 1, "U": 1j, "L": -1, "D": -1j}
 
+__DIRECTION = {ord("R"): 1, ord("U"): 1j, ord("L"): -1, ord("D"): -1j}
 
-def parse_step(text: str) -> Step:
+
+def parse_step(text: bytes) -> Step:
     raw_direction, distance, color = text.split()
-    return __DIRECTION[raw_direction], int(distance), color[2:-1]
+    return __DIRECTION[raw_direction[0]], int(distance), color[2:-1]
 
 
 def read_and_parse(filename: str) -> list[Step]:
-    with open(filename, "r", encoding="utf-8") as file:
-        return list(map(parse_step, file.read().splitlines()))
+    return list(map(parse_step, mapped.read_lines(filename)))
 
 
 class Polygon:
@@ -45,11 +46,11 @@ def solve_part_one(plan: list[Step]) -> int:
     return int(polygon.calculate_area() + polygon.calculate_perimeter() / 2 + 1)
 
 
-def solve_part_two(plan: list[tuple[complex, int, str]]) -> int:
+def solve_part_two(plan: list[Step]) -> int:
     raw: list[complex] = [0]
     for *_, raw_both in plan:
         distance = int(raw_both[:5], base=16)
-        direction = __DIRECTION["RDLU"[int(raw_both[-1])]]
+        direction = __DIRECTION[b"RDLU"[int(raw_both[5:])]]
         raw.append(raw[-1] + distance * direction)
     polygon = Polygon(raw)
     return int(polygon.calculate_area() + polygon.calculate_perimeter() / 2 + 1)
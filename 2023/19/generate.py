@@ -0,0 +1,46 @@
+"""Aplenty input generator"""
+import itertools
+import random
+import string
+
+
+SCALE = "workflow count"
+SIZES = (100, 200, 400, 800)
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """a tree of size workflows rooted at in and size parts"""
+    rng = random.Random(seed)
+    names = [
+        "".join(letters)
+        for length in (2, 3)
+        for letters in itertools.product(string.ascii_lowercase, repeat=length)
+        if "".join(letters) != "in"
+    ]
+    rng.shuffle(names)
+
+    pending, workflows = ["in"], []
+    while pending:
+        name = pending.pop(rng.randrange(len(pending)))
+        destinations = []
+        for _ in range(rng.randint(2, 4)):
+            if len(workflows) + len(pending) + 1 < size and (
+                rng.random() < 0.6 or not pending
+            ):
+                pending.append(names.pop())
+                destinations.append(pending[-1])
+            else:
+                destinations.append(rng.choice("AR"))
+
+        *last_rules, final = destinations
+        rules = [
+            f"{rng.choice('xmas')}{rng.choice('<>')}{rng.randint(2, 3999)}:{destination}"
+            for destination in last_rules
+        ]
+        workflows.append(f"{name}{{{','.join(rules + [final])}}}")
+
+    parts = [
+        "{" + ",".join(f"{key}={rng.randint(1, 4000)}" for key in "xmas") + "}"
+        for _ in range(size)
+    ]
+    return "\n".join(workflows) + "\n\n" + "\n".join(parts)
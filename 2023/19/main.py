@@ -1,13 +1,13 @@
 #!/usr/bin/env python3
 """Aplenty"""
 import collections
-import copy
-import math
 from typing import Iterable
 
+from aoc import intervals, mapped
+from aoc.intervals import Box
+
 
 Part = dict[str, int]
-Block = dict[str, range]
 
 
 def parse_part(raw: str) -> Part:
@@ -24,24 +24,20 @@ class Rule:
 
     def __init__(self, raw: str):
         self.name = raw[0]
+        self.axis = "xmas".index(self.name)
         self.sign = raw[1]
         self.value = int(raw[2:])
 
     def apply_to_part(self, part: Part) -> bool:
         return Rule.__OPERATORS[self.sign](part[self.name], self.value)
 
-    def apply_to_block(self, block: Block) -> tuple[Block, Block]:
-        result = copy.deepcopy(block)
-        in_ref, out_ref = block[self.name], result[self.name]
-
+    def apply_to_block(self, block: Box) -> tuple[Box | None, Box | None]:
+        """the parts of the block that match and that do not, None if empty"""
         if self.sign == ">":
-            block[self.name] = range(in_ref.start, min(self.value + 1, in_ref.stop))
-            result[self.name] = range(max(out_ref.start, self.value + 1), out_ref.stop)
+            rest, result = intervals.split_box(block, self.axis, self.value + 1)
         else:
-            block[self.name] = range(max(in_ref.start, self.value), in_ref.stop)
-            result[self.name] = range(out_ref.start, min(self.value, out_ref.stop))
-
-        return result, block
+            result, rest = intervals.split_box(block, self.axis, self.value)
+        return result, rest
 
 
 class Workflow:
@@ -65,19 +61,22 @@ class Workflow:
                 return destination
         return self.destinations[-1]
 
-    def apply_to_block(self, block: Block) -> Iterable[tuple[str, Block]]:
+    def apply_to_block(self, block: Box) -> Iterable[tuple[str, Box]]:
         for rule, destination in zip(self.rules, self.destinations):
             result, block = rule.apply_to_block(block)
-            yield destination, result
+            if result is not None:
+                yield destination, result
+            if block is None:
+                return
         yield self.destinations[-1], block
 
 
 def read_and_parse(filename: str) -> tuple[list[Workflow], list[Part]]:
-    with open(filename, "r", encoding="utf-8") as file:
-        raw_workflows, raw_parts = file.read().split("\n\n")
-        workflows = list(map(Workflow, raw_workflows.split("\n")))
-        parts = list(map(parse_part, raw_parts.split("\n")))
-        return workflows, parts
+    """names and categories stay str, they are compared with str literals"""
+    raw_workflows, raw_parts = mapped.read_blocks(filename)
+    workflows = [Workflow(raw.decode()) for raw in raw_workflows]
+    parts = [parse_part(raw.decode()) for raw in raw_parts]
+    return workflows, parts
 
 
 def solve_part_one(workflows: list[Workflow], parts: list[Part]) -> int:
@@ -93,15 +92,15 @@ def solve_part_one(workflows: list[Workflow], parts: list[Part]) -> int:
     return total
 
 
-def solve_part_two(workflows: list[Workflow]) -> int:
+def solve_part_two(workflows: list[Workflow], _parts: list[Part] = ()) -> int:
     mapping = {workflow.name: workflow for workflow in workflows}
 
     total = 0
-    queue = collections.deque([(str("in"), {key: range(1, 4001) for key in "xmas"})])
+    queue = collections.deque([(str("in"), ((1, 4001),) * len("xmas"))])
     while queue:
         name, block = queue.popleft()
         if name == "A":
-            total += math.prod(map(len, block.values()))
+            total += intervals.volume(block)
         elif name != "R":
             queue.extend(mapping[name].apply_to_block(block))
     return total
@@ -0,0 +1,53 @@
+"""Pulse Propagation input generator"""
+import itertools
+import random
+import string
+
+
+SCALE = "counter period"
+SIZES = (256, 1_024, 4_096, 16_384)
+
+
+def wire_counter(names: list[str], bits: int, period: int) -> tuple[str, list[str]]:
+    """the inverter and module lines of a counter that fires every period presses"""
+    flip_flops = [names.pop() for _ in range(bits)]
+    counter, inverter = names.pop(), names.pop()
+
+    lines, feedback = [], [flip_flops[0]]
+    for bit, flip_flop in enumerate(flip_flops):
+        children = flip_flops[bit + 1 : bit + 2]
+        if period >> bit & 1:
+            children.append(counter)
+        elif bit:
+            feedback.append(flip_flop)
+        lines.append(f"%{flip_flop} -> {', '.join(children)}")
+
+    lines.append(f"&{counter} -> {', '.join(feedback + [inverter])}")
+    lines.append(f"&{inverter} -> vr")
+    return inverter, lines
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """four binary counters with periods up to size feeding vr and then rx"""
+    rng = random.Random(seed)
+    bits = max(2, size.bit_length())
+    names = [
+        "".join(letters)
+        for length in (2, 3)
+        for letters in itertools.product(string.ascii_lowercase, repeat=length)
+        if "".join(letters) not in ("vr", "rx")
+    ]
+    rng.shuffle(names)
+
+    lines, heads, inverters = [], [], []
+    for _ in range(4):
+        period = rng.randrange(1 << (bits - 1), 1 << bits) | 1
+        heads.append(names[-1])
+        inverter, counter_lines = wire_counter(names, bits, period)
+        inverters.append(inverter)
+        lines.extend(counter_lines)
+
+    lines.append(f"broadcaster -> {', '.join(heads)}")
+    lines.append("&vr -> rx")
+    rng.shuffle(lines)
+    return "\n".join(lines)
@@ -5,6 +5,8 @@ import copy
 import itertools
 import math
 
+from aoc import cycles, mapped
+
 
 def read_and_parse(filename: str) -> list[str]:
     graph = {}
@@ -12,32 +14,52 @@ def read_and_parse(filename: str) -> list[str]:
     state = {}
     parents = collections.defaultdict(dict)
 
-    with open(filename, "r", encoding="utf-8") as file:
-        for line in file.read().splitlines():
-            source, destinations = line.split(' -> ')
+    for line in mapped.read_lines(filename):
+        source, destinations = line.decode().split(' -> ')
 
-            if source != 'broadcaster':
-                module_type = source[0]
-                source = source[1:]
-                types[source] = module_type
+        if source != 'broadcaster':
+            module_type = source[0]
+            source = source[1:]
+            types[source] = module_type
 
-            state[source] = 0
-            graph[source] = destinations.split(', ')
+        state[source] = 0
+        graph[source] = destinations.split(', ')
 
-        for node, children in graph.items():
-            for child in children:
-                if child in types and types[child] == '&':
-                    parents[child][node] = 0
+    for node, children in graph.items():
+        for child in children:
+            if child in types and types[child] == '&':
+                parents[child][node] = 0
 
-        return graph, types, state, parents
+    return graph, types, state, parents
 
 
-def solve_part_one(graph, types, initial_state, initial_parents) -> int:
-    state = copy.deepcopy(initial_state)
-    parents = copy.deepcopy(initial_parents)
-    count = {0: 0, 1: 0}
+def solve_part_one(
+    graph, types, initial_state, initial_parents, presses: int = 1_000
+) -> int:
+    """the machine may return to an earlier state long before the last press"""
+
+    def thaw(machine: tuple) -> tuple[dict, dict]:
+        flip_flops, memories = machine
+        state = dict(zip(initial_state, flip_flops))
+        parents = {
+            module: dict(zip(inputs, memory))
+            for (module, inputs), memory in zip(initial_parents.items(), memories)
+        }
+        return state, parents
 
-    for _ in range(1_000):
+    def freeze(state: dict, parents: dict) -> tuple:
+        memories = tuple(tuple(memory.values()) for memory in parents.values())
+        return tuple(state.values()), memories
+
+    def fingerprint(machine: tuple) -> bytes:
+        flip_flops, memories = machine
+        return cycles.digest(bytes(flip_flops) + bytes(itertools.chain(*memories)))
+
+    def press(machine: tuple) -> tuple[tuple, tuple[int, int]]:
+        """push the button once in the given machine state, returning the
+        next state and the low and high pulses that were sent"""
+        state, parents = thaw(machine)
+        count = [0, 0]
         queue = collections.deque([(None, "broadcaster", 0)])
 
         while queue:
@@ -63,7 +85,12 @@ def solve_part_one(graph, types, initial_state, initial_parents) -> int:
             else:
                 assert False
 
-    return count[0] * count[1]
+        return freeze(state, parents), (count[0], count[1])
+
+    start = freeze(initial_state, initial_parents)
+    cycle = cycles.find_cycle(start, press, fingerprint, limit=presses)
+    low, high = cycle.total(presses)
+    return low * high
 
 
 def solve_part_two(graph, types, initial_state, initial_parents) -> int:
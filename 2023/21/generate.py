@@ -0,0 +1,28 @@
+"""Step Counter input generator"""
+import random
+
+
+SCALE = "grid side"
+SIZES = (11, 21, 41, 81)
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """an odd-sided square garden whose border and middle lines are open"""
+    rng = random.Random(seed)
+    side = max(5, size) | 1
+    middle = side // 2
+
+    grid = [
+        [
+            "#"
+            if 0 < row < side - 1
+            and 0 < col < side - 1
+            and middle not in (row, col)
+            and rng.random() < 0.1
+            else "."
+            for col in range(side)
+        ]
+        for row in range(side)
+    ]
+    grid[middle][middle] = "S"
+    return "\n".join(map("".join, grid))
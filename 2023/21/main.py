@@ -1,54 +1,45 @@
 #!/usr/bin/env python3
 """Step Counter"""
 import collections
+from typing import Iterable
 
+from aoc import graph, mapped
+from aoc.grid import Grid
 
-def read_and_parse(filename: str) -> list[str]:
-    with open(filename, "r", encoding="utf-8") as file:
-        return file.read().splitlines()
 
+def read_and_parse(filename: str) -> Grid:
+    with mapped.open_text(filename) as text:
+        return Grid(text)
 
-def solve_part_one(garden: list[str], steps: int = 64) -> int:
-    rows, cols = len(garden), len(garden[0])
-    start_row = start_col = -1
-    for row in range(rows):
-        for col in range(cols):
-            if garden[row][col] == 'S':
-                start_row, start_col = row, col
-    queue = [{(start_row, start_col)}]
-    for i in range(steps):
-        queue.append(set())
-        for row, col in queue[i]:
-            nei = (row-1,col),(row,col-1),(row,col+1),(row+1,col)
-            for next_row, next_col in nei:
-                if (
-                    0 <= next_row < rows and
-                    0 <= next_col < cols and
-                    garden[next_row][next_col] != '#'
-                ):
-                    queue[i + 1].add((next_row, next_col))
-    return len(queue[steps])
-
-
-def solve_part_two_naive(garden: list[str], steps: int) -> int:
-    rows, cols = len(garden), len(garden[0])
-    start_row = start_col = -1
-    for row in range(rows):
-        for col in range(cols):
-            if garden[row][col] == 'S':
-                start_row, start_col = row, col
-    seen = {(start_row, start_col)}
+
+def solve_part_one(garden: Grid, steps: int = 64) -> int:
+    """a plot is reached in exactly steps if it is no further and of the same
+    parity, since every step there can be undone by stepping back and forth"""
+    distance = graph.bfs(garden.open_graph(), [garden.find("S")]).distance
+    return sum(
+        1
+        for plot_distance in distance
+        if plot_distance != graph.UNREACHED
+        and plot_distance <= steps
+        and (steps - plot_distance) % 2 == 0
+    )
+
+
+def solve_part_two_naive(garden: Grid, steps: int) -> int:
+    rows, cols = garden.rows, garden.cols
+    tiles = garden.lines()
+    start = garden.coordinates(garden.find("S"))
+    seen = {start}
     total = 0
-    queue = collections.deque([(start_row, start_col)])
+    queue = collections.deque([start])
     for i in range(steps):
         if i % 2 == steps % 2:
             total += len(queue)
         for _ in range(len(queue)):
             row, col = queue.popleft()
-            nei = (row-1,col),(row,col-1),(row,col+1),(row+1,col)
-            for next_row, next_col in nei:
+            for next_row, next_col in (row-1,col),(row,col-1),(row,col+1),(row+1,col):
                 if (
-                    garden[next_row % rows][next_col % cols] != '#' and
+                    tiles[next_row % rows][next_col % cols] != ord('#') and
                     (next_row, next_col) not in seen
                 ):
                     seen.add((next_row, next_col))
@@ -56,55 +47,57 @@ def solve_part_two_naive(garden: list[str], steps: int) -> int:
     return total + len(queue)
 
 
-def bfs(garden, start, key):
-    queue = collections.deque([start])
-    distance = {key(start): 0}
-
-    while queue:
-        old_state = queue.popleft()
-        old_group = key(old_state)
-        row, col, parity = old_state
-
-        nei = (row - 1, col), (row, col - 1), (row, col + 1), (row + 1, col)
-        for next_row, next_col in nei:
-            if garden[next_row % len(garden)][next_col % len(garden)] == '#':
-                continue
-
-            new_state = next_row, next_col, 1 - parity
-            new_group = key(new_state)
-
-            if new_group not in distance:
-                queue.append(new_state)
-                distance[new_group] = distance[old_group] + 1
-
-    return distance
-
-
-def count_reachable(distances, steps, size):
-    total = 0
-
-    for group, distance in distances.items():
-        _, _, parity, *_ = group
-        if parity != steps & 1 or steps < distance:
-            continue
-
-        blocks = (steps - distance) // (2 * size) + 1
-        total += blocks**2
-
-    return total
-
-
-def solve_part_two(garden: list[str], steps: int = 26_501_365) -> int:
-    size = len(garden)
-    midpoint = size >> 1
-
-    def key(state):
-        row, col, parity = state
-        return row % size, col % size, parity, row >= midpoint, col >= midpoint
-
-    start = midpoint, midpoint, 0
-    distance = bfs(garden, start, key)
-    return count_reachable(distance, steps, size)
+def count_copies(slack: int, size: int) -> int:
+    """copies k tiles further into a quadrant are k + 1 plots, each k * size
+    steps further away, and are reached if the steps left over are even"""
+    if slack < 0:
+        return 0
+    furthest = slack // size
+    if size % 2 == 0:
+        return (furthest + 1) * (furthest + 2) // 2 if slack % 2 == 0 else 0
+    nearest = slack & 1
+    if furthest < nearest:
+        return 0
+    count = (furthest - nearest) // 2 + 1
+    return count * (count + nearest)
+
+
+def count_reachable(distances: Iterable[int], steps: int, size: int) -> int:
+    return sum(
+        count_copies(steps - distance, size)
+        for distance in distances
+        if distance != graph.UNREACHED
+    )
+
+
+def solve_part_two(garden: Grid, steps: int = 26_501_365) -> int:
+    """distances to the 2 x 2 tiles around the start come from a search on
+    3 x 3 copies of the garden, a copy k tiles further out along a quadrant
+    is then k * size steps further, which the open middle lines and border
+    of the input ensure"""
+    size, midpoint = garden.rows, garden.rows >> 1
+    tiled = Grid([line * 3 for _ in range(3) for line in garden.lines()])
+    center = size + midpoint
+    distance = graph.bfs(tiled.open_graph(), [tiled.index(center, center)]).distance
+    square = range(center - size, center + size)
+    return count_reachable(
+        (distance[tiled.index(row, col)] for row in square for col in square),
+        steps,
+        size,
+    )
+
+
+def find_reference_steps(garden: Grid) -> int:
+    """far enough to cross several copies, near enough for the naive search"""
+    return 5 * garden.rows + garden.rows // 2
+
+
+DIFFERENTIAL = {
+    "part two": (
+        lambda garden: solve_part_two_naive(garden, find_reference_steps(garden)),
+        lambda garden: solve_part_two(garden, find_reference_steps(garden)),
+    ),
+}
 
 
 def test():
@@ -121,6 +114,10 @@ def test():
     part_two_answer = solve_part_two_naive(garden, 100)
     assert part_two_answer == 6_536
 
+    open_garden = Grid([".....", ".....", "..S..", ".....", "....."])
+    for steps in (2, 7, 27, 28):
+        assert solve_part_two(open_garden, steps) == (steps + 1) ** 2
+
 
 def main():
     garden = read_and_parse("input.txt")
@@ -0,0 +1,33 @@
+"""Sand Slabs input generator"""
+import random
+
+
+SCALE = "brick count"
+SIZES = (250, 500, 1_000, 2_000)
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """size non-overlapping bricks above a 10 x 10 floor"""
+    rng = random.Random(seed)
+    occupied = set()
+    lines = []
+
+    for _ in range(size):
+        axis, length = rng.randrange(3), rng.randint(0, 3)
+        low = [rng.randint(0, 9 - length * (axis == 0)), 0, 0]
+        low[1] = rng.randint(0, 9 - length * (axis == 1))
+        low[2] = rng.randint(1, max(1, size // 3))
+        while True:
+            cubes = {
+                tuple(low[i] + step * (axis == i) for i in range(3))
+                for step in range(length + 1)
+            }
+            if not cubes & occupied:
+                break
+            low[2] += 1
+
+        occupied |= cubes
+        high = [low[i] + length * (axis == i) for i in range(3)]
+        lines.append(",".join(map(str, low)) + "~" + ",".join(map(str, high)))
+
+    return "\n".join(lines)
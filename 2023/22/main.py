@@ -1,84 +1,120 @@
 #!/usr/bin/env python3
 """Sand Slabs"""
+import array
 import collections
-import operator
 
+from aoc import graph, mapped
 
-Brick = collections.namedtuple('Brick', ['mnx', 'mny', 'mnz', 'mxx', 'mxy', 'mxz'])
 
+class Bricks:
+    """bricks as one typed array per coordinate instead of a tuple each"""
 
-def read_and_parse(filename: str) -> list[Brick]:
-    """parse bricks as 6-'tuples' of ints"""
-    with open(filename, "r", encoding="utf-8") as file:
-        return [Brick(*map(int, line.replace('~', ',').split(',')))
-                for line in file.read().splitlines()]
+    FIELDS = "mnx", "mny", "mnz", "mxx", "mxy", "mxz"
 
+    def __init__(self, columns: list[array.array]):
+        self.mnx, self.mny, self.mnz, self.mxx, self.mxy, self.mxz = columns
 
-def build_graphs(bricks: list[Brick]) -> tuple[list[list[int]], list[set[int]]]:
-    """find prerequisite bricks of each brick"""
-    bricks.sort(key=operator.itemgetter(2))
-    num_bricks = ground_id = len(bricks)
+    def __len__(self) -> int:
+        return len(self.mnz)
 
-    heightmap = collections.defaultdict(lambda: (int(0), ground_id))
-    children = [[] for _ in range(num_bricks + 1)]
-    parents = [{ground_id} for _ in range(num_bricks)]
+    def sort_by_height(self):
+        """renumber bricks by their lower end"""
+        order = sorted(range(len(self)), key=self.mnz.__getitem__)
+        for field in self.FIELDS:
+            column = getattr(self, field)
+            sorted_column = map(column.__getitem__, order)
+            setattr(self, field, array.array(column.typecode, sorted_column))
 
-    for brick_id, brick in enumerate(bricks):
-        max_height = 0
-        surface = [(x, y)
-                   for x in range(brick.mnx, brick.mxx + 1)
-                   for y in range(brick.mny, brick.mxy + 1)]
 
-        for x_coord, y_coord in surface:
-            height, parent_id = heightmap[x_coord, y_coord]
-            if max_height < height:
-                max_height = height
-                parents[brick_id] = {parent_id}
-            elif max_height == height:
-                parents[brick_id].add(parent_id)
+def read_and_parse(filename: str) -> Bricks:
+    """parse bricks as 6 columns of ints, coordinates are small"""
+    return Bricks(mapped.read_columns(filename, len(Bricks.FIELDS), "i"))
 
-        for parent_id in parents[brick_id]:
-            children[parent_id].append(brick_id)
 
-        height = brick.mxz - brick.mnz + 1
-        for x_coord, y_coord in surface:
-            heightmap[x_coord, y_coord] = max_height + height, brick_id
+def find_surface(brick: tuple[int, ...]) -> list[tuple[int, int]]:
+    mnx, mny, _, mxx, mxy, _ = brick
+    return [(x, y) for x in range(mnx, mxx + 1) for y in range(mny, mxy + 1)]
 
-    return children, parents
 
+def drop(heightmap: dict, brick_id: int, brick: tuple[int, ...]) -> set[int]:
+    """let a brick fall onto the heightmap, returning those it rests on"""
+    surface = find_surface(brick)
 
-def solve_part_one(bricks: list[Brick]) -> int:
-    """count bricks that are safe to disintegrate"""
-    num_bricks = len(bricks)
-    children, parents = build_graphs(bricks)
-    unsafe = sum(1 for brick_children in children
-                 if any(len(parents[child]) == 1 for child in brick_children))
-    return num_bricks + 1 - unsafe
+    max_height, parents = 0, set()
+    for x_coord, y_coord in surface:
+        height, parent_id = heightmap[x_coord, y_coord]
+        if max_height < height:
+            max_height, parents = height, {parent_id}
+        elif max_height == height:
+            parents.add(parent_id)
+
+    _, _, mnz, _, _, mxz = brick
+    top = max_height + mxz - mnz + 1
+    for x_coord, y_coord in surface:
+        heightmap[x_coord, y_coord] = top, brick_id
+    return parents
 
 
-def solve_part_two(bricks: list[Brick]) -> int:
-    """sum up `calc` over all bricks"""
-    num_bricks = len(bricks)
-    children, parents = build_graphs(bricks)
+def build_graph(bricks: Bricks) -> graph.Graph:
+    """edges from each brick to those resting on it, the ground is the last"""
+    bricks.sort_by_height()
+    num_bricks = ground_id = len(bricks)
+
+    heightmap = collections.defaultdict(lambda: (int(0), ground_id))
+    columns = map(bricks.__getattribute__, Bricks.FIELDS)
+    parents = [
+        drop(heightmap, brick_id, brick) for brick_id, brick in enumerate(zip(*columns))
+    ]
 
-    def calc(src: int) -> int:
-        """count bricks that will fall if src is disintegrated"""
-        ans = 0
-        cnt = [0] * num_bricks
-        bfs = collections.deque([src])
+    return graph.Graph.from_edges(num_bricks + 1, (
+        (parent_id, brick_id)
+        for brick_id, brick_parents in enumerate(parents)
+        for parent_id in brick_parents
+    ))
 
-        while bfs:
-            brick_id = bfs.popleft()
 
-            for child_id in children[brick_id]:
-                cnt[child_id] += 1
-                if cnt[child_id] == len(parents[child_id]):
-                    ans += 1
-                    bfs.append(child_id)
+def count_parents(supports: graph.Graph) -> array.array:
+    num_parents = array.array("i", bytes(4 * len(supports)))
+    for child_id in supports.targets:
+        num_parents[child_id] += 1
+    return num_parents
 
-        return ans
 
-    return sum(map(calc, range(num_bricks)))
+def solve_part_one(bricks: Bricks) -> int:
+    """count bricks that are safe to disintegrate"""
+    supports = build_graph(bricks)
+    num_parents = count_parents(supports)
+    unsafe = sum(1 for brick_id in range(len(supports))
+                 if any(num_parents[child_id] == 1
+                        for child_id in supports.neighbors(brick_id)))
+    return len(supports) - unsafe
+
+
+def solve_part_two(bricks: Bricks) -> int:
+    """a brick falls without src exactly if src dominates it, i.e. lies on
+    every path from the ground, so sum up the strict dominators of bricks"""
+    supports = build_graph(bricks)
+    ground_id = len(supports) - 1
+    dominator = array.array("i", range(len(supports)))
+    depth = array.array("i", bytes(4 * len(supports)))
+
+    def common_dominator(first: int, second: int) -> int:
+        while first != second:
+            if depth[first] < depth[second]:
+                first, second = second, first
+            first = dominator[first]
+        return first
+
+    for brick_id in graph.topological_order(supports):
+        if brick_id != ground_id:
+            depth[brick_id] = depth[dominator[brick_id]] + 1
+        for child_id in supports.neighbors(brick_id):
+            if dominator[child_id] == child_id:
+                dominator[child_id] = brick_id
+            else:
+                dominator[child_id] = common_dominator(dominator[child_id], brick_id)
+
+    return sum(depth) - ground_id
 
 
 def test():
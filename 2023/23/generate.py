@@ -0,0 +1,126 @@
+"""A Long Walk input generator"""
+import collections
+import random
+
+from aoc import generate as common
+
+
+SCALE = "grid side"
+SIZES = (9, 17, 33, 65)
+
+
+SLOPES = {(-1, 0): "^", (0, 1): ">", (1, 0): "v", (0, -1): "<"}
+
+
+def carve_maze(rng: random.Random, side: int) -> list[list[str]]:
+    """a random spanning tree of corridors plus a few extra openings"""
+    grid = [["#"] * side for _ in range(side)]
+    cells = side // 2
+
+    stack, seen = [(0, 0)], {(0, 0)}
+    grid[1][1] = "."
+    while stack:
+        row, col = stack[-1]
+        options = [
+            (row + drow, col + dcol)
+            for drow, dcol in common.NEIGHBORS
+            if 0 <= row + drow < cells
+            and 0 <= col + dcol < cells
+            and (row + drow, col + dcol) not in seen
+        ]
+        if not options:
+            stack.pop()
+            continue
+        next_row, next_col = rng.choice(options)
+        grid[row + next_row + 1][col + next_col + 1] = "."
+        grid[2 * next_row + 1][2 * next_col + 1] = "."
+        seen.add((next_row, next_col))
+        stack.append((next_row, next_col))
+
+    walls = [
+        (row, col)
+        for row in range(1, side - 1)
+        for col in range(1, side - 1)
+        if grid[row][col] == "#" and (row % 2) != (col % 2)
+    ]
+    for row, col in rng.sample(walls, min(len(walls), cells // 2)):
+        grid[row][col] = "."
+
+    grid[0][1] = grid[side - 1][side - 2] = "."
+    return grid
+
+
+def find_open_neighbors(grid: list[list[str]], row: int, col: int) -> list[tuple]:
+    return [
+        (row + drow, col + dcol)
+        for drow, dcol in common.NEIGHBORS
+        if 0 <= row + drow < len(grid)
+        and 0 <= col + dcol < len(grid)
+        and grid[row + drow][col + dcol] != "#"
+    ]
+
+
+def find_corridors(grid: list[list[str]], special: set) -> list[tuple]:
+    """(source, target, cell before target) for every corridor between nodes"""
+    corridors = []
+    for source in special:
+        for cell in find_open_neighbors(grid, *source):
+            path = [source, cell]
+            while path[-1] not in special:
+                options = [
+                    neighbor
+                    for neighbor in find_open_neighbors(grid, *path[-1])
+                    if neighbor != path[-2]
+                ]
+                if not options:
+                    break
+                path.append(options[0])
+            if path[-1] in special and path[-1] != source:
+                corridors.append((source, path[-1], path[-2]))
+    return corridors
+
+
+def find_junctions(grid: list[list[str]], start: tuple, end: tuple) -> set:
+    """the start, the end and every open cell with more than two open neighbors"""
+    side = len(grid)
+    return {start, end} | {
+        (row, col)
+        for row in range(side)
+        for col in range(side)
+        if grid[row][col] != "#" and len(find_open_neighbors(grid, row, col)) > 2
+    }
+
+
+def measure_depths(corridors: list[tuple], start: tuple) -> dict:
+    """the number of corridors on a shortest walk from start to every node"""
+    adjacency = collections.defaultdict(list)
+    for source, target, _ in corridors:
+        adjacency[source].append(target)
+    distance = {start: 0}
+    queue = collections.deque([start])
+    while queue:
+        node = queue.popleft()
+        for next_node in adjacency[node]:
+            if next_node not in distance:
+                distance[next_node] = distance[node] + 1
+                queue.append(next_node)
+    return distance
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """a size x size maze whose slopes make every junction one-way"""
+    rng = random.Random(seed)
+    side = max(5, size) | 1
+    grid = carve_maze(rng, side)
+
+    start, end = (0, 1), (side - 1, side - 2)
+    corridors = find_corridors(grid, find_junctions(grid, start, end))
+    distance = measure_depths(corridors, start)
+
+    for source, target, (row, col) in corridors:
+        if (row, col) == source:
+            continue
+        if (distance[source], source) < (distance[target], target):
+            grid[row][col] = SLOPES[target[0] - row, target[1] - col]
+
+    return "\n".join(map("".join, grid))
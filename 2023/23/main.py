@@ -1,123 +1,102 @@
 #!/usr/bin/env python3
 """A Long Walk"""
-import sys
-import collections
-sys.setrecursionlimit(100_000)
+from aoc import counters, graph, mapped
+from aoc.grid import Grid
+
+
+def read_and_parse(filename: str) -> Grid:
+    with mapped.open_text(filename) as text:
+        return Grid(text)
+
+
+def find_endpoints(hiking_trails: Grid) -> tuple[int, int]:
+    rows, cols = hiking_trails.rows, hiking_trails.cols
+    return hiking_trails.index(0, 1), hiking_trails.index(rows - 1, cols - 2)
+
+
+def build_slope_graph(hiking_trails: Grid) -> graph.Graph:
+    up, right, down, left = hiking_trails.offsets
+    mapping = {ord('.'): hiking_trails.offsets,
+               ord('^'): (up,), ord('<'): (left,),
+               ord('>'): (right,), ord('v'): (down,)}
+    cells = hiking_trails.cells
+
+    def get_neighbors(cell: int) -> list[int]:
+        if cells[cell] == ord('#'):
+            return []
+        return [cell + offset for offset in mapping[cells[cell]]
+                if cells[cell + offset] != ord('#')]
+
+    return graph.Graph.from_function(len(cells), get_neighbors)
+
+
+def find_junctions(hiking_trails: Grid) -> list[int]:
+    """the endpoints first, then every cell where trails meet"""
+    start, end = find_endpoints(hiking_trails)
+    degrees = hiking_trails.open_graph().degrees()
+    return [start, end] + [cell for cell in hiking_trails.interior()
+                           if degrees[cell] > 2 and cell not in (start, end)]
+
+
+def condense_graph(trails: graph.Graph, junctions: list[int]) -> graph.Graph:
+    """one edge per trail between two junctions, weighted by its length"""
+    ids = {cell: node for node, cell in enumerate(junctions)}
+    edges = []
+    for source in junctions:
+        for cell in trails.neighbors(source):
+            previous, length = source, 1
+            while cell not in ids:
+                options = [next_cell for next_cell in trails.neighbors(cell)
+                           if next_cell != previous]
+                if not options:
+                    break
+                previous, cell, length = cell, options[0], length + 1
+            else:
+                if cell != source:
+                    edges.append((ids[source], ids[cell], length))
+    return graph.Graph.from_edges(len(junctions), edges)
+
+
+def backtrack_longest_hike(hikes: graph.Graph, start: int, end: int) -> int:
+    adjacency = [list(hikes.edges(node)) for node in range(len(hikes))]
+    seen = bytearray(len(hikes))
+    seen[start] = 1
+    longest_path = 0
+    counting = counters.ENABLED
 
+    def backtrack(node: int, length: int):
+        nonlocal longest_path
+        if counting:
+            counters.add("backtrack calls")
+        if node == end:
+            longest_path = max(longest_path, length)
 
-def read_and_parse(filename: str) -> list[str]:
-    with open(filename, "r", encoding="utf-8") as file:
-        return file.read().splitlines()
+        for next_node, edge in adjacency[node]:
+            if not seen[next_node]:
+                seen[next_node] = 1
+                backtrack(next_node, length + edge)
+                seen[next_node] = 0
 
+    backtrack(start, 0)
+    return longest_path
 
-def solve_part_one(hiking_trails) -> int:
-    rows, cols = len(hiking_trails), len(hiking_trails[0])
-    seen = {(int(0), int(1))}
 
-    def nei(row: int, col: int):
-        mapping = {'.': [(row - 1, col), (row, col - 1),
-                         (row, col + 1), (row + 1, col)],
-                   '^': [(row - 1, col)], '<': [(row, col - 1)],
-                   '>': [(row, col + 1)], 'v': [(row + 1, col)]}
-        return mapping[hiking_trails[row][col]]
+def find_longest_hike(hiking_trails: Grid, trails: graph.Graph) -> int:
+    """junctions 0 and 1 are start and end, slopes usually leave no cycles
+    and the longest hike is then a pass over a topological order"""
+    hikes = condense_graph(trails, find_junctions(hiking_trails))
+    try:
+        return graph.longest_paths(hikes, [0])[1]
+    except ValueError:
+        return backtrack_longest_hike(hikes, 0, 1)
 
-    longest_path = 0
 
-    def backtrack(row: int, col: int):
-        nonlocal longest_path
-        if row == rows - 1 and col == cols - 2:
-            longest_path = max(longest_path, len(seen))
-
-        for next_row, next_col in nei(row, col):
-            if (
-                0 <= next_row < rows and
-                0 <= next_col < cols and
-                hiking_trails[next_row][next_col] != '#' and
-                (next_row, next_col) not in seen
-            ):
-                seen.add((next_row, next_col))
-                backtrack(next_row, next_col)
-                seen.remove((next_row, next_col))
-
-    backtrack(0, 1)
-    return longest_path - 1
-
-
-def get_neighbors(hiking_trails, row: int, col: int):
-    nei = [(row - 1, col), (row, col - 1), (row, col + 1), (row + 1, col)]
-    for next_row, next_col in nei:
-        if (
-            0 <= next_row < len(hiking_trails) and
-            0 <= next_col < len(hiking_trails[0]) and
-            hiking_trails[next_row][next_col] != '#'
-        ):
-            yield next_row, next_col
-
-
-def build_graph(hiking_trails: list[str]):
-    rows, cols = len(hiking_trails), len(hiking_trails[0])
-    graph = collections.defaultdict(list)
-
-    for row in range(rows):
-        for col in range(cols):
-            if hiking_trails[row][col] == '#':
-                continue
-            for next_row, next_col in get_neighbors(hiking_trails, row, col):
-                graph[row, col].append((next_row, next_col))
-
-    return graph
-
-
-def condense_graph(special, hiking_trails):
-    condensed_graph = collections.defaultdict(list)
-    for special_row, special_col in special:
-        distance = {(special_row, special_col): 0}
-        queue = collections.deque([(special_row, special_col)])
-        while queue:
-            row, col = queue.popleft()
-            for next_row, next_col in get_neighbors(hiking_trails, row, col):
-                if (next_row, next_col) in distance:
-                    continue
-                if (next_row, next_col) in special:
-                    condensed_graph[special_row, special_col].append(
-                        ((next_row, next_col), distance[row, col] + 1))
-                else:
-                    distance[next_row, next_col] = distance[row, col] + 1
-                    queue.append((next_row, next_col))
-    return condensed_graph
-
-
-def solve_part_two(hiking_trails) -> int:
-    rows, cols = len(hiking_trails), len(hiking_trails[0])
-
-    graph = build_graph(hiking_trails)
-    special = {(0, 1), (rows - 1, cols - 2)}
-    for row in range(rows):
-        for col in range(cols):
-            if len(graph[row, col]) > 2:
-                special.add((row, col))
-    condensed_graph = condense_graph(special, hiking_trails)
+def solve_part_one(hiking_trails: Grid) -> int:
+    return find_longest_hike(hiking_trails, build_slope_graph(hiking_trails))
 
-    longest_path = 0
-    seen = {(0, 1)}
-    length = 0
-
-    def backtrack(node):
-        nonlocal longest_path, length
-        if node == (rows - 1, cols - 2):
-            longest_path = max(longest_path, length)
 
-        for next_node, edge in condensed_graph[node]:
-            if next_node in seen:
-                continue
-            length += edge
-            seen.add(next_node)
-            backtrack(next_node)
-            seen.remove(next_node)
-            length -= edge
-
-    backtrack((0, 1))
-    return longest_path
+def solve_part_two(hiking_trails: Grid) -> int:
+    return find_longest_hike(hiking_trails, hiking_trails.open_graph())
 
 
 def test():
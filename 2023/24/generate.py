@@ -0,0 +1,25 @@
+"""Never Tell Me The Odds input generator"""
+import random
+
+
+SCALE = "hailstone count"
+SIZES = (50, 100, 200, 400)
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """size hailstones that a single thrown rock hits at distinct times"""
+    rng = random.Random(seed)
+    rock = [rng.randint(25 * 10**13, 35 * 10**13) for _ in range(3)]
+    rock_velocity = [rng.randint(-300, 300) for _ in range(3)]
+
+    lines = []
+    for time in rng.sample(range(10**9, 10**11), size):
+        velocity = [rng.choice([-1, 1]) * rng.randint(1, 300) for _ in range(3)]
+        position = [
+            rock[i] + time * (rock_velocity[i] - velocity[i]) for i in range(3)
+        ]
+        lines.append(
+            ", ".join(map(str, position)) + " @ " + ", ".join(map(str, velocity))
+        )
+
+    return "\n".join(lines)
@@ -1,41 +1,64 @@
 #!/usr/bin/env python3
 """Never Tell Me The Odds"""
-import itertools
-import collections
+import array
 
+from aoc import mapped
 
-Ray = collections.namedtuple("Ray", ["x", "y", "z", "vx", "vy", "vz"])
 
+class Rays:
+    """hailstones as one typed array per coordinate instead of a tuple each"""
 
-def read_and_parse(filename: str) -> list[Ray]:
-    with open(filename, "r", encoding="utf-8") as file:
-        return [Ray(*map(int, line.replace(' @ ', ', ').split(', ')))
-                for line in file.read().splitlines()]
+    FIELDS = "x", "y", "z", "vx", "vy", "vz"
 
+    def __init__(self, columns: list[array.array]):
+        self.x, self.y, self.z, self.vx, self.vy, self.vz = columns
 
-def xy_intersect(fst_ray: Ray, snd_ray: Ray,
-                 lower_bound: int, upper_bound: int) -> bool:
-    det = fst_ray.vx * snd_ray.vy - fst_ray.vy * snd_ray.vx
-    if det == 0:
-        return False
+    def __len__(self) -> int:
+        return len(self.x)
 
-    fst_time = ((snd_ray.x - fst_ray.x) * snd_ray.vy -
-                (snd_ray.y - fst_ray.y) * snd_ray.vx) / det
-    if fst_time < 0:
-        return False
+    def hailstone(self, index: int) -> tuple[int, ...]:
+        return tuple(getattr(self, field)[index] for field in self.FIELDS)
 
-    x_coord = fst_ray.x + fst_time * fst_ray.vx
-    y_coord = fst_ray.y + fst_time * fst_ray.vy
-    if (x_coord - snd_ray.x) / snd_ray.vx < 0:
-        return False
+    def after(self, index: int) -> tuple[array.array, ...]:
+        """every column sliced past the hailstone at index"""
+        return tuple(getattr(self, field)[index + 1 :] for field in self.FIELDS)
 
-    return (lower_bound <= x_coord <= upper_bound and
-            lower_bound <= y_coord <= upper_bound)
 
+def read_and_parse(filename: str) -> Rays:
+    return Rays(mapped.read_columns(filename, len(Rays.FIELDS)))
 
-def solve_part_one(rays: list[Ray], lower_bound: int, upper_bound: int) -> int:
-    return sum(xy_intersect(fst_ray, snd_ray, lower_bound, upper_bound)
-               for fst_ray, snd_ray in itertools.combinations(rays, 2))
+
+def count_xy_intersections(rays: Rays, fst: int,
+                           lower_bound: int, upper_bound: int) -> int:
+    """intersections of ray fst with every later ray, a column slice at a time"""
+    x, y, _, vx, vy, _ = rays.hailstone(fst)
+
+    def xy_intersect(snd_x: int, snd_y: int, _snd_z: int,
+                     snd_vx: int, snd_vy: int, _snd_vz: int) -> bool:
+        det = vx * snd_vy - vy * snd_vx
+        if det == 0:
+            return False
+
+        fst_time = ((snd_x - x) * snd_vy - (snd_y - y) * snd_vx) / det
+        if fst_time < 0:
+            return False
+
+        x_coord = x + fst_time * vx
+        y_coord = y + fst_time * vy
+        if (x_coord - snd_x) / snd_vx < 0:
+            return False
+
+        return (lower_bound <= x_coord <= upper_bound and
+                lower_bound <= y_coord <= upper_bound)
+
+    return sum(map(xy_intersect, *rays.after(fst)))
+
+
+def solve_part_one(
+    rays: Rays, lower_bound: int = 2 * 10**14, upper_bound: int = 4 * 10**14
+) -> int:
+    return sum(count_xy_intersections(rays, fst, lower_bound, upper_bound)
+               for fst in range(len(rays)))
 
 
 def test():
@@ -48,7 +71,7 @@ def test():
 
 def main():
     rays = read_and_parse("input.txt")
-    part_one_answer = solve_part_one(rays, 2 * 10**14, 4 * 10**14)
+    part_one_answer = solve_part_one(rays)
     print(f"Part One: {part_one_answer}")
     # part_two_answer = solve_part_two(rays)
     # print(f"Part Two: {part_two_answer}")
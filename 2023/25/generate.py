@@ -0,0 +1,47 @@
+"""Snowverload input generator"""
+import collections
+import itertools
+import random
+import string
+
+
+SCALE = "component count"
+SIZES = (100, 200, 400, 800)
+
+
+def connect_half(rng: random.Random, half: list[str], wires: dict):
+    """wire every component to its predecessor and four random others"""
+    for i, node in enumerate(half):
+        others = [half[i - 1]] + rng.sample(half[:i] + half[i + 1 :], 4)
+        for other in others:
+            wires[tuple(sorted([node, other]))] = None
+
+
+def list_wires(rng: random.Random, wires: dict) -> list[str]:
+    """each wire listed once under a randomly chosen end"""
+    listed = collections.defaultdict(list)
+    for wire in wires:
+        src, dst = rng.sample(wire, 2)
+        listed[src].append(dst)
+    return [f"{src}: {' '.join(dsts)}" for src, dsts in listed.items()]
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """two well-connected halves of about size components joined by three wires"""
+    rng = random.Random(seed)
+    names = [
+        "".join(letters)
+        for letters in itertools.product(string.ascii_lowercase, repeat=3)
+    ]
+    rng.shuffle(names)
+
+    wires = {}
+    halves = []
+    for half_size in (max(8, size // 2), max(8, size - size // 2)):
+        half = [names.pop() for _ in range(half_size)]
+        connect_half(rng, half, wires)
+        halves.append(half)
+
+    for fst, snd in zip(rng.sample(halves[0], 3), rng.sample(halves[1], 3)):
+        wires[fst, snd] = None
+    return "\n".join(list_wires(rng, wires))
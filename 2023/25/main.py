@@ -4,15 +4,16 @@ import random
 import networkx as nx
 from networkx.algorithms.flow import shortest_augmenting_path
 
+from aoc import mapped
+
 
 def read_and_parse(filename: str):
-    with open(filename, "r", encoding="utf-8") as file:
-        graph = nx.Graph()
-        for line in file.read().splitlines():
-            src, dsts = line.split(': ')
-            for dst in dsts.split():
-                graph.add_edge(src, dst, capacity=1)
-        return graph
+    graph = nx.Graph()
+    for line in mapped.read_lines(filename):
+        src, dsts = line.split(b': ')
+        for dst in dsts.split():
+            graph.add_edge(src, dst, capacity=1)
+    return graph
 
 
 def solve_part_one(graph) -> int:
@@ -0,0 +1,351 @@
+"""Command line entry point: python -m aoc run 2023 --days 1-25"""
+import argparse
+import pathlib
+import sys
+import time
+
+from aoc import (
+    batch,
+    bench,
+    complexity,
+    daemon,
+    days,
+    differential,
+    generate,
+    profiling,
+    readme,
+    runner,
+    scheduler,
+    stream,
+)
+
+
+def positive_int(text: str) -> int:
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return value
+
+
+def select_days(year: int, spec: str | None, filename: str) -> list[int]:
+    """keep the days whose module imports and whose input exists"""
+    selected = []
+    for day in days.parse_days(spec) if spec else days.find_days(year):
+        try:
+            module = days.load(year, day)
+        except ImportError as error:
+            print(f"Day {day:02d}: skipped, {error}", file=sys.stderr)
+            continue
+        if not days.find_input(module, filename).is_file():
+            print(f"Day {day:02d}: skipped, no {filename}", file=sys.stderr)
+            continue
+        selected.append(day)
+    return selected
+
+
+def run(args: argparse.Namespace):
+    selected = select_days(args.year, args.days, args.input)
+    if args.jobs == 1:
+        timings = runner.run_days(
+            args.year, selected, args.input, args.cache, args.profile
+        )
+    else:
+        timings = scheduler.run_days(
+            args.year,
+            selected,
+            args.input,
+            args.jobs or None,
+            cached=args.cache,
+            profile=args.profile,
+        )
+
+    start = time.perf_counter()
+    collected = []
+    for timing in timings:
+        collected.append(timing)
+        if timing.answer is not None:
+            print(runner.format_answer(timing))
+    print()
+    print(runner.format_table(collected))
+    for timing in collected:
+        if timing.counts:
+            print(runner.format_counts(timing))
+    print(f"wall time: {runner.format_seconds(time.perf_counter() - start)}")
+    if args.profile:
+        print(f"profiles: {args.profile}")
+    else:
+        scheduler.record_runtimes(args.year, args.input, collected)
+
+
+def run_streaming(args: argparse.Namespace):
+    timings = []
+    for day in select_days(args.year, args.days, args.input):
+        if not hasattr(days.load(args.year, day), "stream_and_parse"):
+            print(f"Day {day:02d}: skipped, no streaming parser", file=sys.stderr)
+            continue
+        for timing in stream.run_day(args.year, day, args.input, args.jobs or None):
+            timings.append(timing)
+            print(runner.format_answer(timing))
+    print()
+    print(runner.format_table(timings))
+
+
+def solve_batch(args: argparse.Namespace):
+    for result in batch.solve_inputs(
+        args.year, args.day, args.input_paths, args.jobs or None
+    ):
+        print(batch.format_result(result), flush=True)
+
+
+def serve(args: argparse.Namespace):
+    try:
+        server = daemon.Server(args.socket, args.capacity)
+    except RuntimeError as error:
+        sys.exit(str(error))
+    with server:
+        print(f"listening on {args.socket}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+def ask(args: argparse.Namespace):
+    try:
+        print(daemon.ask(args.day, args.part, args.input_path, args.year, args.socket))
+    except RuntimeError as error:
+        sys.exit(str(error))
+
+
+def run_benchmarks(args: argparse.Namespace):
+    selected = select_days(args.year, args.days, args.input)
+    measurements = []
+    for day in selected:
+        measurements.extend(
+            bench.bench_day(args.year, day, args.input, args.warmup, args.repeat)
+        )
+
+    baseline = bench.load_baseline(args.baseline)
+    print(bench.format_table(args.year, args.input, measurements, baseline))
+
+    if args.readme:
+        readme.write_readme(args.year, args.input, measurements)
+    if args.badges:
+        try:
+            readme.draw_badges(args.year, measurements)
+        except ImportError:
+            print("badges skipped, they need Pillow", file=sys.stderr)
+
+    if args.save:
+        bench.save_baseline(args.year, args.input, measurements, args.baseline)
+        return
+
+    regressions = bench.find_regressions(
+        args.year, args.input, measurements, baseline, args.margin
+    )
+    for measurement, ratio in regressions:
+        print(
+            f"Day {measurement.day:02d} {measurement.phase} is {ratio:.2f}x slower",
+            file=sys.stderr,
+        )
+    if regressions:
+        sys.exit(1)
+
+
+def write_inputs(args: argparse.Namespace):
+    for day in days.parse_days(args.days) if args.days else days.find_days(args.year):
+        for size in args.sizes:
+            print(generate.write_input(args.year, day, size, args.seed))
+
+
+def report_complexity(args: argparse.Namespace):
+    fits = []
+    for day in days.parse_days(args.days) if args.days else days.find_days(args.year):
+        fits.extend(complexity.fit_day(args.year, day, args.sizes, args.repeat))
+    print(complexity.format_table(fits))
+
+
+def compare_implementations(args: argparse.Namespace):
+    comparisons = []
+    for day in days.parse_days(args.days) if args.days else days.find_days(args.year):
+        if hasattr(days.load(args.year, day), "DIFFERENTIAL"):
+            comparisons.extend(
+                differential.compare_day(args.year, day, args.sizes, args.repeat)
+            )
+    print(differential.format_table(comparisons))
+    if not all(comparison.agree for comparison in comparisons):
+        sys.exit(1)
+
+
+def add_run_parser(subparsers):
+    parser = subparsers.add_parser("run", help="solve days and time each phase")
+    parser.add_argument("year", type=int)
+    parser.add_argument("--days", help="e.g. 1-25 or 1,3,5-7 (default: all)")
+    parser.add_argument("--input", default="input.txt", help="input file name")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="worker processes, slowest days are dispatched first (0: all cores)",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="load parsed inputs from .aoc_cache/ when the input and parser match",
+    )
+    parser.add_argument(
+        "--profile",
+        type=pathlib.Path,
+        nargs="?",
+        const=profiling.PROFILE_DIRECTORY,
+        help="save cProfile stats and allocation snapshots of every phase "
+        "(default directory: .aoc_profiles/)",
+    )
+    parser.set_defaults(handler=run)
+
+
+def add_stream_parser(subparsers):
+    parser = subparsers.add_parser(
+        "stream", help="solve line-by-line days in constant memory"
+    )
+    parser.add_argument("year", type=int)
+    parser.add_argument("--days", help="e.g. 1-25 or 1,3,5-7 (default: all)")
+    parser.add_argument("--input", default="input.txt", help="input file name")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=0,
+        help="worker processes summing chunks of the input (0: all cores)",
+    )
+    parser.set_defaults(handler=run_streaming)
+
+
+def add_batch_parser(subparsers):
+    parser = subparsers.add_parser(
+        "batch", help="solve many inputs of one day, printing JSON lines"
+    )
+    parser.add_argument("year", type=int)
+    parser.add_argument("day", type=int)
+    parser.add_argument("input_paths", nargs="+")
+    parser.add_argument(
+        "--jobs", type=int, default=1, help="worker processes (0: all cores)"
+    )
+    parser.set_defaults(handler=solve_batch)
+
+
+def add_serve_parser(subparsers):
+    parser = subparsers.add_parser(
+        "serve", help="keep solutions and parsed inputs warm behind a Unix socket"
+    )
+    parser.add_argument("--socket", type=pathlib.Path, default=daemon.SOCKET_PATH)
+    parser.add_argument(
+        "--capacity",
+        type=int,
+        default=daemon.CAPACITY,
+        help="parsed inputs kept resident (default: %(default)s)",
+    )
+    parser.set_defaults(handler=serve)
+
+
+def add_ask_parser(subparsers):
+    parser = subparsers.add_parser("ask", help="solve through a running server")
+    parser.add_argument("day", type=int)
+    parser.add_argument("part", type=int, choices=sorted(daemon.PARTS))
+    parser.add_argument("input_path")
+    parser.add_argument("--year", type=int)
+    parser.add_argument("--socket", type=pathlib.Path, default=daemon.SOCKET_PATH)
+    parser.set_defaults(handler=ask)
+
+
+def add_bench_parser(subparsers):
+    parser = subparsers.add_parser(
+        "bench", help="time each phase repeatedly and compare with a baseline"
+    )
+    parser.add_argument("year", type=int)
+    parser.add_argument("--days", help="e.g. 1-25 or 1,3,5-7 (default: all)")
+    parser.add_argument("--input", default="input.txt", help="input file name")
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--repeat", type=positive_int, default=5)
+    parser.add_argument(
+        "--margin",
+        type=float,
+        default=0.2,
+        help="allowed relative slowdown of a median (default: 0.2)",
+    )
+    parser.add_argument("--baseline", type=pathlib.Path, default=bench.BASELINE_FILE)
+    parser.add_argument(
+        "--save", action="store_true", help="store the results as the new baseline"
+    )
+    parser.add_argument(
+        "--readme",
+        action="store_true",
+        help="write the medians and peaks into the runtime table of README.md",
+    )
+    parser.add_argument(
+        "--badges",
+        action="store_true",
+        help="draw the total median of every day onto its tile (needs Pillow)",
+    )
+    parser.set_defaults(handler=run_benchmarks)
+
+
+def add_generate_parser(subparsers):
+    parser = subparsers.add_parser(
+        "generate", help="write seeded synthetic inputs as generated-SIZE.txt"
+    )
+    parser.add_argument("year", type=int)
+    parser.add_argument("sizes", type=int, nargs="+")
+    parser.add_argument("--days", help="e.g. 1-25 or 1,3,5-7 (default: all)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.set_defaults(handler=write_inputs)
+
+
+def add_complexity_parser(subparsers):
+    parser = subparsers.add_parser(
+        "complexity", help="fit time and memory growth on generated inputs"
+    )
+    parser.add_argument("year", type=int)
+    parser.add_argument("--days", help="e.g. 1-25 or 1,3,5-7 (default: all)")
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", help="input sizes (default: per day)"
+    )
+    parser.add_argument("--repeat", type=positive_int, default=3)
+    parser.set_defaults(handler=report_complexity)
+
+
+def add_differential_parser(subparsers):
+    parser = subparsers.add_parser(
+        "differential",
+        help="check fast solvers against their references and find the crossover",
+    )
+    parser.add_argument("year", type=int)
+    parser.add_argument("--days", help="e.g. 1-25 or 1,3,5-7 (default: all)")
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", help="input sizes (default: per day)"
+    )
+    parser.add_argument("--repeat", type=positive_int, default=3)
+    parser.set_defaults(handler=compare_implementations)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="aoc")
+    subparsers = parser.add_subparsers(required=True)
+    add_run_parser(subparsers)
+    add_stream_parser(subparsers)
+    add_batch_parser(subparsers)
+    add_serve_parser(subparsers)
+    add_ask_parser(subparsers)
+    add_bench_parser(subparsers)
+    add_generate_parser(subparsers)
+    add_complexity_parser(subparsers)
+    add_differential_parser(subparsers)
+    return parser
+
+
+def main():
+    args = build_parser().parse_args()
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main()
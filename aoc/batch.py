@@ -0,0 +1,66 @@
+"""Answers for many inputs of one day from a single import of its module
+
+Module level setup such as compiled patterns and lookup tables is paid once
+per process instead of once per input. With several jobs every worker of
+the pool imports the day once and then solves its share of the inputs.
+"""
+import json
+import multiprocessing
+import os
+import tempfile
+from typing import Any, Iterable
+
+from aoc import days, runner
+
+
+def solve_input(year: int, day: int, path: str) -> dict[str, Any]:
+    """answers of every part for one input, or the error that stopped it"""
+    module = days.load(year, day)
+    result = {"day": day, "input_path": path}
+    try:
+        parsed = module.read_and_parse(path)
+        answers = []
+        for phase in ("part one", "part two"):
+            solver = getattr(module, runner.PHASES[phase], None)
+            if solver is not None:
+                answers.append(solver(*days.as_arguments(parsed)))
+        result["answers"] = answers
+    except Exception as error:  # pylint: disable=broad-exception-caught
+        result["error"] = f"{type(error).__name__}: {error}"
+    return result
+
+
+def __solve_input(task: tuple[int, int, str]) -> dict[str, Any]:
+    return solve_input(*task)
+
+
+def solve_inputs(
+    year: int, day: int, paths: Iterable[str], jobs: int | None = 1
+) -> Iterable[dict[str, Any]]:
+    """results in the order of paths, jobs=None uses every core"""
+    tasks = [(year, day, os.path.abspath(path)) for path in paths]
+    if jobs == 1:
+        yield from map(__solve_input, tasks)
+        return
+    with multiprocessing.Pool(jobs, days.load, (year, day)) as pool:
+        yield from pool.imap(__solve_input, tasks)
+
+
+def format_result(result: dict[str, Any]) -> str:
+    """a JSON line, answers that are not numbers or strings become strings"""
+    return json.dumps(result, default=str)
+
+
+def test():
+    directory = days.find_directory(2023, 1)
+    paths = [directory / "example-1.txt", directory / "example-2.txt"]
+    with tempfile.TemporaryDirectory() as missing:
+        paths.append(os.path.join(missing, "input.txt"))
+        results = list(solve_inputs(2023, 1, paths))
+        assert list(solve_inputs(2023, 1, paths, jobs=2)) == results
+
+    assert [result["input_path"] for result in results] == list(map(str, paths))
+    assert results[0]["answers"] == [142, 142]
+    assert results[1]["error"].startswith("ValueError")
+    assert results[2]["error"].startswith("FileNotFoundError")
+    assert json.loads(format_result(results[0])) == results[0]
@@ -0,0 +1,188 @@
+"""Repeated timing of every phase against a stored baseline"""
+import collections
+import json
+import math
+import pathlib
+import statistics
+import time
+import tracemalloc
+import types
+from typing import Any, Callable, Iterable
+
+from aoc import days, runner
+
+
+BASELINE_FILE = days.ROOT / ".aoc_baseline.json"
+
+
+Measurement = collections.namedtuple(
+    "Measurement", ["day", "phase", "median", "p95", "peak"]
+)
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    """nearest-rank percentile"""
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(len(ordered) * fraction))
+    return ordered[rank - 1]
+
+
+def measure(
+    function: Callable, args: tuple, warmup: int, repeat: int
+) -> tuple[Any, list[float], int]:
+    """returns the result, the timed samples and the peak traced memory"""
+    if repeat < 1:
+        raise ValueError(f"repeat must be at least 1, got {repeat}")
+    for _ in range(warmup):
+        function(*args)
+
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function(*args)
+        samples.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        function(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return result, samples, peak
+
+
+def bench_day(
+    year: int, day: int, filename: str = "input.txt", warmup: int = 1, repeat: int = 5
+) -> Iterable[Measurement]:
+    module = days.load(year, day)
+    path = days.find_input(module, filename)
+    yield from bench_path(module, day, path, warmup, repeat)
+
+
+def bench_path(
+    module: types.ModuleType,
+    day: int,
+    path: pathlib.Path,
+    warmup: int = 1,
+    repeat: int = 5,
+) -> Iterable[Measurement]:
+    """measure every phase of a day module on an arbitrary input file"""
+    parsed, samples, peak = measure(module.read_and_parse, (str(path),), warmup, repeat)
+    yield Measurement(
+        day, "parse", statistics.median(samples), percentile(samples, 0.95), peak
+    )
+
+    for phase in ("part one", "part two"):
+        if (solver := getattr(module, runner.PHASES[phase], None)) is None:
+            continue
+        _, samples, peak = measure(solver, days.as_arguments(parsed), warmup, repeat)
+        yield Measurement(
+            day, phase, statistics.median(samples), percentile(samples, 0.95), peak
+        )
+
+
+def find_key(year: int, measurement: Measurement, filename: str) -> str:
+    return f"{days.find_key(year, measurement.day, filename)}:{measurement.phase}"
+
+
+def load_baseline(path: pathlib.Path = BASELINE_FILE) -> dict[str, dict]:
+    if not path.is_file():
+        return {}
+    with open(path, "r", encoding="utf-8") as file:
+        return json.load(file)
+
+
+def save_baseline(
+    year: int,
+    filename: str,
+    measurements: Iterable[Measurement],
+    path: pathlib.Path = BASELINE_FILE,
+):
+    """merge the measurements into the stored baseline"""
+    baseline = load_baseline(path)
+    for measurement in measurements:
+        baseline[find_key(year, measurement, filename)] = {
+            "median": measurement.median,
+            "p95": measurement.p95,
+            "peak": measurement.peak,
+        }
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(baseline, file, indent=2, sort_keys=True)
+        file.write("\n")
+
+
+def find_regressions(
+    year: int,
+    filename: str,
+    measurements: Iterable[Measurement],
+    baseline: dict[str, dict],
+    margin: float,
+) -> list[tuple[Measurement, float]]:
+    """phases whose median grew by more than margin, with the observed ratio"""
+    regressions = []
+    for measurement in measurements:
+        if (reference := baseline.get(find_key(year, measurement, filename))) is None:
+            continue
+        ratio = measurement.median / reference["median"]
+        if ratio > 1 + margin:
+            regressions.append((measurement, ratio))
+    return regressions
+
+
+def format_bytes(size: int) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+
+def format_table(
+    year: int,
+    filename: str,
+    measurements: Iterable[Measurement],
+    baseline: dict[str, dict],
+) -> str:
+    lines = [["day", "phase", "median", "p95", "peak", "baseline", "change"]]
+    for measurement in measurements:
+        reference = baseline.get(find_key(year, measurement, filename))
+        lines.append(
+            [
+                f"{measurement.day:02d}",
+                measurement.phase,
+                runner.format_seconds(measurement.median),
+                runner.format_seconds(measurement.p95),
+                format_bytes(measurement.peak),
+                runner.format_seconds(reference and reference["median"]),
+                f"{measurement.median / reference['median'] - 1:+.0%}"
+                if reference
+                else "-",
+            ]
+        )
+
+    widths = [max(map(len, column)) for column in zip(*lines)]
+    return "\n".join(
+        "  ".join(cell.rjust(width) for cell, width in zip(line, widths))
+        for line in lines
+    )
+
+
+def test():
+    assert percentile([3, 1, 2, 4], 0.5) == 2
+    assert percentile([3, 1, 2, 4], 0.95) == 4
+
+    measurements = list(bench_day(2023, 1, "example-1.txt", 0, 3))
+    assert [measurement.phase for measurement in measurements] == list(runner.PHASES)
+    assert all(measurement.peak > 0 for measurement in measurements)
+
+    key = find_key(2023, measurements[0], "example-1.txt")
+    assert key == "2023/01/example-1.txt:parse"
+
+    fast = {key: {"median": measurements[0].median * 100}}
+    assert not find_regressions(2023, "example-1.txt", measurements, fast, 0.2)
+    slow = {key: {"median": measurements[0].median / 100}}
+    assert find_regressions(2023, "example-1.txt", measurements, slow, 0.2)
+
+    table = format_table(2023, "example-1.txt", measurements, slow)
+    assert len(table.splitlines()) == 4
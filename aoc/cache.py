@@ -0,0 +1,106 @@
+"""On-disk cache of parsed inputs keyed by input and parser contents"""
+import hashlib
+import inspect
+import os
+import pathlib
+import pickle
+import sys
+import tempfile
+import types
+from typing import Any
+
+from aoc import days
+
+
+CACHE_DIRECTORY = days.ROOT / ".aoc_cache"
+SIZE_LIMIT = 256 * 2**20
+
+
+def find_sources(module: types.ModuleType) -> list[str]:
+    """the day's own file and every shared module it reaches, directly or
+    through other shared modules"""
+    sources, pending, seen = set(), [module], {module.__name__}
+    while pending:
+        current = pending.pop()
+        sources.add(inspect.getsourcefile(current))
+        for value in vars(current).values():
+            name = getattr(value, "__module__", None) or getattr(value, "__name__", "")
+            if not isinstance(name, str) or name.split(".")[0] != "aoc":
+                continue
+            if name not in seen and name in sys.modules:
+                seen.add(name)
+                pending.append(sys.modules[name])
+    return sorted(sources)
+
+
+def find_key(module: types.ModuleType, path: pathlib.Path) -> str:
+    digest = hashlib.sha256(sys.version.encode())
+    for source in find_sources(module):
+        digest.update(pathlib.Path(source).read_bytes())
+    digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def evict(directory: pathlib.Path, limit: int):
+    """drop least recently used entries until the cache fits the limit"""
+    entries = sorted(
+        (entry.stat().st_mtime, entry.stat().st_size, entry)
+        for entry in directory.glob("*.pickle")
+    )
+    total = sum(size for _, size, _ in entries)
+    for _, size, entry in entries:
+        if total <= limit:
+            break
+        entry.unlink(missing_ok=True)
+        total -= size
+
+
+def store(entry: pathlib.Path, parsed: Any, limit: int):
+    entry.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir=entry.parent, delete=False) as file:
+        pickle.dump(parsed, file, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(file.name, entry)
+    evict(entry.parent, limit)
+
+
+def read_and_parse(
+    module: types.ModuleType,
+    path: pathlib.Path,
+    directory: pathlib.Path = CACHE_DIRECTORY,
+    limit: int = SIZE_LIMIT,
+) -> Any:
+    """parse through the cache, a hit costs a single read and unpickling"""
+    entry = directory / f"{find_key(module, path)}.pickle"
+    try:
+        data = entry.read_bytes()
+    except FileNotFoundError:
+        parsed = module.read_and_parse(str(path))
+        store(entry, parsed, limit)
+        return parsed
+
+    os.utime(entry)
+    return pickle.loads(data)
+
+
+def test():
+    with tempfile.TemporaryDirectory() as raw_directory:
+        directory = pathlib.Path(raw_directory)
+
+        for day in days.find_days(2023):
+            module = days.load(2023, day)
+            path = min(days.find_directory(2023, day).glob("example*.txt"))
+            parsed = read_and_parse(module, path, directory)
+            assert len(list(directory.glob("*.pickle"))) == day
+            loaded = read_and_parse(module, path, directory)
+            assert len(list(directory.glob("*.pickle"))) == day
+            assert module.solve_part_one(
+                *days.as_arguments(loaded)
+            ) == module.solve_part_one(*days.as_arguments(parsed))
+
+        sources = find_sources(days.load(2023, 3))
+        for shared in ("grid.py", "graph.py"):
+            suffix = os.path.join("aoc", shared)
+            assert any(source.endswith(suffix) for source in sources)
+
+        evict(directory, 0)
+        assert not list(directory.glob("*.pickle"))
@@ -0,0 +1,97 @@
+"""Empirical scaling exponents of every phase on generated inputs"""
+import collections
+import math
+import pathlib
+import tempfile
+from typing import Iterable, Sequence
+
+from aoc import bench, days, generate
+
+
+Fit = collections.namedtuple("Fit", ["day", "phase", "time", "memory", "scale"])
+
+
+def fit_exponent(sizes: Sequence[float], values: Sequence[float]) -> float:
+    """least-squares slope of log(value) against log(size)"""
+    xs = [math.log(size) for size in sizes]
+    ys = [math.log(max(value, 1e-9)) for value in values]
+    mean_x, mean_y = sum(xs) / len(xs), sum(ys) / len(ys)
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    variance = sum((x - mean_x) ** 2 for x in xs)
+    return covariance / variance
+
+
+def fit_day(
+    year: int, day: int, sizes: Sequence[int] | None = None, repeat: int = 3
+) -> Iterable[Fit]:
+    """measure the day on geometrically growing inputs and fit each phase"""
+    module = days.load(year, day)
+    generator = days.load(year, day, "generate")
+    sizes = sizes or generator.SIZES
+
+    measurements = []
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            path = pathlib.Path(directory) / generate.find_filename(size)
+            path.write_text(generator.generate(size), encoding="utf-8")
+            measurements.extend(bench.bench_path(module, day, path, 0, repeat))
+
+    return fit_measurements(sizes, measurements, generator.SCALE)
+
+
+def fit_measurements(
+    sizes: Sequence[int], measurements: Iterable[bench.Measurement], scale: str
+) -> Iterable[Fit]:
+    """measurements of one day in the order of sizes, phase by phase"""
+    series = collections.defaultdict(list)
+    for measurement in measurements:
+        series[measurement.day, measurement.phase].append(measurement)
+
+    for (day, phase), phases in series.items():
+        yield Fit(
+            day,
+            phase,
+            fit_exponent(sizes, [measurement.median for measurement in phases]),
+            fit_exponent(sizes, [measurement.peak for measurement in phases]),
+            scale,
+        )
+
+
+def format_table(fits: Iterable[Fit]) -> str:
+    lines = [["day", "phase", "time", "memory", "n"]]
+    for fit in fits:
+        lines.append(
+            [
+                f"{fit.day:02d}",
+                fit.phase,
+                f"O(n^{fit.time:.1f})",
+                f"O(n^{fit.memory:.1f})",
+                fit.scale,
+            ]
+        )
+
+    widths = [max(map(len, column)) for column in zip(*lines)]
+    return "\n".join(
+        "  ".join(cell.ljust(width) for cell, width in zip(line, widths)).rstrip()
+        for line in lines
+    )
+
+
+def test():
+    assert round(fit_exponent([1, 2, 4, 8], [3, 12, 48, 192]), 6) == 2
+    assert round(fit_exponent([10, 100], [5, 5]), 6) == 0
+
+    sizes = [250, 1_000, 4_000]
+    measurements = [
+        bench.Measurement(1, phase, size**exponent / 1e6, 0, size * 64)
+        for size in sizes
+        for phase, exponent in [("parse", 1), ("part one", 1), ("part two", 2)]
+    ]
+    fits = list(fit_measurements(sizes, measurements, "line count"))
+    assert [fit.phase for fit in fits] == ["parse", "part one", "part two"]
+    assert [round(fit.time, 6) for fit in fits] == [1, 1, 2]
+    assert all(round(fit.memory, 6) == 1 for fit in fits)
+
+    table = format_table(fits).splitlines()
+    assert table[0].split() == ["day", "phase", "time", "memory", "n"]
+    assert table[1].startswith("01   parse")
@@ -0,0 +1,48 @@
+"""Counts of algorithmic events, enabled with AOC_COUNTERS=1
+
+Hot loops read ENABLED into a local once and guard every add with it, so a
+disabled run pays a single local test per event and nothing else.
+"""
+import collections
+import os
+
+from aoc import days
+
+
+ENABLED = os.environ.get("AOC_COUNTERS", "") not in ("", "0")
+
+COUNTS = collections.Counter()
+
+
+def add(name: str, amount: int = 1):
+    COUNTS[name] += amount
+
+
+def reset():
+    COUNTS.clear()
+
+
+def snapshot() -> dict[str, int] | None:
+    """counts since the last reset, None when counting is disabled"""
+    return dict(sorted(COUNTS.items())) if ENABLED else None
+
+
+def format_counts(counts: dict[str, int]) -> str:
+    return ", ".join(f"{name}: {count:_}" for name, count in counts.items())
+
+
+def test():
+    global ENABLED  # pylint: disable=global-statement
+    enabled, ENABLED = ENABLED, True
+    try:
+        module = days.load(2023, 17)
+        reset()
+        path = days.find_input(module, "example-1.txt")
+        module.solve_part_one(module.read_and_parse(str(path)))
+        counts = snapshot()
+    finally:
+        ENABLED = enabled
+        reset()
+
+    assert counts["queue pushes"] >= counts["queue pops"] > 0
+    assert format_counts({"a": 1_000, "b": 2}) == "a: 1_000, b: 2"
@@ -0,0 +1,145 @@
+"""Period finding for deterministic step functions
+
+Only fingerprints of states and a projected value per step are kept, so
+the value after any number of steps is known without storing states.
+"""
+import hashlib
+from typing import Any, Callable, Hashable
+
+
+class Cycle:
+    """values of a sequence that repeats with a period after an offset
+
+    A period of 0 means no repetition was found within the search limit,
+    so only the values that were computed can be looked up.
+    """
+
+    def __init__(self, offset: int, period: int, values: list):
+        self.offset, self.period, self.values = offset, period, values
+
+    def index(self, steps: int) -> int:
+        if steps < len(self.values):
+            return steps
+        if not self.period:
+            raise ValueError(f"no cycle found within {len(self.values)} steps")
+        return self.offset + (steps - self.offset) % self.period
+
+    def value_at(self, steps: int) -> Any:
+        return self.values[self.index(steps)]
+
+    def total(self, stop: int) -> Any:
+        """sum of the values after 0, 1, ..., stop - 1 steps, tuples of
+        numbers are summed component by component"""
+        if self.values and isinstance(self.values[0], tuple):
+            return tuple(
+                Cycle(self.offset, self.period, list(component)).total(stop)
+                for component in zip(*self.values)
+            )
+        if stop <= len(self.values):
+            return sum(self.values[:stop])
+        if not self.period:
+            raise ValueError(f"no cycle found within {len(self.values)} steps")
+        loops, rest = divmod(stop - self.offset, self.period)
+        head, loop = self.values[: self.offset], self.values[self.offset :]
+        return sum(head) + loops * sum(loop) + sum(loop[:rest])
+
+
+def digest(buffer: bytes) -> bytes:
+    """a short fingerprint of a large state"""
+    return hashlib.blake2b(buffer, digest_size=16).digest()
+
+
+def find_cycle(
+    start: Any,
+    step: Callable[[Any], Any],
+    fingerprint: Callable[[Any], Hashable],
+    project: Callable[[Any], Any] | None = None,
+    limit: int | None = None,
+) -> Cycle:
+    """index the fingerprint of every state, each state is stepped once
+
+    Without project, step returns the next state together with the value of
+    the transition, e.g. what was emitted on the way.
+    """
+    index, values = {}, []
+    state = start
+    while limit is None or len(values) <= limit:
+        if (key := fingerprint(state)) in index:
+            offset = index[key]
+            return Cycle(offset, len(values) - offset, values)
+        index[key] = len(values)
+        if project is None:
+            state, value = step(state)
+        else:
+            value, state = project(state), step(state)
+        values.append(value)
+    return Cycle(len(values), 0, values)
+
+
+def find_cycle_brent(
+    start: Any,
+    step: Callable[[Any], Any],
+    fingerprint: Callable[[Any], Hashable],
+    project: Callable[[Any], Any],
+) -> Cycle:
+    """Brent's algorithm, keeps two states and one fingerprint at a time but
+    steps about three times as often, so step must not mutate its argument"""
+    power = period = 1
+    tortoise, hare = fingerprint(start), step(start)
+    while tortoise != fingerprint(hare):
+        if power == period:
+            tortoise, power, period = fingerprint(hare), 2 * power, 0
+        hare = step(hare)
+        period += 1
+
+    hare = start
+    for _ in range(period):
+        hare = step(hare)
+
+    state, values = start, []
+    while fingerprint(state) != fingerprint(hare):
+        values.append(project(state))
+        state, hare = step(state), step(hare)
+    offset = len(values)
+
+    for _ in range(period):
+        values.append(project(state))
+        state = step(state)
+    return Cycle(offset, period, values)
+
+
+def test():
+    def step(value: int) -> int:
+        return (value * value + 1) % 255
+
+    expected = [3]
+    while expected.count(expected[-1]) < 2:
+        expected.append(step(expected[-1]))
+    offset = expected.index(expected[-1])
+    period = len(expected) - 1 - offset
+
+    for finder in (find_cycle, find_cycle_brent):
+        cycle = finder(3, step, lambda value: value, lambda value: 2 * value)
+        assert (cycle.offset, cycle.period) == (offset, period)
+
+        value, total = 3, 0
+        for steps in range(100):
+            assert cycle.value_at(steps) == 2 * value
+            assert cycle.total(steps) == total
+            total += 2 * value
+            value = step(value)
+
+    cycle = find_cycle(0, lambda value: value + 1, str, lambda value: value, limit=10)
+    assert cycle.period == 0 and cycle.total(11) == 55
+    try:
+        cycle.value_at(11)
+    except ValueError:
+        pass
+    else:
+        assert False
+
+    cycle = find_cycle(0, lambda value: ((value + 1) % 3, value), str)
+    assert (cycle.offset, cycle.period, cycle.total(7)) == (0, 3, 6)
+    cycle = find_cycle(0, lambda value: ((value + 1) % 3, (value, 10**20)), str)
+    assert cycle.total(7) == (6, 7 * 10**20)
+    assert len(digest(b"state")) == 16
@@ -0,0 +1,171 @@
+"""Long-running solver keeping modules imported and parsed inputs resident
+
+Clients send one JSON object per line, {"day": 1, "part": 2, "input_path":
+"..."} with an optional "year", over a Unix domain socket and get back
+{"answer": ...} or {"error": "..."} on a line of its own.
+"""
+import collections
+import json
+import os
+import pathlib
+import socket
+import socketserver
+import tempfile
+import threading
+from typing import Any
+
+from aoc import days, runner
+
+
+SOCKET_PATH = pathlib.Path(tempfile.gettempdir()) / f"aoc-{os.getuid()}.sock"
+CAPACITY = 32
+PARTS = {1: "part one", 2: "part two"}
+
+
+def find_latest_year() -> int:
+    return max(int(path.name) for path in days.ROOT.glob("[0-9]" * 4))
+
+
+class Solutions:
+    """parsed inputs by day and file contents, least recently used evicted"""
+
+    def __init__(self, capacity: int = CAPACITY):
+        self.capacity = capacity
+        self.parsed = collections.OrderedDict()
+
+    def parse(self, year: int, day: int, path: str) -> Any:
+        stat = os.stat(path)
+        key = year, day, os.path.realpath(path), stat.st_mtime_ns, stat.st_size
+        if key in self.parsed:
+            self.parsed.move_to_end(key)
+            return self.parsed[key]
+
+        self.parsed[key] = parsed = days.load(year, day).read_and_parse(path)
+        if len(self.parsed) > self.capacity:
+            self.parsed.popitem(last=False)
+        return parsed
+
+    def solve(self, year: int, day: int, part: int, path: str) -> Any:
+        solver = getattr(days.load(year, day), runner.PHASES[PARTS[part]])
+        return solver(*days.as_arguments(self.parse(year, day, path)))
+
+
+class Handler(socketserver.StreamRequestHandler):
+    """answers requests in order until the client closes the connection"""
+
+    def handle(self):
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+                answer = self.server.solutions.solve(
+                    request.get("year") or find_latest_year(),
+                    request["day"],
+                    request["part"],
+                    request["input_path"],
+                )
+                response = json.dumps({"answer": answer})
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                response = json.dumps({"error": f"{type(error).__name__}: {error}"})
+            self.wfile.write(response.encode() + b"\n")
+
+
+def is_listening(path: pathlib.Path) -> bool:
+    """whether something accepts connections on the socket"""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        try:
+            client.connect(str(path))
+        except (FileNotFoundError, ConnectionRefusedError):
+            return False
+    return True
+
+
+class Server(socketserver.UnixStreamServer):
+    """one request at a time, since solvers may reuse their parsed input,
+    a socket left behind by a daemon that is gone is replaced but a live
+    one raises RuntimeError"""
+
+    def __init__(self, path: pathlib.Path, capacity: int = CAPACITY):
+        if is_listening(path):
+            raise RuntimeError(f"a daemon is already listening on {path}")
+        path.unlink(missing_ok=True)
+        super().__init__(str(path), Handler)
+        self.solutions = Solutions(capacity)
+
+    def server_close(self):
+        super().server_close()
+        pathlib.Path(self.server_address).unlink(missing_ok=True)
+
+
+def ask(
+    day: int,
+    part: int,
+    input_path: str,
+    year: int | None = None,
+    path: pathlib.Path = SOCKET_PATH,
+) -> Any:
+    """solve through a running daemon"""
+    request = {"day": day, "part": part, "input_path": os.path.abspath(input_path)}
+    if year is not None:
+        request["year"] = year
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(str(path))
+        client.sendall(json.dumps(request).encode() + b"\n")
+        with client.makefile("rb") as file:
+            response = json.loads(file.readline())
+
+    if "error" in response:
+        raise RuntimeError(response["error"])
+    return response["answer"]
+
+
+def test():
+    with tempfile.TemporaryDirectory() as directory:
+        path = pathlib.Path(directory) / "aoc.sock"
+        with Server(path, capacity=2) as server:
+            thread = threading.Thread(target=server.serve_forever)
+            thread.start()
+            try:
+                for day, filename in ((1, "example-1.txt"), (17, "example-1.txt")):
+                    example = days.find_directory(2023, day) / filename
+                    timings = list(runner.run_day(2023, day, filename))
+                    answers = [timing.answer for timing in timings[1:]]
+                    assert ask(day, 1, example, 2023, path) == answers[0]
+                    assert ask(day, 2, example, 2023, path) == answers[1]
+                    assert ask(day, 1, example, 2023, path) == answers[0]
+
+                example = days.find_directory(2023, 25) / "example.txt"
+                assert ask(25, 1, example, path=path) == 54
+
+                assert len(server.solutions.parsed) == 2
+                try:
+                    ask(1, 3, example, 2023, path)
+                except RuntimeError as error:
+                    assert str(error) == "KeyError: 3"
+                else:
+                    assert False
+
+                try:
+                    Server(path)
+                except RuntimeError:
+                    assert ask(25, 1, example, path=path) == 54
+                else:
+                    assert False
+
+                server.solutions.solve = lambda *_: {"not", "json"}
+                try:
+                    ask(25, 1, example, path=path)
+                except RuntimeError as error:
+                    assert str(error).startswith("TypeError")
+                else:
+                    assert False
+            finally:
+                server.shutdown()
+                thread.join()
+        assert not path.exists()
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stale:
+            stale.bind(str(path))
+        assert path.exists() and not is_listening(path)
+        with Server(path):
+            assert is_listening(path)
@@ -0,0 +1,66 @@
+"""Discovery and loading of daily solutions"""
+import functools
+import importlib.util
+import pathlib
+import sys
+import types
+from typing import Any
+
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+
+
+def parse_days(text: str) -> list[int]:
+    """expand a spec like 1-5,7,9-10 into a list of days"""
+    days = []
+    for chunk in text.split(","):
+        first, _, last = chunk.partition("-")
+        days.extend(range(int(first), int(last or first) + 1))
+    return days
+
+
+def find_directory(year: int, day: int) -> pathlib.Path:
+    return ROOT / str(year) / f"{day:02d}"
+
+
+def find_key(year: int, day: int, filename: str) -> str:
+    """a stable name for an input, e.g. 2023/01/input.txt"""
+    path = find_directory(year, day) / filename
+    return path.relative_to(ROOT).as_posix()
+
+
+def find_days(year: int) -> list[int]:
+    return sorted(
+        int(path.parent.name) for path in (ROOT / str(year)).glob("[0-9][0-9]/main.py")
+    )
+
+
+@functools.cache
+def load(year: int, day: int, name: str = "main") -> types.ModuleType:
+    """import a daily script under a unique module name"""
+    path = find_directory(year, day) / f"{name}.py"
+    spec = importlib.util.spec_from_file_location(f"aoc_{year}_{day:02d}_{name}", path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def find_input(module: types.ModuleType, filename: str = "input.txt") -> pathlib.Path:
+    return pathlib.Path(module.__file__).parent / filename
+
+
+def as_arguments(parsed: Any) -> tuple:
+    """solvers take the parsed input unpacked if it is a tuple"""
+    return parsed if isinstance(parsed, tuple) else (parsed,)
+
+
+def test():
+    assert parse_days("1-3,5,7-8") == [1, 2, 3, 5, 7, 8]
+    assert find_days(2023) == list(range(1, 26))
+    assert find_key(2023, 1, "input.txt") == "2023/01/input.txt"
+    module = load(2023, 1)
+    assert module is load(2023, 1)
+    assert find_input(module, "example-1.txt").is_file()
+    assert as_arguments([1]) == ([1],)
+    assert as_arguments(([1], [2])) == ([1], [2])
@@ -0,0 +1,146 @@
+"""Reference against optimized implementations on generated inputs
+
+A day lists its pairs in DIFFERENTIAL, a dict from a name to a reference
+and a fast callable, both taking the parsed input. Every pair runs on
+inputs of growing size and must agree there. The crossover is the smallest
+size from which the fast one wins at every larger size as well. When the
+fast one already wins at the smallest size run, the crossover lies at or
+below it and the report says so instead of naming a size.
+"""
+import collections
+import pathlib
+import tempfile
+import time
+from typing import Any, Callable, Iterable, Sequence
+
+from aoc import days, generate, runner
+
+
+Comparison = collections.namedtuple(
+    "Comparison", ["day", "name", "size", "reference", "fast", "agree"]
+)
+
+
+def time_call(function: Callable, args: tuple, repeat: int) -> tuple[Any, float]:
+    """the answer and the best of repeat runs"""
+    if repeat < 1:
+        raise ValueError(f"repeat must be at least 1, got {repeat}")
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        answer = function(*args)
+        best = min(best, time.perf_counter() - start)
+    return answer, best
+
+
+def time_pair(
+    reference: Callable, fast: Callable, args: tuple, repeat: int
+) -> tuple[float, float, bool]:
+    """the best times of both callables and whether their answers agree"""
+    expected, reference_seconds = time_call(reference, args, repeat)
+    answer, fast_seconds = time_call(fast, args, repeat)
+    return reference_seconds, fast_seconds, answer == expected
+
+
+def compare_day(
+    year: int,
+    day: int,
+    sizes: Sequence[int] | None = None,
+    repeat: int = 3,
+    seed: int = 0,
+) -> Iterable[Comparison]:
+    module = days.load(year, day)
+    generator = days.load(year, day, "generate")
+    sizes = sizes or generator.SIZES
+
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            path = pathlib.Path(directory) / generate.find_filename(size, seed)
+            path.write_text(generator.generate(size, seed), encoding="utf-8")
+            for name, (reference, fast) in module.DIFFERENTIAL.items():
+                args = days.as_arguments(module.read_and_parse(str(path)))
+                timing = time_pair(reference, fast, args, repeat)
+                yield Comparison(day, name, size, *timing)
+
+
+def find_crossover(comparisons: Iterable[Comparison]) -> int | None:
+    """comparisons of a single pair, None if the fast one never wins for good"""
+    crossover = None
+    for comparison in sorted(comparisons, key=lambda comparison: comparison.size):
+        if comparison.fast < comparison.reference:
+            crossover = comparison.size if crossover is None else crossover
+        else:
+            crossover = None
+    return crossover
+
+
+def find_crossovers(comparisons: Iterable[Comparison]) -> dict[tuple[int, str], int]:
+    pairs = collections.defaultdict(list)
+    for comparison in comparisons:
+        pairs[comparison.day, comparison.name].append(comparison)
+    return {pair: find_crossover(series) for pair, series in pairs.items()}
+
+
+def summarize_crossovers(comparisons: Sequence[Comparison]) -> list[str]:
+    """a line per pair saying from which size on the fast one wins"""
+    smallest = {}
+    for comparison in comparisons:
+        pair = comparison.day, comparison.name
+        smallest[pair] = min(smallest.get(pair, comparison.size), comparison.size)
+
+    lines = []
+    for (day, name), crossover in find_crossovers(comparisons).items():
+        if crossover is None:
+            found = "never"
+        elif crossover == smallest[day, name]:
+            found = f"at every size run, the crossover is at most {crossover}"
+        else:
+            found = f"from size {crossover}"
+        lines.append(f"Day {day:02d} {name}: fast wins {found}")
+    return lines
+
+
+def format_table(comparisons: Iterable[Comparison]) -> str:
+    """one row per pair and size, then the crossover of every pair"""
+    comparisons = list(comparisons)
+    lines = [["day", "pair", "size", "reference", "fast", "speedup", "answers"]]
+    for comparison in comparisons:
+        lines.append(
+            [
+                f"{comparison.day:02d}",
+                comparison.name,
+                str(comparison.size),
+                runner.format_seconds(comparison.reference),
+                runner.format_seconds(comparison.fast),
+                f"{comparison.reference / max(comparison.fast, 1e-9):.1f}x",
+                "agree" if comparison.agree else "DIFFER",
+            ]
+        )
+
+    widths = [max(map(len, column)) for column in zip(*lines)]
+    table = [
+        "  ".join(cell.rjust(width) for cell, width in zip(line, widths))
+        for line in lines
+    ]
+    return "\n".join(table + summarize_crossovers(comparisons))
+
+
+def test():
+    def fake(size: int, reference: float, fast: float) -> Comparison:
+        return Comparison(1, "pair", size, reference, fast, True)
+
+    assert find_crossover([fake(1, 1, 2), fake(2, 2, 1), fake(4, 4, 1)]) == 2
+    assert find_crossover([fake(4, 4, 1), fake(1, 1, 2), fake(2, 1, 2)]) == 4
+    assert find_crossover([fake(1, 1, 2), fake(2, 2, 3)]) is None
+    summary = format_table([fake(1, 1, 2), fake(2, 2, 1)]).splitlines()[-1]
+    assert summary == "Day 01 pair: fast wins from size 2"
+    summary = format_table([fake(2, 2, 1), fake(4, 4, 1)]).splitlines()[-1]
+    assert summary.endswith("at every size run, the crossover is at most 2")
+
+    comparisons = list(compare_day(2023, 12, [4, 8], repeat=1))
+    assert [comparison.size for comparison in comparisons] == [4, 8]
+    assert all(comparison.agree for comparison in comparisons)
+
+    table = format_table(comparisons).splitlines()
+    assert table[0].split()[:3] == ["day", "pair", "size"]
+    assert table[-1].startswith("Day 12 arrangements: fast wins")
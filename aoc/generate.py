@@ -0,0 +1,100 @@
+"""Seeded synthetic inputs at a chosen scale for every day"""
+import pathlib
+import random
+
+from aoc import days, runner
+
+
+Cell = tuple[int, int]
+
+
+NEIGHBORS = ((-1, 0), (0, 1), (1, 0), (0, -1))
+RING = ((-1, 0), (-1, 1), (0, 1), (1, 1), (1, 0), (1, -1), (0, -1), (-1, -1))
+
+
+def find_filename(size: int, seed: int = 0) -> str:
+    return f"generated-{size}.txt" if not seed else f"generated-{size}-{seed}.txt"
+
+
+def write_input(year: int, day: int, size: int, seed: int = 0) -> pathlib.Path:
+    """generate an input next to the day's main.py"""
+    text = days.load(year, day, "generate").generate(size, seed)
+    path = days.find_directory(year, day) / find_filename(size, seed)
+    with open(path, "w", encoding="utf-8") as file:
+        file.write(text)
+    return path
+
+
+def can_grow(cells: set[Cell], cell: Cell) -> bool:
+    """adding the cell keeps the shape simply connected and free of pinches"""
+    row, col = cell
+    ring = [(row + drow, col + dcol) in cells for drow, dcol in RING]
+
+    for corner in range(1, 8, 2):
+        if ring[corner] and not ring[corner - 1] and not ring[(corner + 1) % 8]:
+            return False
+
+    runs = sum(ring[i] and not ring[i - 1] for i in range(8))
+    return runs == 1
+
+
+def grow_polyomino(rng: random.Random, side: int, fraction: float) -> set[Cell]:
+    """a random hole-free shape inside a side x side square"""
+    cells = {(side // 2, side // 2)}
+    frontier = [(side // 2 + drow, side // 2 + dcol) for drow, dcol in NEIGHBORS]
+
+    while frontier and len(cells) < fraction * side * side:
+        index = rng.randrange(len(frontier))
+        frontier[index], frontier[-1] = frontier[-1], frontier[index]
+        row, col = cell = frontier.pop()
+        if cell in cells or not (0 <= row < side and 0 <= col < side):
+            continue
+        if not can_grow(cells, cell):
+            continue
+        cells.add(cell)
+        frontier.extend((row + drow, col + dcol) for drow, dcol in NEIGHBORS)
+
+    return cells
+
+
+def trace_boundary(cells: set[Cell]) -> list[Cell]:
+    """corners of the shape's outline in order, first corner not repeated"""
+    successor = {}
+    for row, col in cells:
+        if (row - 1, col) not in cells:
+            successor[row, col] = row, col + 1
+        if (row, col + 1) not in cells:
+            successor[row, col + 1] = row + 1, col + 1
+        if (row + 1, col) not in cells:
+            successor[row + 1, col + 1] = row + 1, col
+        if (row, col - 1) not in cells:
+            successor[row + 1, col] = row, col
+
+    start = corner = min(successor)
+    outline = []
+    while not outline or corner != start:
+        outline.append(corner)
+        corner = successor[corner]
+    return outline
+
+
+def test():
+    rng = random.Random(0)
+    cells = grow_polyomino(rng, 12, 0.5)
+    outline = trace_boundary(cells)
+    assert len(outline) == len(set(outline))
+    assert all(
+        abs(row - next_row) + abs(col - next_col) == 1
+        for (row, col), (next_row, next_col) in zip(outline, outline[1:] + outline[:1])
+    )
+
+    for day in days.find_days(2023):
+        generator = days.load(2023, day, "generate")
+        assert generator.generate(8, 1) == generator.generate(8, 1)
+
+        path = write_input(2023, day, 8, 1)
+        try:
+            timings = list(runner.run_day(2023, day, path.name))
+        finally:
+            path.unlink()
+        assert len(timings) >= 2
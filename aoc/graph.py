@@ -0,0 +1,279 @@
+"""Searches on integer node ids with adjacency in compressed sparse rows
+
+The edges leaving node u are edges starts[u] to starts[u + 1] - 1 of the
+targets and weights arrays, so a graph is three flat arrays however many
+edges it has, and every search keeps its distances in a preallocated array
+indexed by node id instead of a dict keyed by tuples.
+"""
+import array
+import collections
+import heapq
+from typing import Callable, Iterable
+
+from aoc import counters
+
+
+UNREACHED = -1
+
+Search = collections.namedtuple("Search", ["order", "distance"])
+
+
+class Graph:
+    """directed graph on nodes 0, 1, ..., size - 1 with integer edge weights"""
+
+    def __init__(self, starts: array.array, targets: array.array, weights: array.array):
+        self.starts, self.targets, self.weights = starts, targets, weights
+
+    @classmethod
+    def from_edges(cls, size: int, edges: Iterable[tuple[int, ...]]) -> "Graph":
+        """edges are (source, target) or (source, target, weight), in any order"""
+        edges = list(edges)
+        starts = array.array("i", bytes(4 * (size + 1)))
+        for edge in edges:
+            starts[edge[0] + 1] += 1
+        for node in range(size):
+            starts[node + 1] += starts[node]
+
+        targets = array.array("i", bytes(4 * len(edges)))
+        weights = array.array("i", [1]) * len(edges)
+        fill = starts[:-1]
+        for source, target, *weight in edges:
+            targets[fill[source]] = target
+            if weight:
+                weights[fill[source]] = weight[0]
+            fill[source] += 1
+        return cls(starts, targets, weights)
+
+    @classmethod
+    def from_function(
+        cls, size: int, neighbors: Callable[[int], Iterable], weighted: bool = False
+    ) -> "Graph":
+        """neighbors(node) gives targets, or (target, weight) pairs if weighted"""
+        starts, targets = array.array("i", [0]), array.array("i")
+        weights = array.array("i")
+        for node in range(size):
+            if weighted:
+                for target, weight in neighbors(node):
+                    targets.append(target)
+                    weights.append(weight)
+            else:
+                targets.extend(neighbors(node))
+            starts.append(len(targets))
+        if not weighted:
+            weights = array.array("i", [1]) * len(targets)
+        return cls(starts, targets, weights)
+
+    def __len__(self) -> int:
+        return len(self.starts) - 1
+
+    def neighbors(self, node: int) -> array.array:
+        return self.targets[self.starts[node] : self.starts[node + 1]]
+
+    def edges(self, node: int) -> Iterable[tuple[int, int]]:
+        start, end = self.starts[node], self.starts[node + 1]
+        return zip(self.targets[start:end], self.weights[start:end])
+
+    def degrees(self) -> array.array:
+        starts = self.starts
+        return array.array("i", (starts[i + 1] - starts[i] for i in range(len(self))))
+
+
+def unreached(size: int) -> array.array:
+    return array.array("i", [UNREACHED]) * size
+
+
+def bfs(graph: Graph, sources: Iterable[int]) -> Search:
+    """unweighted distances, the order array doubles as the queue"""
+    starts, targets = graph.starts, graph.targets
+    distance = unreached(len(graph))
+    order = array.array("i")
+    for source in sources:
+        if distance[source] == UNREACHED:
+            distance[source] = 0
+            order.append(source)
+
+    head = 0
+    while head < len(order):
+        node = order[head]
+        head += 1
+        next_distance = distance[node] + 1
+        for edge in range(starts[node], starts[node + 1]):
+            target = targets[edge]
+            if distance[target] == UNREACHED:
+                distance[target] = next_distance
+                order.append(target)
+
+    if counters.ENABLED:
+        counters.add("bfs expansions", len(order))
+    return Search(order, distance)
+
+
+def mark(size: int, nodes: Iterable[int]) -> bytearray:
+    """a flag per node, set for the given ones"""
+    marked = bytearray(size)
+    for node in nodes:
+        marked[node] = 1
+    return marked
+
+
+def relax(graph: Graph, distance: array.array, node: int) -> list[int]:
+    """lower the distances through the edges of node, returning the targets
+    whose distance went down"""
+    starts, targets, weights = graph.starts, graph.targets, graph.weights
+    node_distance, lowered = distance[node], []
+    for edge in range(starts[node], starts[node + 1]):
+        target, next_distance = targets[edge], node_distance + weights[edge]
+        if distance[target] == UNREACHED or next_distance < distance[target]:
+            distance[target] = next_distance
+            lowered.append(target)
+    return lowered
+
+
+def dijkstra(
+    graph: Graph, sources: Iterable[int], targets: Iterable[int] = ()
+) -> array.array:
+    """distances from the nearest source, stopping once any target is settled
+
+    After an early exit only the settled target is exact, the others hold
+    upper bounds or UNREACHED, so the minimum over targets is still right.
+    """
+    distance = unreached(len(graph))
+    is_target = mark(len(graph), targets)
+    heap = []
+    for source in sources:
+        distance[source] = 0
+        heap.append((0, source))
+    heapq.heapify(heap)
+    counting = counters.ENABLED
+    if counting:
+        counters.add("heap pushes", len(heap))
+
+    while heap:
+        node_distance, node = heapq.heappop(heap)
+        if counting:
+            counters.add("heap pops")
+        if node_distance != distance[node]:
+            continue
+        if is_target[node]:
+            break
+
+        lowered = relax(graph, distance, node)
+        for target in lowered:
+            heapq.heappush(heap, (distance[target], target))
+        if counting:
+            counters.add("heap pushes", len(lowered))
+
+    return distance
+
+
+def bucket_search(
+    graph: Graph, sources: Iterable[int], targets: Iterable[int] = ()
+) -> array.array:
+    """Dijkstra with a circular bucket queue, for small non-negative weights
+
+    Every pending distance lies within the largest weight of the current
+    one, so that many buckets plus one are reused round and round and a push
+    or pop costs a list append or pop instead of a heap operation.
+    """
+    distance = unreached(len(graph))
+    is_target = mark(len(graph), targets)
+    slots = max(graph.weights, default=0) + 1
+    buckets = [[] for _ in range(slots)]
+    pending = 0
+    for source in sources:
+        distance[source] = 0
+        buckets[0].append(source)
+        pending += 1
+    counting = counters.ENABLED
+    if counting:
+        counters.add("queue pushes", pending)
+
+    current = 0
+    while pending:
+        bucket = buckets[current % slots]
+        while not bucket:
+            current += 1
+            bucket = buckets[current % slots]
+        node = bucket.pop()
+        pending -= 1
+        if counting:
+            counters.add("queue pops")
+        if distance[node] != current:
+            continue
+        if is_target[node]:
+            break
+
+        lowered = relax(graph, distance, node)
+        for target in lowered:
+            buckets[distance[target] % slots].append(target)
+        pending += len(lowered)
+        if counting:
+            counters.add("queue pushes", len(lowered))
+
+    return distance
+
+
+def topological_order(graph: Graph) -> array.array:
+    """Kahn's algorithm, raises ValueError if the graph has a cycle"""
+    starts, targets = graph.starts, graph.targets
+    indegree = array.array("i", bytes(4 * len(graph)))
+    for target in targets:
+        indegree[target] += 1
+    order = array.array("i", (node for node in range(len(graph)) if not indegree[node]))
+
+    head = 0
+    while head < len(order):
+        node = order[head]
+        head += 1
+        for edge in range(starts[node], starts[node + 1]):
+            target = targets[edge]
+            indegree[target] -= 1
+            if not indegree[target]:
+                order.append(target)
+
+    if len(order) != len(graph):
+        raise ValueError("graph has a cycle")
+    return order
+
+
+def longest_paths(graph: Graph, sources: Iterable[int]) -> array.array:
+    """dynamic programming over a topological order of an acyclic graph"""
+    starts, targets, weights = graph.starts, graph.targets, graph.weights
+    distance = unreached(len(graph))
+    for source in sources:
+        distance[source] = 0
+
+    for node in topological_order(graph):
+        if (node_distance := distance[node]) == UNREACHED:
+            continue
+        for edge in range(starts[node], starts[node + 1]):
+            target, next_distance = targets[edge], node_distance + weights[edge]
+            if distance[target] < next_distance:
+                distance[target] = next_distance
+
+    return distance
+
+
+def test():
+    edges = [(0, 1, 4), (0, 2, 1), (2, 1, 2), (1, 3, 1), (2, 3, 5), (4, 0, 3)]
+    graph = Graph.from_edges(5, edges)
+    assert len(graph) == 5 and graph.degrees().tolist() == [2, 1, 2, 0, 1]
+    assert sorted(graph.edges(0)) == [(1, 4), (2, 1)]
+    assert Graph.from_function(5, graph.edges, weighted=True).targets == graph.targets
+
+    search = bfs(graph, [0])
+    assert search.order.tolist() == [0, 1, 2, 3]
+    assert search.distance.tolist() == [0, 1, 1, 2, UNREACHED]
+    for find in (dijkstra, bucket_search):
+        assert find(graph, [0]).tolist() == [0, 3, 1, 4, UNREACHED]
+        assert find(graph, [4, 2]).tolist() == [3, 2, 0, 3, 0]
+        assert find(graph, [0], [2])[2] == 1
+
+    assert topological_order(graph).tolist() == [4, 0, 2, 1, 3]
+    assert longest_paths(graph, [0]).tolist() == [0, 4, 1, 6, UNREACHED]
+    try:
+        topological_order(Graph.from_edges(2, [(0, 1), (1, 0)]))
+    except ValueError:
+        pass
+    else:
+        assert False
@@ -0,0 +1,180 @@
+"""Compact 2d grid with integer cell ids and a sentinel border"""
+import mmap
+from typing import Iterable
+
+from aoc import graph
+
+
+Text = bytes | bytearray | mmap.mmap
+
+
+def pad_lines(raw: Iterable[str | bytes], border: int) -> tuple[int, int, bytearray]:
+    lines = [line.encode() if isinstance(line, str) else bytes(line) for line in raw]
+    rows, cols = len(lines), len(lines[0])
+    edge = bytes([border]) * (cols + 2)
+    side = bytes([border])
+    cells = bytearray(edge + b"".join(side + line + side for line in lines) + edge)
+    return rows, cols, cells
+
+
+def measure_text(text: Text) -> tuple[int, int, int]:
+    """the size without trailing line breaks, the width of the first line
+    with its carriage return if any and the number of columns"""
+    size = len(text)
+    while size and text[size - 1] in b"\r\n":
+        size -= 1
+    width = text.find(b"\n", 0, size)
+    if width == -1:
+        width = size
+    cols = width - 1 if text[width - 1 : width] == b"\r" else width
+    return size, width, cols
+
+
+def check_lines(text: Text, size: int, width: int, cols: int):
+    """raises ValueError if a line is not as long as the first one"""
+    for row, offset in enumerate(range(0, size, width + 1)):
+        newline = text.find(b"\n", offset, size)
+        end, length = (size, cols) if newline == -1 else (newline, width)
+        if end - offset != length:
+            raise ValueError(f"line {row + 1} is not {cols} characters long")
+
+
+def pad_text(text: Text, border: int) -> tuple[int, int, bytearray]:
+    """copy every row straight from the text into its padded place, raises
+    ValueError if a line is not as long as the first one"""
+    size, width, cols = measure_text(text)
+    check_lines(text, size, width, cols)
+
+    line_stride, stride = width + 1, cols + 2
+    rows = -(-size // line_stride)
+    cells = bytearray([border]) * ((rows + 2) * stride)
+    with memoryview(text) as view:
+        for row in range(rows):
+            start, offset = (row + 1) * stride + 1, row * line_stride
+            cells[start : start + cols] = view[offset : offset + cols]
+    return rows, cols, cells
+
+
+class Grid:
+    """2d grid stored row by row in a flat buffer padded with a border byte
+
+    A cell id is (row + 1) * stride + (col + 1), so moving to a neighbor is
+    a single addition of one of the offsets and stepping off the grid always
+    lands on a border byte instead of needing a bounds check.
+    """
+
+    def __init__(self, raw: Iterable[str | bytes] | Text, border: str = "#"):
+        """raw is either a list of lines or a whole file, e.g. mapped in memory"""
+        if isinstance(raw, (bytes, bytearray, mmap.mmap)):
+            self.rows, self.cols, self.cells = pad_text(raw, ord(border))
+        else:
+            self.rows, self.cols, self.cells = pad_lines(raw, ord(border))
+        self.stride = self.cols + 2
+        self.border = ord(border)
+        self.offsets = (-self.stride, 1, self.stride, -1)
+
+    @classmethod
+    def from_buffer(cls, cells: bytes, rows: int, cols: int, border: int) -> "Grid":
+        """wrap an already padded buffer"""
+        grid = cls.__new__(cls)
+        grid.rows, grid.cols, grid.stride = rows, cols, cols + 2
+        grid.border, grid.cells = border, bytearray(cells)
+        grid.offsets = (-grid.stride, 1, grid.stride, -1)
+        return grid
+
+    def __eq__(self, other) -> bool:
+        return self.stride == other.stride and self.cells == other.cells
+
+    def __getitem__(self, cell: int) -> int:
+        return self.cells[cell]
+
+    def __contains__(self, cell: int) -> bool:
+        row, col = self.coordinates(cell)
+        return 0 <= row < self.rows and 0 <= col < self.cols
+
+    def index(self, row: int, col: int) -> int:
+        return (row + 1) * self.stride + col + 1
+
+    def coordinates(self, cell: int) -> tuple[int, int]:
+        row, col = divmod(cell, self.stride)
+        return row - 1, col - 1
+
+    def find(self, char: str) -> int:
+        return self.cells.index(ord(char), self.stride)
+
+    def row(self, row: int) -> bytes:
+        start = self.index(row, 0)
+        return bytes(self.cells[start : start + self.cols])
+
+    def lines(self) -> list[bytes]:
+        return list(map(self.row, range(self.rows)))
+
+    def interior(self) -> Iterable[int]:
+        for row in range(self.rows):
+            start = self.index(row, 0)
+            yield from range(start, start + self.cols)
+
+    def open_graph(self, wall: str = "#") -> graph.Graph:
+        """cell ids as nodes, each joined to its neighbors that are not walls"""
+        cells, offsets, wall = self.cells, self.offsets, ord(wall)
+
+        def find_neighbors(cell: int) -> list[int]:
+            if cells[cell] == wall or cells[cell] == self.border:
+                return []
+            return [
+                cell + offset
+                for offset in offsets
+                if cells[cell + offset] != wall and cells[cell + offset] != self.border
+            ]
+
+        return graph.Graph.from_function(len(cells), find_neighbors)
+
+    def transpose(self) -> "Grid":
+        """columns of the padded buffer are the padded rows of the transpose"""
+        cells = b"".join(self.cells[col :: self.stride] for col in range(self.stride))
+        return Grid.from_buffer(cells, self.cols, self.rows, self.border)
+
+    def reverse_rows(self) -> "Grid":
+        cells = b"".join(
+            self.cells[start : start + self.stride][::-1]
+            for start in range(0, len(self.cells), self.stride)
+        )
+        return Grid.from_buffer(cells, self.rows, self.cols, self.border)
+
+    def rotate_clockwise(self) -> "Grid":
+        return self.transpose().reverse_rows()
+
+
+def test():
+    grid = Grid(["ab", "cd", "ef"])
+    assert (grid.rows, grid.cols, grid.stride) == (3, 2, 4)
+    assert grid.lines() == [b"ab", b"cd", b"ef"]
+    assert grid[grid.index(1, 1)] == ord("d")
+    assert grid.coordinates(grid.find("e")) == (2, 0)
+    corner = grid.index(0, 0)
+    assert grid[corner - 1] == grid[corner + grid.offsets[0]] == ord("#")
+    assert grid.index(2, 1) in grid and grid.index(3, 0) not in grid
+    cells = list(grid.interior())
+    assert list(map(grid.coordinates, cells[:3])) == [(0, 0), (0, 1), (1, 0)]
+
+    maze = Grid(["..", "#.", ".."])
+    open_cells = maze.open_graph()
+    assert open_cells.degrees().count(0) == len(open_cells) - 5
+    middle = maze.index(1, 1)
+    assert sorted(open_cells.neighbors(middle)) == [middle - 4, middle + 4]
+
+    assert grid.transpose().lines() == [b"ace", b"bdf"]
+    assert grid.transpose().transpose() == grid
+    assert grid.reverse_rows().lines() == [b"ba", b"dc", b"fe"]
+    assert grid.rotate_clockwise().lines() == [b"eca", b"fdb"]
+
+    texts = (b"ab\ncd\nef", b"ab\ncd\nef\n", b"ab\ncd\nef\n\n", b"ab\r\ncd\r\nef\r\n")
+    for text in texts:
+        assert Grid(text) == grid
+    for text in (b"ab\ncde", b"ab\nc\nde", b"ab\n\ncd", b"abc\nde\nfgh"):
+        try:
+            Grid(text)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"{text!r} has a line of another length")
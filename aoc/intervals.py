@@ -0,0 +1,90 @@
+"""Half-open integer intervals and boxes as plain immutable tuples
+
+An interval is (start, stop) holding start <= x < stop and a box is a tuple
+of intervals, one per axis. Operations never return an empty interval or
+box, they return None or leave it out of a list instead, so range
+propagation allocates only the pieces that survive.
+"""
+import math
+from typing import Iterable
+
+
+Interval = tuple[int, int]
+Box = tuple[Interval, ...]
+
+
+def length(interval: Interval) -> int:
+    return interval[1] - interval[0]
+
+
+def shift(interval: Interval, offset: int) -> Interval:
+    return interval[0] + offset, interval[1] + offset
+
+
+def intersect(first: Interval, second: Interval) -> Interval | None:
+    start, stop = max(first[0], second[0]), min(first[1], second[1])
+    return (start, stop) if start < stop else None
+
+
+def split_at(interval: Interval, threshold: int) -> tuple[Interval | None, ...]:
+    """the parts below and from the threshold on"""
+    start, stop = interval
+    if threshold <= start:
+        return None, interval
+    if stop <= threshold:
+        return interval, None
+    return (start, threshold), (threshold, stop)
+
+
+def subtract(interval: Interval, removed: Interval) -> list[Interval]:
+    """up to two pieces, those left and right of removed"""
+    start, stop = interval
+    pieces = []
+    if start < removed[0]:
+        pieces.append((start, min(stop, removed[0])))
+    if removed[1] < stop:
+        pieces.append((max(start, removed[1]), stop))
+    return pieces
+
+
+def coalesce(intervals: Iterable[Interval]) -> list[Interval]:
+    """sorted union with overlapping and adjacent intervals merged"""
+    merged = []
+    for start, stop in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            if merged[-1][1] < stop:
+                merged[-1] = merged[-1][0], stop
+        else:
+            merged.append((start, stop))
+    return merged
+
+
+def split_box(box: Box, axis: int, threshold: int) -> tuple[Box | None, ...]:
+    """the parts of box below and from the threshold on along axis"""
+    below, above = split_at(box[axis], threshold)
+    return tuple(
+        None if part is None else box[:axis] + (part,) + box[axis + 1 :]
+        for part in (below, above)
+    )
+
+
+def volume(box: Box) -> int:
+    return math.prod(map(length, box))
+
+
+def test():
+    assert intersect((1, 5), (3, 9)) == (3, 5) and intersect((1, 3), (3, 5)) is None
+    assert split_at((1, 5), 3) == ((1, 3), (3, 5))
+    assert split_at((1, 5), 1) == (None, (1, 5))
+    assert split_at((1, 5), 7) == ((1, 5), None)
+    assert subtract((1, 9), (3, 5)) == [(1, 3), (5, 9)]
+    assert subtract((1, 9), (0, 5)) == [(5, 9)] and not subtract((3, 5), (1, 9))
+    assert subtract((1, 3), (5, 9)) == [(1, 3)] and subtract((5, 9), (1, 3)) == [(5, 9)]
+    merged = coalesce([(5, 7), (1, 3), (3, 4), (2, 3), (8, 9)])
+    assert merged == [(1, 4), (5, 7), (8, 9)]
+    assert shift((1, 3), 10) == (11, 13) and length((11, 13)) == 2
+
+    box = ((1, 11), (1, 5))
+    assert volume(box) == 40
+    assert split_box(box, 1, 3) == (((1, 11), (1, 3)), ((1, 11), (3, 5)))
+    assert split_box(box, 0, 20) == (box, None)
@@ -0,0 +1,162 @@
+"""Input files mapped into memory and split into bytes without decoding"""
+import array
+import contextlib
+import itertools
+import mmap
+import os
+import re
+import tempfile
+from typing import Iterator
+
+
+WINDOW = 1 << 20
+
+__NUMBERS = bytes(
+    char if char in b"-0123456789\n" else ord(" ") for char in range(256)
+)
+__STRAY_MINUS = re.compile(rb"-(?!\d)")
+
+
+@contextlib.contextmanager
+def open_text(filename: str) -> Iterator[mmap.mmap | bytes]:
+    """the whole file as a read-only buffer, valid inside the with block"""
+    with open(filename, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as text:
+            yield text
+
+
+def split_windows(text: mmap.mmap | bytes, window: int = WINDOW) -> Iterator[bytes]:
+    """copies of about a window of bytes each, cut right after a line break"""
+    start = 0
+    while start < len(text):
+        end = start + window
+        if end >= len(text):
+            end = len(text)
+        else:
+            end = (
+                text.rfind(b"\n", start, end) + 1
+                or text.find(b"\n", end) + 1
+                or len(text)
+            )
+        yield text[start:end]
+        start = end
+
+
+def split_lines(text: mmap.mmap | bytes, window: int = WINDOW) -> list[bytes]:
+    """the file is split a window at a time, never copied as a whole"""
+    lines = []
+    for chunk in split_windows(text, window):
+        lines.extend(chunk.splitlines())
+    return lines
+
+
+def read_lines(filename: str) -> list[bytes]:
+    with open_text(filename) as text:
+        return split_lines(text)
+
+
+def read_blocks(filename: str) -> list[list[bytes]]:
+    """groups of lines separated by empty lines"""
+    return [
+        list(group)
+        for nonempty, group in itertools.groupby(read_lines(filename), key=bool)
+        if nonempty
+    ]
+
+
+def __extend_ints(values: array.array, offsets: array.array, text: bytes):
+    text = __STRAY_MINUS.sub(b" ", text.translate(__NUMBERS))
+    for line in text.splitlines():
+        values.extend(map(int, line.split()))
+        offsets.append(len(values))
+
+
+def extract_ints(text: bytes) -> tuple[array.array, array.array]:
+    """every signed integer of every line in one flat array, those of line i
+    are values[offsets[i] : offsets[i + 1]]"""
+    values, offsets = array.array("q"), array.array("q", [0])
+    __extend_ints(values, offsets, text)
+    return values, offsets
+
+
+def read_ints(filename: str) -> tuple[array.array, array.array]:
+    values, offsets = array.array("q"), array.array("q", [0])
+    with open_text(filename) as text:
+        for chunk in split_windows(text):
+            __extend_ints(values, offsets, chunk)
+    return values, offsets
+
+
+def read_columns(
+    filename: str, fields: int, typecode: str = "q"
+) -> list[array.array]:
+    """a typed array per field of records of as many integers each, a
+    narrower typecode than q raises OverflowError for values it cannot hold
+    and a count of integers that is not a multiple of fields ValueError"""
+    values, _ = read_ints(filename)
+    if len(values) % fields:
+        raise ValueError(
+            f"{filename}: {len(values)} integers do not split into {fields} fields"
+        )
+    if typecode == values.typecode:
+        return [values[field::fields] for field in range(fields)]
+    return [array.array(typecode, values[field::fields]) for field in range(fields)]
+
+
+def split_rows(values: array.array, offsets: array.array) -> list[array.array]:
+    """one compact array per line"""
+    return [values[start:end] for start, end in itertools.pairwise(offsets)]
+
+
+def test():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "input.txt")
+        for raw, lines in (
+            (b"", []),
+            (b"a", [b"a"]),
+            (b"a\n", [b"a"]),
+            (b"a\n\nbc\nd", [b"a", b"", b"bc", b"d"]),
+            (b"a\n\n\n", [b"a", b"", b""]),
+        ):
+            with open(path, "wb") as file:
+                file.write(raw)
+            assert read_lines(path) == lines == raw.splitlines()
+
+        assert read_blocks(path) == [[b"a"]]
+        with open(path, "wb") as file:
+            file.write(b"seeds: 1 2\n\nab\ncd\n\nef")
+        assert read_blocks(path) == [[b"seeds: 1 2"], [b"ab", b"cd"], [b"ef"]]
+        with open_text(path) as text:
+            assert text[:5] == b"seeds"
+
+    text = b"ab\ncd\r\n\n\nefghij\nk\n"
+    for window in range(1, len(text) + 2):
+        assert split_lines(text, window) == text.splitlines()
+        assert b"".join(split_windows(text, window)) == text
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "input.txt")
+        with open(path, "wb") as file:
+            file.write(b"1,2,3~4,5,6\n7,8,9~10,11,-12\n")
+        columns = read_columns(path, 6)
+        assert [column.tolist() for column in columns[::5]] == [[1, 7], [6, -12]]
+        assert read_columns(path, 3, "b")[2].tolist() == [3, 6, 9, -12]
+        try:
+            read_columns(path, 5)
+        except ValueError as error:
+            assert path in str(error)
+        else:
+            raise AssertionError("12 integers split into 5 fields")
+
+    values, offsets = extract_ints(b"Game 12: 3 blue\n\n19, 13 @ -2,-1\nseed-to-soil\n")
+    assert values.tolist() == [12, 3, 19, 13, -2, -1]
+    assert offsets.tolist() == [0, 2, 2, 6, 6]
+    assert [row.tolist() for row in split_rows(values, offsets)] == [
+        [12, 3],
+        [],
+        [19, 13, -2, -1],
+        [],
+    ]
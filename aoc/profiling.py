@@ -0,0 +1,60 @@
+"""Per-phase cProfile statistics and tracemalloc allocation snapshots"""
+import cProfile
+import pathlib
+import pstats
+import tempfile
+import tracemalloc
+from typing import Any, Callable
+
+from aoc import days
+
+
+PROFILE_DIRECTORY = days.ROOT / ".aoc_profiles"
+TOP_ALLOCATIONS = 25
+
+
+def find_stem(directory: pathlib.Path, year: int, day: int, phase: str) -> pathlib.Path:
+    """e.g. .aoc_profiles/2023/17/part-one"""
+    return directory / str(year) / f"{day:02d}" / phase.replace(" ", "-")
+
+
+def write_allocations(path: pathlib.Path, snapshot: tracemalloc.Snapshot, peak: int):
+    snapshot = snapshot.filter_traces(
+        (tracemalloc.Filter(False, tracemalloc.__file__),)
+    )
+    with open(path, "w", encoding="utf-8") as file:
+        file.write(f"peak: {peak} bytes\n")
+        for statistic in snapshot.statistics("lineno")[:TOP_ALLOCATIONS]:
+            file.write(f"{statistic}\n")
+
+
+def profile_call(stem: pathlib.Path, function: Callable, *args) -> Any:
+    """call the function, saving stem.pstats, stem.snapshot and stem.txt"""
+    profiler = cProfile.Profile()
+    tracemalloc.start()
+    try:
+        result = profiler.runcall(function, *args)
+        snapshot = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    stem.parent.mkdir(parents=True, exist_ok=True)
+    profiler.dump_stats(stem.with_suffix(".pstats"))
+    snapshot.dump(str(stem.with_suffix(".snapshot")))
+    write_allocations(stem.with_suffix(".txt"), snapshot, peak)
+    return result
+
+
+def test():
+    with tempfile.TemporaryDirectory() as raw_directory:
+        stem = find_stem(pathlib.Path(raw_directory), 2023, 1, "part one")
+        assert stem.name == "part-one" and stem.parent.name == "01"
+
+        assert profile_call(stem, sorted, range(1_000, 0, -1))[0] == 1
+        stats = pstats.Stats(str(stem.with_suffix(".pstats")))
+        names = [name for *_, name in stats.stats]
+        assert "<built-in method builtins.sorted>" in names
+        tracemalloc.Snapshot.load(str(stem.with_suffix(".snapshot")))
+        with open(stem.with_suffix(".txt"), "r", encoding="utf-8") as file:
+            assert file.readline().startswith("peak: ")
@@ -0,0 +1,125 @@
+"""Benchmark results written into the README and onto the tile images
+
+The runtime table lives between its own markers right after the AoC tiles
+block, which the aoc-tiles hook owns and rewrites, so either can be
+regenerated without touching the other. Badges need Pillow, which is only
+imported when they are drawn.
+"""
+import collections
+import pathlib
+import re
+from typing import Iterable
+
+from aoc import bench, days, runner
+
+
+README_FILE = days.ROOT / "README.md"
+TILES_DIRECTORY = days.ROOT / ".aoc_tiles" / "tiles"
+
+BEGIN, END = "<!-- AOC RUNTIMES BEGIN -->", "<!-- AOC RUNTIMES END -->"
+TILES_END = "<!-- AOC TILES END -->"
+
+__BLOCK = re.compile(re.escape(BEGIN) + ".*?" + re.escape(END), re.DOTALL)
+
+
+def group_by_day(
+    measurements: Iterable[bench.Measurement],
+) -> dict[int, dict[str, bench.Measurement]]:
+    phases = collections.defaultdict(dict)
+    for measurement in measurements:
+        phases[measurement.day][measurement.phase] = measurement
+    return dict(sorted(phases.items()))
+
+
+def format_markdown(
+    year: int, filename: str, measurements: Iterable[bench.Measurement]
+) -> str:
+    """a row per day with the median time and peak memory of every phase"""
+    header = ["Day"]
+    for phase in runner.PHASES:
+        header.extend([f"{phase.title()} median", f"{phase.title()} peak"])
+    lines = ["| " + " | ".join(header) + " |", "|" + " ---: |" * len(header)]
+
+    for day, phases in group_by_day(measurements).items():
+        cells = [f"[{day:02d}]({year}/{day:02d}/main.py)"]
+        for phase in runner.PHASES:
+            if (measurement := phases.get(phase)) is None:
+                cells.extend(["-", "-"])
+            else:
+                cells.append(runner.format_seconds(measurement.median))
+                cells.append(bench.format_bytes(measurement.peak))
+        lines.append("| " + " | ".join(cells) + " |")
+
+    caption = f"Runtimes on `{filename}` from `python -m aoc bench {year} --readme`."
+    return "\n".join([BEGIN, caption, "", *lines, END])
+
+
+def update_text(text: str, block: str) -> str:
+    """replace the previous table, or put it right after the tiles block"""
+    if __BLOCK.search(text):
+        return __BLOCK.sub(lambda _: block, text, count=1)
+    if TILES_END in text:
+        return text.replace(TILES_END, f"{TILES_END}\n\n{block}", 1)
+    return f"{text.rstrip()}\n\n{block}\n"
+
+
+def write_readme(
+    year: int,
+    filename: str,
+    measurements: Iterable[bench.Measurement],
+    path: pathlib.Path = README_FILE,
+):
+    text = path.read_text(encoding="utf-8")
+    block = format_markdown(year, filename, measurements)
+    path.write_text(update_text(text, block), encoding="utf-8")
+
+
+def draw_badge(draw, size: tuple[int, int], text: str):
+    """a dark box with the text in the bottom right corner of the image"""
+    width, height = size
+    box = (width - 72, height - 18, width, height)
+    draw.rectangle(box, fill=(15, 15, 35))
+    draw.text((box[0] + 4, box[1] + 3), text, fill="white")
+
+
+def draw_badges(
+    year: int,
+    measurements: Iterable[bench.Measurement],
+    directory: pathlib.Path = TILES_DIRECTORY,
+) -> list[pathlib.Path]:
+    """paint the total median of every day into a corner of its tile, over
+    the previous badge if any, raises ImportError without Pillow"""
+    # pylint: disable-next=import-outside-toplevel
+    from PIL import Image, ImageDraw
+
+    drawn = []
+    for day, phases in group_by_day(measurements).items():
+        path = directory / str(year) / f"{day:02d}.png"
+        if not path.is_file():
+            continue
+        total = sum(measurement.median for measurement in phases.values())
+        with Image.open(path) as tile:
+            image = tile.convert("RGB")
+        draw_badge(ImageDraw.Draw(image), image.size, runner.format_seconds(total))
+        image.save(path)
+        drawn.append(path)
+    return drawn
+
+
+def test():
+    measurements = [
+        bench.Measurement(3, "parse", 0.0012, 0.0013, 2048),
+        bench.Measurement(3, "part one", 1.5, 1.6, 10),
+        bench.Measurement(1, "parse", 0.0001, 0.0001, 100),
+    ]
+    block = format_markdown(2023, "input.txt", measurements)
+    rows = block.splitlines()[3:-1]
+    assert rows[2] == "| [01](2023/01/main.py) | 0.10 ms | 100 B | - | - | - | - |"
+    assert rows[3].endswith("| 1.20 ms | 2 KiB | 1.50 s | 10 B | - | - |")
+
+    text = f"intro\n{TILES_END}\nrest\n"
+    updated = update_text(text, block)
+    assert updated == f"intro\n{TILES_END}\n\n{block}\nrest\n"
+    again = update_text(updated, format_markdown(2023, "input.txt", measurements[:1]))
+    assert again.count(BEGIN) == 1 and "[01]" not in again and "rest" in again
+    assert update_text("intro\n", block) == f"intro\n\n{block}\n"
@@ -0,0 +1,129 @@
+"""Runs parsing and both parts of several days in one interpreter"""
+import collections
+import pathlib
+import tempfile
+import time
+from typing import Any, Callable, Iterable
+
+from aoc import cache, counters, days, profiling
+
+
+PHASES = {
+    "parse": "read_and_parse",
+    "part one": "solve_part_one",
+    "part two": "solve_part_two",
+}
+
+
+Timing = collections.namedtuple(
+    "Timing", ["day", "phase", "seconds", "answer", "counts"], defaults=[None]
+)
+
+
+def run_phase(function: Callable, args: tuple, stem: pathlib.Path | None) -> Any:
+    """call a phase, profiling it into files named after stem if given"""
+    if stem is None:
+        return function(*args)
+    return profiling.profile_call(stem, function, *args)
+
+
+def run_day(
+    year: int,
+    day: int,
+    filename: str = "input.txt",
+    cached: bool = False,
+    profile: pathlib.Path | None = None,
+) -> Iterable[Timing]:
+    """time every phase of a day, yielding as soon as each one completes"""
+    module = days.load(year, day)
+    path = days.find_input(module, filename)
+
+    def find_stem(phase: str) -> pathlib.Path | None:
+        return profile and profiling.find_stem(profile, year, day, phase)
+
+    counters.reset()
+    start = time.perf_counter()
+    if cached:
+        parsed = run_phase(cache.read_and_parse, (module, path), find_stem("parse"))
+    else:
+        parsed = run_phase(module.read_and_parse, (str(path),), find_stem("parse"))
+    seconds = time.perf_counter() - start
+    yield Timing(day, "parse", seconds, None, counters.snapshot())
+
+    for phase in ("part one", "part two"):
+        if (solver := getattr(module, PHASES[phase], None)) is None:
+            continue
+        counters.reset()
+        start = time.perf_counter()
+        answer = run_phase(solver, days.as_arguments(parsed), find_stem(phase))
+        seconds = time.perf_counter() - start
+        yield Timing(day, phase, seconds, answer, counters.snapshot())
+
+
+def run_days(
+    year: int,
+    selected: Iterable[int],
+    filename: str = "input.txt",
+    cached: bool = False,
+    profile: pathlib.Path | None = None,
+) -> Iterable[Timing]:
+    for day in selected:
+        yield from run_day(year, day, filename, cached, profile)
+
+
+def format_seconds(seconds: float | None) -> str:
+    if seconds is None:
+        return "-"
+    if seconds < 1:
+        return f"{seconds * 1_000:.2f} ms"
+    return f"{seconds:.2f} s"
+
+
+def format_table(timings: Iterable[Timing]) -> str:
+    """one row per day with a column per phase"""
+    rows = collections.defaultdict(dict)
+    for timing in timings:
+        rows[timing.day][timing.phase] = timing.seconds
+
+    header = ["day", *PHASES, "total"]
+    lines = [header]
+    for day, phases in sorted(rows.items()):
+        cells = [format_seconds(phases.get(phase)) for phase in PHASES]
+        lines.append([f"{day:02d}", *cells, format_seconds(sum(phases.values()))])
+
+    total = sum(sum(phases.values()) for phases in rows.values())
+    lines.append(["all", *("" for _ in PHASES), format_seconds(total)])
+
+    widths = [max(map(len, column)) for column in zip(*lines)]
+    return "\n".join(
+        "  ".join(cell.rjust(width) for cell, width in zip(line, widths))
+        for line in lines
+    )
+
+
+def format_answer(timing: Timing) -> str:
+    return f"Day {timing.day:02d} {timing.phase.title()}: {timing.answer}"
+
+
+def format_counts(timing: Timing) -> str:
+    counts = counters.format_counts(timing.counts)
+    return f"Day {timing.day:02d} {timing.phase}: {counts}"
+
+
+def test():
+    timings = list(run_day(2023, 1, "example-1.txt"))
+    assert [timing.phase for timing in timings] == list(PHASES)
+    assert timings[-1].answer == 142
+    assert format_answer(timings[-1]) == "Day 01 Part Two: 142"
+
+    table = format_table(timings).splitlines()
+    assert len(table) == 3
+    assert table[0].split() == ["day", "parse", "part", "one", "part", "two", "total"]
+    assert table[1].split()[0] == "01"
+
+    with tempfile.TemporaryDirectory() as directory:
+        profile = pathlib.Path(directory)
+        timings = list(run_day(2023, 1, "example-1.txt", profile=profile))
+        assert timings[-1].answer == 142
+        stems = {path.stem for path in profile.glob("2023/01/*.pstats")}
+        assert stems == {"parse", "part-one", "part-two"}
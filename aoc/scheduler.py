@@ -0,0 +1,100 @@
+"""Parallel runner dispatching the slowest days first"""
+import json
+import multiprocessing
+import pathlib
+import queue
+from concurrent import futures
+from typing import Any, Iterable
+
+from aoc import days, runner
+
+
+RUNTIMES_FILE = days.ROOT / ".aoc_runtimes.json"
+POLL_SECONDS = 0.1
+
+
+def load_runtimes(path: pathlib.Path = RUNTIMES_FILE) -> dict[str, float]:
+    if not path.is_file():
+        return {}
+    with open(path, "r", encoding="utf-8") as file:
+        return json.load(file)
+
+
+def record_runtimes(
+    year: int,
+    filename: str,
+    timings: Iterable[runner.Timing],
+    path: pathlib.Path = RUNTIMES_FILE,
+):
+    """store the total runtime of every day for the next schedule"""
+    runtimes = load_runtimes(path)
+    totals = {}
+    for timing in timings:
+        key = days.find_key(year, timing.day, filename)
+        totals[key] = totals.get(key, 0) + timing.seconds
+    runtimes.update(totals)
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(runtimes, file, indent=2, sort_keys=True)
+        file.write("\n")
+
+
+def longest_first(
+    year: int, selected: Iterable[int], filename: str, runtimes: dict[str, float]
+) -> list[int]:
+    """unknown days go first since they might be the slowest"""
+    return sorted(
+        selected,
+        key=lambda day: -runtimes.get(days.find_key(year, day, filename), float("inf")),
+    )
+
+
+def _run_day(
+    timings: queue.Queue, year: int, day: int, filename: str, options: dict[str, Any]
+):
+    for timing in runner.run_day(year, day, filename, **options):
+        timings.put(timing)
+
+
+def run_days(
+    year: int,
+    selected: Iterable[int],
+    filename: str = "input.txt",
+    jobs: int | None = None,
+    runtimes: dict[str, float] | None = None,
+    **options: Any,
+) -> Iterable[runner.Timing]:
+    """yield timings as each phase completes, from a pool of reused workers,
+    options such as cached and profile go to runner.run_day as keywords, the
+    futures are polled whenever the queue runs dry so a worker that dies
+    raises BrokenProcessPool instead of leaving its day pending forever"""
+    if runtimes is None:
+        runtimes = load_runtimes()
+    order = longest_first(year, selected, filename, runtimes)
+
+    with multiprocessing.Manager() as manager:
+        timings = manager.Queue()
+        with futures.ProcessPoolExecutor(jobs) as pool:
+            pending = {
+                pool.submit(_run_day, timings, year, day, filename, options)
+                for day in order
+            }
+            while pending:
+                try:
+                    yield timings.get(timeout=POLL_SECONDS)
+                except queue.Empty:
+                    finished = {future for future in pending if future.done()}
+                    for future in finished:
+                        future.result()
+                    pending -= finished
+        while not timings.empty():
+            yield timings.get()
+
+
+def test():
+    runtimes = {"2023/01/example-1.txt": 0.5, "2023/02/example-1.txt": 2.0}
+    order = longest_first(2023, [1, 2, 3], "example-1.txt", runtimes)
+    assert order == [3, 2, 1]
+
+    timings = list(run_days(2023, [1, 1], "example-1.txt", 2, runtimes))
+    assert len(timings) == 6
+    assert sorted(timing.answer for timing in timings if timing.answer) == [142] * 4
@@ -0,0 +1,108 @@
+"""Constant-memory line streaming and a chunked parallel reducer"""
+import multiprocessing
+import os
+import tempfile
+import time
+from typing import Iterable, Iterator
+
+from aoc import days, runner
+
+
+def read_lines(
+    filename: str, start: int = 0, end: int | None = None
+) -> Iterator[bytes]:
+    """lines beginning in the byte range [start, end), without line breaks"""
+    with open(filename, "rb") as file:
+        file.seek(start)
+        position = start
+        for line in file:
+            if end is not None and position >= end:
+                break
+            position += len(line)
+            yield line.rstrip(b"\r\n")
+
+
+def split_chunks(filename: str, count: int) -> list[tuple[int, int]]:
+    """byte ranges of roughly equal size that start at the beginning of a line"""
+    size = os.path.getsize(filename)
+    boundaries = [0]
+    with open(filename, "rb") as file:
+        for i in range(1, count):
+            target = size * i // count
+            if target <= boundaries[-1]:
+                continue
+            file.seek(target - 1)
+            file.readline()
+            boundaries.append(min(file.tell(), size))
+    boundaries.append(size)
+    return [
+        (start, end) for start, end in zip(boundaries, boundaries[1:]) if start < end
+    ]
+
+
+def __solve_chunk(task: tuple[int, int, str, str, int, int]):
+    """year, day, phase, filename and the byte range of the chunk"""
+    year, day, phase, filename, start, end = task
+    module = days.load(year, day)
+    solver = getattr(module, runner.PHASES[phase])
+    return solver(module.stream_and_parse(filename, start, end))
+
+
+def solve(
+    year: int, day: int, phase: str, filename: str, jobs: int | None = None
+) -> int:
+    """answers of disjoint chunks are combined by the day's CHUNK_REDUCERS,
+    other phases consume a single stream"""
+    module = days.load(year, day)
+    combine = getattr(module, "CHUNK_REDUCERS", {}).get(phase)
+    if combine is None or jobs == 1:
+        solver = getattr(module, runner.PHASES[phase])
+        return solver(module.stream_and_parse(filename))
+
+    jobs = jobs or os.cpu_count()
+    chunks = split_chunks(filename, jobs)
+    with multiprocessing.Pool(min(jobs, len(chunks) or 1)) as pool:
+        partials = pool.map(
+            __solve_chunk,
+            [(year, day, phase, filename, start, end) for start, end in chunks],
+        )
+    return combine(partials)
+
+
+def run_day(
+    year: int, day: int, filename: str = "input.txt", jobs: int | None = None
+) -> Iterable[runner.Timing]:
+    """time both parts, parsing is fused into each pass over the stream"""
+    module = days.load(year, day)
+    path = str(days.find_input(module, filename))
+    for phase in ("part one", "part two"):
+        if not hasattr(module, runner.PHASES[phase]):
+            continue
+        start = time.perf_counter()
+        answer = solve(year, day, phase, path, jobs)
+        yield runner.Timing(day, phase, time.perf_counter() - start, answer)
+
+
+def test():
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as file:
+        file.write("\n".join(["a", "bb", "", "ccc", "dddd"] * 20))
+    try:
+        lines = list(read_lines(file.name))
+        assert len(lines) == 100 and lines[:3] == [b"a", b"bb", b""]
+        for count in (1, 2, 7, 1_000):
+            chunks = split_chunks(file.name, count)
+            assert chunks[0][0] == 0 and chunks[-1][1] == os.path.getsize(file.name)
+            assert [
+                line
+                for start, end in chunks
+                for line in read_lines(file.name, start, end)
+            ] == lines
+    finally:
+        os.unlink(file.name)
+
+    for day in (1, 2, 3, 4, 7, 9):
+        module = days.load(2023, day)
+        path = str(min(days.find_directory(2023, day).glob("example*.txt")))
+        expected = module.solve_part_one(module.read_and_parse(path))
+        assert solve(2023, day, "part one", path, 1) == expected
+        assert solve(2023, day, "part one", path, 2) == expected
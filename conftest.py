@@ -0,0 +1,7 @@
+"""Runs every test from the directory of the file that defines it"""
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def chdir_to_test_file(request, monkeypatch):
+    monkeypatch.chdir(request.path.parent)